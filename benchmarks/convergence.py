@@ -0,0 +1,76 @@
+"""
+Sequential stopping rule shared by the benchmark runners.
+
+A sweep point is repeated until the Student-t confidence interval of its mean
+is narrow enough relative to the mean, within a minimum and maximum number of
+repetitions.  Samples are folded in one at a time (Welford), so a runner can
+decide after every result the tool streams back whether to run again.
+"""
+
+from __future__ import annotations
+
+import math
+from statistics import NormalDist
+from typing import Sequence
+
+
+def t_quantile(df: int, confidence: float = 0.95) -> float:
+    """Two-sided Student-t critical value (exact for df 1-2, Cornish-Fisher beyond)."""
+    p = 1 - (1 - confidence) / 2
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = NormalDist().inv_cdf(p)
+    return (
+        z
+        + (z**3 + z) / (4 * df)
+        + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * df**2)
+        + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * df**3)
+    )
+
+
+class RunningMean:
+    """Count, mean and M2 of a stream of samples (Welford's algorithm)."""
+
+    def __init__(self, samples: Sequence[float] = ()):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        for x in samples:
+            self.add(x)
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def std(self) -> float:
+        """Sample standard deviation (NaN below two samples)."""
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else math.nan
+
+    def rel_ci_width(self, confidence: float = 0.95) -> float:
+        """Full width of the CI of the mean divided by |mean| (inf if undefined)."""
+        if self.n < 2 or self.mean == 0:
+            return math.inf
+        half = t_quantile(self.n - 1, confidence) * self.std() / math.sqrt(self.n)
+        return 2 * half / abs(self.mean)
+
+
+def converged(
+    stats: RunningMean, rel_width: float, min_runs: int, max_runs: int, confidence: float = 0.95
+) -> bool:
+    """
+    Whether a point needs no further repetitions.
+
+    Parameters:
+        stats      -- samples of the point so far
+        rel_width  -- target full CI width relative to the mean (e.g. 0.05)
+        min_runs   -- repetitions always made
+        max_runs   -- repetitions never exceeded
+        confidence -- CI coverage (default 0.95)
+    """
+    if stats.n >= max_runs:
+        return True
+    return stats.n >= min_runs and stats.rel_ci_width(confidence) <= rel_width
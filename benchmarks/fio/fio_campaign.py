@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Generate fio job files from a campaign description and run the campaign.
+
+A campaign (campaign.json next to its job/ directory) lists fio options;
+every option given as a list is a matrix axis, and the job files are the
+cartesian product, each with one stonewalled [bs_*] section per block size:
+
+    {
+      "options": {"filename": "/global/D2/ffile", "ioengine": "libaio",
+                  "direct": 0, "rw": ["read", "randread", "write", "randwrite"],
+                  "time_based": true, "runtime": 16, "iodepth": 1,
+                  "size": "8G", "group_reporting": true},
+      "bs":      ["1k", "2k", ..., "16M"],
+      "job":     "{pattern}",               job file name (job/<name>.fio)
+      "result":  "{pattern}_{tag}",         result name, relative to "results"
+      "results": "results",
+      "target":  "{filename}",              jobs on different targets may overlap
+      "runs":    [1, 1], "rel_ci": 0.05,    repetitions per block size (optional)
+      "metric":  "bw",                      "bw" or "lat", for runs and refine
+      "refine":  0                          extra block sizes at knees (optional)
+    }
+
+Name templates see every option plus `pattern` (read_seq, write_rand, ...);
+result and target templates also see `tag` (the interconnect under test, given
+on the command line), so the results land where the plot catalog classifies
+them.
+
+Running executes every block size of a job as its own fio invocation and keeps
+the raw output under <results>/.campaign/, keyed by a hash of the exact job
+text.  An interrupted or partly failed campaign therefore resumes where it
+stopped, and a changed campaign never reuses stale points.  Jobs on different
+targets run concurrently (--jobs); jobs sharing a target run one at a time.
+With "runs" each block size is repeated until the confidence interval of the
+metric is narrow enough (benchmarks/convergence.py), and "refine" adds block
+sizes where the curve bends most (benchmarks/refine.py).  Each job's results
+are then merged into one fio JSON document, one job entry per block size.
+
+Usage:
+    python3 fio_campaign.py generate ex3/direct/campaign.json
+    python3 fio_campaign.py run ex3/direct/campaign.json dis [--jobs 4] [--fio CMD]
+
+fake_fio (next to this script) stands in for fio with --fio ./fake_fio;
+tests/test_fio_campaign.py runs campaigns against it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Sequence, Union
+
+FIO_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(FIO_DIR.parent))
+sys.path.insert(0, str(FIO_DIR.parent.parent / "plot"))
+
+from convergence import RunningMean, converged
+from refine import refine_sizes
+
+import catalog
+
+STATE_DIR = ".campaign"
+
+# fio rw= values -> access pattern used in result names (see catalog.FIO_RW)
+FIO_RW = catalog.FIO_RW
+# fio rw= values -> result block holding their metrics
+RW_DIRECTION = {"read": "read", "randread": "read", "write": "write", "randwrite": "write"}
+
+DEFAULTS = {
+    "job": "{pattern}",
+    "result": "{pattern}_{tag}",
+    "results": "results",
+    "target": "{filename}",
+    "runs": [1, 1],
+    "rel_ci": 0.05,
+    "metric": "bw",
+    "refine": 0,
+}
+
+
+def load_campaign(path: Path) -> dict:
+    """Read a campaign.json, filling in the defaults; "dir" is its directory."""
+    path = Path(path).resolve()
+    campaign = {**DEFAULTS, **json.loads(path.read_text())}
+    campaign["dir"] = path.parent
+    return campaign
+
+
+def expand(campaign: dict) -> List[dict]:
+    """
+    Expand the option matrix into one entry per job file.
+
+    Returns:
+        list of {"name", "options", "fields"} in matrix order; fields are the
+        values the name templates are formatted with (plus "tag" when run)
+    """
+    options = campaign["options"]
+    axes = [key for key, value in options.items() if isinstance(value, list)]
+    jobs = []
+    for combo in itertools.product(*(options[key] for key in axes)):
+        opts = {**options, **dict(zip(axes, combo))}
+        fields = {**opts, "pattern": FIO_RW.get(opts.get("rw"), opts.get("rw"))}
+        jobs.append({"name": campaign["job"].format(**fields), "options": opts, "fields": fields})
+
+    names = [job["name"] for job in jobs]
+    if len(set(names)) != len(names):
+        raise ValueError(f"job name template '{campaign['job']}' does not tell the matrix points apart")
+    return jobs
+
+
+def bs_label(size: int) -> str:
+    """fio block-size spelling of `size` bytes: '4k', '16M', or plain bytes."""
+    for suffix, factor in (("M", 2**20), ("k", 2**10)):
+        if size >= factor and size % factor == 0:
+            return f"{size // factor}{suffix}"
+    return str(size)
+
+
+def bs_bytes(label: str) -> int:
+    value, unit = (label[:-1], label[-1].lower()) if label[-1].isalpha() else (label, "")
+    return int(value) * {"": 1, "k": 2**10, "m": 2**20, "g": 2**30}[unit]
+
+
+def format_options(options: dict) -> List[str]:
+    """Job-file lines for `options`: True is a bare flag, False leaves it out."""
+    lines = []
+    for key, value in options.items():
+        if value is True:
+            lines.append(key)
+        elif value is not False:
+            lines.append(f"{key}={value}")
+    return lines
+
+
+def format_job_file(options: dict, sizes: Sequence[str]) -> str:
+    """Text of a job file: [global] options and one stonewalled section per block size."""
+    lines = ["[global]", *format_options(options)]
+    for label in sizes:
+        lines += ["", f"[bs_{label}]", f"bs={label}", "stonewall"]
+    return "\n".join(lines) + "\n"
+
+
+def generate(campaign: dict) -> List[Path]:
+    """Write job/<name>.fio for every matrix point; returns the paths."""
+    job_dir = campaign["dir"] / "job"
+    job_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for job in expand(campaign):
+        path = job_dir / f"{job['name']}.fio"
+        path.write_text(format_job_file(job["options"], campaign["bs"]))
+        paths.append(path)
+    return paths
+
+
+# Running
+def _atomic_json(path: Path, doc: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(doc, indent=2))
+    os.replace(tmp, path)
+
+
+def run_point(fio: List[str], job_text: str, out: Path, retries: int = 1) -> Union[dict, None]:
+    """
+    Run one single-section job file with fio (JSON output) and keep the result.
+
+    Returns:
+        the fio JSON document, or None if every attempt failed
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        job_file, result = Path(tmp) / "point.fio", Path(tmp) / "result.json"
+        job_file.write_text(job_text)
+        for _ in range(retries + 1):
+            proc = subprocess.run(
+                [*fio, "--output-format=json", f"--output={result}", str(job_file)],
+                capture_output=True, text=True,
+            )
+            try:
+                doc = json.loads(result.read_text())
+            except (OSError, ValueError):
+                doc = None
+            if proc.returncode == 0 and doc and doc.get("jobs"):
+                _atomic_json(out, doc)
+                return doc
+            print(f"  fio failed ({proc.returncode}): {proc.stderr.strip()[-300:]}", file=sys.stderr)
+    return None
+
+
+def point_metric(doc: dict, rw: str, metric: str) -> float:
+    """Bandwidth (KiB/s) or mean completion latency (ns) of a single-job result."""
+    block = doc["jobs"][0][RW_DIRECTION.get(rw, "read")]
+    return float(block["bw"]) if metric == "bw" else float(block["clat_ns"]["mean"])
+
+
+def run_job(campaign: dict, job: dict, tag: str, fio: List[str], retries: int = 1) -> int:
+    """
+    Measure every block size of one job (resuming from earlier points) and
+    write its merged result.
+
+    Returns:
+        number of block sizes without a result
+    """
+    fields = {**job["fields"], "tag": tag}
+    results_dir = campaign["dir"] / campaign["results"]
+    state = results_dir / STATE_DIR / campaign["result"].format(**fields)
+    rw = job["options"].get("rw", "read")
+    min_runs, max_runs = campaign["runs"]
+    points: Dict[int, List[dict]] = {}
+
+    def measure(size: int) -> None:
+        label = bs_label(size)
+        text = format_job_file(job["options"], [label])
+        key = hashlib.sha1(text.encode()).hexdigest()[:12]
+        docs, stats = [], RunningMean()
+        for rep in range(max_runs):
+            out = state / f"bs_{label}.{key}.{rep}.json"
+            try:
+                doc = json.loads(out.read_text())
+            except (OSError, ValueError):
+                if converged(stats, campaign["rel_ci"], min_runs, max_runs):
+                    break
+                start = time.perf_counter()
+                doc = run_point(fio, text, out, retries)
+                print(f"[{job['name']}] bs={label} run {rep}: "
+                      f"{'failed' if doc is None else 'ok'} ({time.perf_counter() - start:.1f} s)")
+                if doc is None:
+                    continue
+            docs.append(doc)
+            stats.add(point_metric(doc, rw, campaign["metric"]))
+        points[size] = docs
+
+    for label in campaign["bs"]:
+        measure(bs_bytes(label))
+
+    for _ in range(campaign["refine"]):
+        measured = sorted(size for size, docs in points.items() if docs)
+        means = [[median(point_metric(d, rw, campaign["metric"]) for d in points[s]) for s in measured]]
+        # Direct I/O needs sector-aligned block sizes
+        new = refine_sizes(measured, means, align=512)
+        if not new:
+            break
+        measure(new[0])
+
+    jobs = []
+    for size, docs in sorted(points.items()):
+        if not docs:
+            continue
+        # The repetition with the median metric stands for the block size
+        docs = sorted(docs, key=lambda d: point_metric(d, rw, campaign["metric"]))
+        entry = dict(docs[(len(docs) - 1) // 2]["jobs"][0])
+        entry["jobname"] = f"bs_{bs_label(size)}"
+        entry["job options"] = {**entry.get("job options", {}), "bs": bs_label(size)}
+        if len(docs) > 1:
+            values = RunningMean(point_metric(d, rw, campaign["metric"]) for d in docs)
+            entry["campaign"] = {
+                "runs": values.n, "metric": campaign["metric"],
+                "mean": values.mean, "rel_ci": values.rel_ci_width(),
+            }
+        jobs.append(entry)
+
+    if jobs:
+        first = next(docs[0] for docs in points.values() if docs)
+        merged = {key: first[key] for key in ("fio version", "timestamp", "timestamp_ms", "time") if key in first}
+        merged["global options"] = {k: str(v) for k, v in job["options"].items() if v is not False and v is not True}
+        merged["jobs"] = jobs
+        result = results_dir / f"{campaign['result'].format(**fields)}.json"
+        _atomic_json(result, merged)
+        print(f"[{job['name']}] wrote {result}")
+    return sum(not docs for docs in points.values())
+
+
+def run_campaign(campaign: dict, tag: str, fio: List[str], jobs: int = 1, retries: int = 1) -> int:
+    """
+    Run every job of the campaign, jobs on distinct targets concurrently.
+
+    Returns:
+        number of block sizes without a result, over all jobs
+    """
+    results = [campaign["result"].format(**job["fields"], tag=tag) for job in expand(campaign)]
+    if len(set(results)) != len(results):
+        raise ValueError(f"result name template '{campaign['result']}' does not tell the jobs apart")
+
+    groups: Dict[str, List[dict]] = {}
+    for job in expand(campaign):
+        groups.setdefault(campaign["target"].format(**job["fields"], tag=tag), []).append(job)
+
+    def run_group(group: List[dict]) -> int:
+        return sum(run_job(campaign, job, tag, fio, retries) for job in group)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        failed = sum(pool.map(run_group, groups.values()))
+
+    updated, _ = catalog.scan()
+    print(f"Catalog: {updated} result(s) indexed")
+    return failed
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="fio job-file generator and campaign runner.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    gen = sub.add_parser("generate", help="write job/<name>.fio for every matrix point")
+    gen.add_argument("campaign", type=Path)
+    run = sub.add_parser("run", help="run (or resume) the campaign")
+    run.add_argument("campaign", type=Path)
+    run.add_argument("tag", help="interconnect under test, used in result names (e.g. dis)")
+    run.add_argument("-j", "--jobs", type=int, default=1, help="targets measured concurrently (default 1)")
+    run.add_argument("--fio", default="fio", help="fio command (e.g. a local stand-in)")
+    run.add_argument("--retries", type=int, default=1, help="extra attempts per fio run (default 1)")
+    args = parser.parse_args(argv)
+
+    campaign = load_campaign(args.campaign)
+    if args.command == "generate":
+        for path in generate(campaign):
+            print(f"Wrote {path}")
+        return 0
+
+    failed = run_campaign(campaign, args.tag, shlex.split(args.fio), args.jobs, args.retries)
+    if failed:
+        print(f"{failed} block size(s) without a result; run again to resume", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Multi-client scale-out benchmark: N concurrent fio clients, swept over N and iodepth.
+
+A scale-out description (scaleout.json) uses the campaign option matrix of
+fio_campaign.py -- list-valued options such as rw and iodepth are axes -- plus
+the client counts and scaling modes to sweep:
+
+    {
+      "options":  {"directory": "/global/D2/scaleout", "ioengine": "libaio",
+                   "direct": 1, "rw": ["write", "read"], "bs": "1M",
+                   "time_based": true, "runtime": 16, "size": "8G",
+                   "iodepth": [1, 4, 16]},
+      "clients":  [1, 2, 4, 8, 16],
+      "scaling":  ["strong", "weak"],
+      "hosts":    ["node1", "node2", ...],   optional: one fio server per client
+      "result":   "{io_mode}/{scaling}/{pattern}_{tag}",
+      "results":  ".",
+      "runs":     [1, 1], "rel_ci": 0.05, "metric": "bw"
+    }
+
+With strong scaling the total work is fixed: "size" is split evenly between
+the clients, each transfers its share once (time_based and runtime are
+dropped), and the aggregate bandwidth is the total data over the time the last
+client needed.  With weak scaling every client gets "size" of its own and runs
+for the configured time; the aggregate bandwidth is the sum over the clients.
+Without hosts
+the N clients are local fio processes started together, each on its own files
+in "directory" (a tmpfs directory makes a quick local test); with hosts the
+first N run the job through `fio --client` (start `fio --server` on them
+first), and fio's unique_filename keeps their files apart on a shared mount.
+
+Result names see the campaign fields plus `scaling`, `tag` and `io_mode`
+(direct or buffered, from the direct option), which the plot catalog reads
+from the path since the CSVs carry no fio header.
+
+Every repetition of a point keeps its per-client results in fio's client/server
+layout ("client_stats") under <results>/.campaign/, keyed by a hash of the job
+text, so an interrupted sweep resumes where it stopped.  Points are repeated
+until the aggregate metric converges (benchmarks/convergence.py).  Each result
+is a CSV with one row per (iodepth, clients): aggregate bandwidth and IOPS (as
+above), mean completion latency (weighted by each client's I/O count) and the
+worst client's 99th percentile, since percentiles of different clients cannot
+be merged.  plot/plot_fio_scaleout.py draws them.
+
+Usage:
+    python3 fio_scaleout.py run ex3/scaleout/scaleout.json ssocks
+    python3 fio_scaleout.py run ex3/scaleout/scaleout.json local \\
+        --directory /dev/shm/scaleout --results /tmp/scaleout --runtime 2 [--fio ./fake_fio]
+
+tests/test_fio_scaleout.py sweeps local and --client runs of fake_fio on tmpfs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import math
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Union
+
+from fio_campaign import (
+    RW_DIRECTION,
+    STATE_DIR,
+    RunningMean,
+    _atomic_json,
+    bs_bytes,
+    bs_label,
+    catalog,
+    converged,
+    expand,
+    format_options,
+)
+
+DEFAULTS = {
+    "job": "{pattern}_qd{iodepth}",
+    "result": "{io_mode}/{scaling}/{pattern}_{tag}",
+    "results": ".",
+    "clients": [1],
+    "scaling": ["strong", "weak"],
+    "hosts": None,
+    "runs": [1, 1],
+    "rel_ci": 0.05,
+    "metric": "bw",
+}
+SCALING = ("strong", "weak")
+
+# Result columns; units in brackets as the plot loaders expect them
+COLUMNS = ("clients", "iodepth", "runs", "bw[KiB/s]", "bw_std[KiB/s]", "iops",
+           "lat_mean[usec]", "lat_p99[usec]")
+CSV_MISSING = "N/A"
+
+# Entry fio adds to client_stats with the sum over all clients
+ALL_CLIENTS = "All clients"
+
+
+def load_scaleout(path: Path) -> dict:
+    """Read a scaleout.json, filling in the defaults; "dir" is its directory."""
+    path = Path(path).resolve()
+    config = {**DEFAULTS, **json.loads(path.read_text())}
+    config["dir"] = path.parent
+    unknown = set(config["scaling"]) - set(SCALING)
+    if unknown:
+        raise ValueError(f"unknown scaling mode(s) {sorted(unknown)}, expected {SCALING}")
+    if "iodepth" not in config["options"]:
+        config["options"]["iodepth"] = 1
+    return config
+
+
+def client_size(options: dict, clients: int, scaling: str) -> str:
+    """Per-client size: the whole "size" (weak) or an even, bs-aligned share (strong)."""
+    if scaling == "weak":
+        return str(options["size"])
+    bs = bs_bytes(str(options.get("bs", "4k")))
+    share = bs_bytes(str(options["size"])) // clients // bs * bs
+    if share == 0:
+        raise ValueError(f"size {options['size']} leaves less than one block per client at {clients} clients")
+    return bs_label(share)
+
+
+def client_options(options: dict, clients: int, scaling: str) -> dict:
+    """
+    Job options every client runs: unchanged for weak scaling; for strong
+    scaling a share of "size" (see client_size), transferred once instead of
+    for a fixed time, so the total work does not grow with the clients.
+    """
+    if scaling == "weak":
+        return dict(options)
+    options = {key: value for key, value in options.items() if key not in ("time_based", "runtime")}
+    return {**options, "size": client_size(options, clients, scaling)}
+
+
+def io_mode(options: dict) -> str:
+    """"direct" or "buffered", as the catalog names the I/O modes."""
+    return "direct" if str(options.get("direct", 0)).lower() in ("1", "true") else "buffered"
+
+
+def format_client_job(options: dict, name: str) -> str:
+    """Text of a single-job file: [global] options and one [name] section."""
+    return "\n".join(["[global]", *format_options(options), "", f"[{name}]"]) + "\n"
+
+
+# Running
+def run_local(fio: List[str], job_texts: List[str], out: Path, retries: int = 1) -> Union[dict, None]:
+    """
+    Start one local fio process per job text at once and wait for all of them.
+
+    Returns:
+        the per-client results in fio's client/server layout, or None if every
+        attempt had a failing client
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for i, text in enumerate(job_texts):
+            (tmp / f"client{i}.fio").write_text(text)
+        for _ in range(retries + 1):
+            procs = []
+            for i in range(len(job_texts)):
+                with open(tmp / f"client{i}.err", "w") as err:
+                    procs.append(subprocess.Popen(
+                        [*fio, "--output-format=json", f"--output={tmp / f'client{i}.json'}",
+                         str(tmp / f"client{i}.fio")],
+                        stdout=subprocess.DEVNULL, stderr=err,
+                    ))
+            codes = [proc.wait() for proc in procs]
+
+            docs = []
+            for i, code in enumerate(codes):
+                try:
+                    doc = json.loads((tmp / f"client{i}.json").read_text())
+                except (OSError, ValueError):
+                    doc = None
+                if code != 0 or not doc or not doc.get("jobs"):
+                    error = (tmp / f"client{i}.err").read_text().strip()[-300:]
+                    print(f"  client {i}: fio failed ({code}): {error}", file=sys.stderr)
+                    break
+                docs.append(doc)
+            else:
+                merged = {key: docs[0][key] for key in ("fio version", "timestamp", "timestamp_ms", "time")
+                          if key in docs[0]}
+                merged["global options"] = docs[0].get("global options", {})
+                merged["client_stats"] = [
+                    {**doc["jobs"][0], "hostname": f"local{i}"} for i, doc in enumerate(docs)
+                ]
+                _atomic_json(out, merged)
+                return merged
+    return None
+
+
+def run_remote(
+    fio: List[str], hosts: List[str], job_text: str, out: Path, retries: int = 1
+) -> Union[dict, None]:
+    """
+    Run one job file on every host through `fio --client` (fio --server must be
+    running there).
+
+    Returns:
+        fio's JSON document (per-client entries in "client_stats"), or None if
+        every attempt failed
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        host_file, job_file, result = Path(tmp) / "hosts", Path(tmp) / "point.fio", Path(tmp) / "result.json"
+        host_file.write_text("\n".join(hosts) + "\n")
+        job_file.write_text(job_text)
+        for _ in range(retries + 1):
+            proc = subprocess.run(
+                [*fio, f"--client={host_file}", "--output-format=json", f"--output={result}", str(job_file)],
+                capture_output=True, text=True,
+            )
+            try:
+                doc = json.loads(result.read_text())
+            except (OSError, ValueError):
+                doc = None
+            if proc.returncode == 0 and doc and len(client_stats(doc)) == len(hosts):
+                _atomic_json(out, doc)
+                return doc
+            print(f"  fio failed ({proc.returncode}): {proc.stderr.strip()[-300:]}", file=sys.stderr)
+    return None
+
+
+def client_stats(doc: dict) -> List[dict]:
+    """Per-client job entries of a client/server result (fio's own total left out)."""
+    return [job for job in doc.get("client_stats", []) if job.get("jobname") != ALL_CLIENTS]
+
+
+def aggregate(doc: dict, rw: str, scaling: str = "weak") -> Dict[str, float]:
+    """
+    Combine the clients of one repetition.
+
+    Returns:
+        {"bw": KiB/s, "iops", "lat_mean": usec, "lat_p99": usec} -- bandwidth
+        and IOPS summed over the clients (weak) or the total data and I/Os over
+        the slowest client's runtime (strong), mean latency weighted by each
+        client's I/O count, and the largest per-client 99th percentile (NaN if
+        fio reported none)
+    """
+    blocks = [job[RW_DIRECTION.get(rw, "read")] for job in client_stats(doc)]
+    weights = [block.get("total_ios") or block["iops"] for block in blocks]
+    p99 = [block["clat_ns"].get("percentile", {}).get("99.000000") for block in blocks]
+    p99 = [value for value in p99 if value is not None]
+    if scaling == "strong":
+        # The fixed amount of work is done when the last client finishes
+        seconds = max(float(block["runtime"]) for block in blocks) / 1e3 or math.nan
+        bw = sum(float(block["io_kbytes"]) for block in blocks) / seconds
+        iops = sum(float(block["total_ios"]) for block in blocks) / seconds
+    else:
+        bw = sum(float(block["bw"]) for block in blocks)
+        iops = sum(float(block["iops"]) for block in blocks)
+    return {
+        "bw": bw,
+        "iops": iops,
+        "lat_mean": sum(w * block["clat_ns"]["mean"] for w, block in zip(weights, blocks))
+                    / sum(weights) / 1e3,
+        "lat_p99": max(p99) / 1e3 if p99 else math.nan,
+    }
+
+
+def run_point(
+    config: dict, job: dict, scaling: str, clients: int, state: Path,
+    fio: List[str], hosts: Union[List[str], None], retries: int = 1,
+) -> Union[dict, None]:
+    """
+    Measure one (job, scaling, clients) point, resuming from earlier repetitions.
+
+    Returns:
+        the result row (see COLUMNS), or None if no repetition succeeded
+    """
+    options = client_options(job["options"], clients, scaling)
+    rw = options.get("rw", "read")
+    if hosts:
+        texts = [format_client_job(options, "scaleout")]
+        ident = "\n".join(hosts[:clients] + texts)
+    else:
+        texts = [format_client_job(options, f"client{i}") for i in range(clients)]
+        ident = "\n".join(texts)
+    key = hashlib.sha1(ident.encode()).hexdigest()[:12]
+    label = f"c{clients}_qd{options['iodepth']}"
+
+    min_runs, max_runs = config["runs"]
+    values, stats = [], RunningMean()
+    for rep in range(max_runs):
+        out = state / f"{label}.{key}.{rep}.json"
+        try:
+            doc = json.loads(out.read_text())
+        except (OSError, ValueError):
+            if converged(stats, config["rel_ci"], min_runs, max_runs):
+                break
+            start = time.perf_counter()
+            if hosts:
+                doc = run_remote(fio, hosts[:clients], texts[0], out, retries)
+            else:
+                doc = run_local(fio, texts, out, retries)
+            print(f"[{job['name']} {scaling}] {clients} client(s) run {rep}: "
+                  f"{'failed' if doc is None else 'ok'} ({time.perf_counter() - start:.1f} s)")
+            if doc is None:
+                continue
+        values.append(aggregate(doc, rw, scaling))
+        stats.add(values[-1]["bw" if config["metric"] == "bw" else "lat_mean"])
+
+    if not values:
+        return None
+    bw = RunningMean(value["bw"] for value in values)
+    return {
+        "clients": clients,
+        "iodepth": options["iodepth"],
+        "runs": len(values),
+        "bw[KiB/s]": bw.mean,
+        "bw_std[KiB/s]": bw.std(),
+        "iops": sum(value["iops"] for value in values) / len(values),
+        "lat_mean[usec]": sum(value["lat_mean"] for value in values) / len(values),
+        "lat_p99[usec]": sum(value["lat_p99"] for value in values) / len(values),
+    }
+
+
+def write_rows(path: Path, rows: List[dict]) -> None:
+    """Write result rows as CSV (sorted by iodepth, then clients; NaN as N/A)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with tmp.open("w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(COLUMNS)
+        for row in sorted(rows, key=lambda r: (r["iodepth"], r["clients"])):
+            writer.writerow([
+                CSV_MISSING if isinstance(row[c], float) and math.isnan(row[c])
+                else f"{row[c]:.6g}" if isinstance(row[c], float) else row[c]
+                for c in COLUMNS
+            ])
+    os.replace(tmp, path)
+
+
+def run_scaleout(
+    config: dict, tag: str, fio: List[str], hosts: List[str] = None, retries: int = 1
+) -> int:
+    """
+    Sweep every job of the matrix over the scaling modes and client counts.
+
+    Returns:
+        number of points without a result
+    """
+    hosts = hosts or config["hosts"]
+    if hosts and len(hosts) < max(config["clients"]):
+        raise ValueError(f"{len(hosts)} host(s) for up to {max(config['clients'])} clients")
+
+    results_dir = config["dir"] / config["results"]
+    plan: Dict[str, List[tuple]] = {}
+    for scaling in config["scaling"]:
+        for job in expand(config):
+            result = config["result"].format(
+                **job["fields"], scaling=scaling, tag=tag, io_mode=io_mode(job["options"]))
+            plan.setdefault(result, []).append((scaling, job))
+    for result, points in plan.items():
+        depths = [job["options"]["iodepth"] for _, job in points]
+        if len(set(depths)) != len(depths):
+            raise ValueError(f"result name template '{config['result']}' does not tell the jobs apart")
+
+    if not hosts:
+        directory = config["options"].get("directory")
+        if directory:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+
+    failed = 0
+    for result, points in plan.items():
+        rows = []
+        for scaling, job in points:
+            for clients in config["clients"]:
+                row = run_point(config, job, scaling, clients, results_dir / STATE_DIR / result,
+                                fio, hosts, retries)
+                if row is None:
+                    failed += 1
+                else:
+                    rows.append(row)
+        if rows:
+            path = results_dir / f"{result}.csv"
+            write_rows(path, rows)
+            print(f"Wrote {path}")
+
+    updated, _ = catalog.scan()
+    print(f"Catalog: {updated} result(s) indexed")
+    return failed
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Multi-client fio scale-out sweep.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("run", help="run (or resume) the sweep")
+    run.add_argument("config", type=Path, help="scaleout.json")
+    run.add_argument("tag", help="interconnect under test, used in result names (e.g. ssocks)")
+    run.add_argument("--hosts", type=Path, help="file with one fio server per line (default: local clients)")
+    run.add_argument("--directory", help="override the test directory (e.g. a tmpfs path)")
+    run.add_argument("--results", type=Path, help="override the results directory")
+    run.add_argument("--runtime", type=int, help="override the runtime of every weak-scaling run [s]")
+    run.add_argument("--fio", default="fio", help="fio command (e.g. a local stand-in)")
+    run.add_argument("--retries", type=int, default=1, help="extra attempts per point (default 1)")
+    args = parser.parse_args(argv)
+
+    config = load_scaleout(args.config)
+    if args.directory:
+        config["options"]["directory"] = args.directory
+    if args.runtime:
+        config["options"]["runtime"] = args.runtime
+    if args.results:
+        config["results"] = args.results.resolve()
+    hosts = args.hosts.read_text().split() if args.hosts else None
+
+    failed = run_scaleout(config, args.tag, shlex.split(args.fio), hosts, args.retries)
+    if failed:
+        print(f"{failed} point(s) without a result; run again to resume", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Message-size sweep with qperf over one transport, written as a run CSV.
+
+One qperf client is started per message size (all tests at once), with a
+timeout and a few retries per point, so a hung or failed point costs one
+point instead of the whole sweep.  The output is parsed in-process and the
+run CSV is rewritten as soon as a point is measured; --resume re-measures only
+the sizes an earlier, interrupted or partly failed run is missing.
+
+With --runs MIN:MAX each point is repeated until the confidence interval of
+every test's mean is narrower than --rel-ci of the mean (see convergence.py),
+at least MIN and at most MAX times.  Repetition i goes to OUTFILE with {run}
+replaced by i, so a converged point is N/A in the later run files -- the plot
+loaders and stats_2d skip those.  Stable large-message points then stop after
+MIN repetitions instead of taking a full sweep each.
+
+With --refine N, up to N extra sizes are measured after the grid, each in the
+segment where the log-log curves of the tests bend most (refine.py), so knees
+like the SuperSockets PIO/RDMA switch are located without a finer grid
+everywhere.  The rows stay sorted by size; the loaders place values by size.
+
+Usage:
+    python3 qperf_sweep.py TRANSPORT OUTFILE [options]
+    python3 qperf_sweep.py ib ex3/run8.csv
+    python3 qperf_sweep.py eth run0.csv --host 127.0.0.1 --qperf ./fake_qperf
+    python3 qperf_sweep.py dis 'ex3/run{run}.csv' --runs 3:10 --rel-ci 0.05
+    python3 qperf_sweep.py ssocks 'ex3/run{run}.csv' --runs 3:10 --refine 8
+
+fake_qperf (next to this script) stands in for the qperf client when no
+server is at hand; tests/test_qperf_sweep.py runs the sweep against it.
+
+OUTFILE is relative to the transport's directory (e.g. qperf/ib/).  The CSV
+matches what the plot loaders read: message_size followed by one column per
+test, bandwidth in MB/s and latency in us, N/A for points that failed.
+
+Server side, per transport (see TRANSPORTS):
+    numactl --cpunodebind=1 qperf -lp 18515                  eth, dis
+    numactl --cpunodebind=1 qperf -cm1 -lp 18515             ib
+    numactl --cpunodebind=1 /opt/DIS/bin/dis_ssocks_run qperf -lp 18515   ssocks
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import re
+import shlex
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence, Union
+
+SWEEP_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SWEEP_DIR.parent))
+
+from convergence import RunningMean, converged
+from refine import refine_sizes
+
+PORT = 18515
+CSV_MISSING = "N/A"
+
+# Host, tests and client command of each interconnect; the wrapper is put in
+# front of the qperf command line and the options after it
+TRANSPORTS = {
+    "eth": {"host": "172.16.3.118", "tests": ["tcp_bw", "tcp_lat"], "wrapper": [], "options": []},
+    "dis": {"host": "192.168.4.8", "tests": ["tcp_bw", "tcp_lat"], "wrapper": [], "options": []},
+    "ssocks": {
+        "host": "172.16.3.118",
+        "tests": ["tcp_bw", "tcp_lat"],
+        "wrapper": ["/opt/DIS/bin/dis_ssocks_run"],
+        "options": [],
+    },
+    "ib": {
+        "host": "10.128.3.16",
+        "tests": ["rc_bw", "rc_lat"],
+        "wrapper": ["numactl", "--cpunodebind=1"],
+        "options": ["-cm1"],
+    },
+}
+
+# qperf result units -> (factor, CSV unit); bandwidth is stored in MB/s and
+# latency in us, as the original sweep scripts did
+UNIT_FACTORS = {
+    "bytes/sec": (1e-6, "MB/s"), "KB/sec": (1e-3, "MB/s"),
+    "MB/sec": (1.0, "MB/s"), "GB/sec": (1e3, "MB/s"),
+    "ns": (1e-3, "us"), "us": (1.0, "us"), "ms": (1e3, "us"), "sec": (1e6, "us"),
+}
+
+_RESULT = re.compile(r"^\s*\S+\s*=\s*([-+0-9.eE]+)\s*(\S+)")
+
+
+def parse_qperf(output: str) -> Dict[str, float]:
+    """
+    Extract the first result of every test block in qperf's output.
+
+    qperf prints each test as its name followed by indented `metric = value
+    unit` lines, e.g. "tcp_bw:" / "    bw  =  1.17 GB/sec".
+
+    Returns:
+        dict test -> value in MB/s (bandwidth) or us (latency); tests whose
+        result is missing or in an unknown unit are left out
+    """
+    results = {}
+    test = None
+    for line in output.splitlines():
+        if line and not line[0].isspace() and line.rstrip().endswith(":"):
+            test = line.strip()[:-1]
+            continue
+        m = _RESULT.match(line)
+        if test is not None and m and m.group(2) in UNIT_FACTORS:
+            results[test] = float(m.group(1)) * UNIT_FACTORS[m.group(2)][0]
+            test = None  # only the first metric, like the awk `getline`
+    return results
+
+
+def measure(cmd: List[str], tests: Sequence[str], timeout: float, retries: int) -> Dict[str, float]:
+    """
+    Run one qperf client, retrying until every test produced a value.
+
+    Returns:
+        dict test -> value for the tests that succeeded (possibly partial
+        after the last attempt)
+    """
+    best = {}
+    for attempt in range(retries + 1):
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+            values = parse_qperf(result.stdout)
+            error = result.stderr.strip() or f"exit code {result.returncode}"
+        except subprocess.TimeoutExpired:
+            values, error = {}, f"timed out after {timeout:g} s"
+        except OSError as e:
+            values, error = {}, str(e)
+        best.update(values)
+        if all(test in best for test in tests):
+            return best
+        missing = [test for test in tests if test not in best]
+        print(f"  attempt {attempt + 1}/{retries + 1}: no result for {missing} ({error})", file=sys.stderr)
+    return best
+
+
+def read_rows(out_file: Path, tests: Sequence[str]) -> Dict[int, List[str]]:
+    """Value fields of an earlier run CSV with the same tests, by message size."""
+    try:
+        with out_file.open(newline="") as fh:
+            rows = list(csv.reader(fh))
+    except OSError:
+        return {}
+    if not rows or rows[0] != ["message_size", *tests]:
+        return {}
+    return {int(row[0]): row[1:] for row in rows[1:] if len(row) == len(tests) + 1}
+
+
+def sweep(
+    out_file: Union[Path, str],
+    host: str,
+    tests: Sequence[str],
+    sizes: Sequence[int],
+    qperf: Union[str, List[str]] = "qperf",
+    wrapper: Sequence[str] = (),
+    options: Sequence[str] = (),
+    port: int = PORT,
+    timeout: float = 60.0,
+    retries: int = 2,
+    resume: bool = False,
+    min_runs: int = 1,
+    max_runs: int = 1,
+    rel_width: float = 0.05,
+    confidence: float = 0.95,
+    refine: int = 0,
+) -> int:
+    """
+    Measure every size and write the run CSV(s).
+
+    Parameters:
+        out_file   -- CSV to write, one row per size in increasing order; with
+                      max_runs > 1 a path containing "{run}"
+        host       -- qperf server
+        tests      -- qperf tests (e.g. ['tcp_bw', 'tcp_lat'])
+        sizes      -- message sizes in bytes
+        qperf      -- qperf executable (or a stand-in), as a path or argv list
+        wrapper    -- command prefix, e.g. ['numactl', '--cpunodebind=1']
+        options    -- extra qperf options, e.g. ['-cm1']
+        port       -- server listen port
+        timeout    -- seconds per qperf run
+        retries    -- extra attempts per run when a test has no result
+        resume     -- keep the values already in the output files; a point is
+                      only repeated until it has converged
+        min_runs   -- repetitions per size always made
+        max_runs   -- repetitions per size at most
+        rel_width  -- stop once every test's CI is this narrow relative to its mean
+        confidence -- CI coverage (default 0.95)
+        refine     -- sizes added after the grid where the curves bend most
+                      (see refine.py), one at a time
+
+    Returns:
+        number of sizes where a test has fewer than min_runs values
+    """
+    if max_runs > 1 and "{run}" not in str(out_file):
+        raise ValueError("out_file needs a {run} placeholder for more than one run")
+    out_files = [Path(str(out_file).replace("{run}", str(run))) for run in range(max_runs)]
+    qperf = shlex.split(qperf) if isinstance(qperf, str) else list(qperf)
+    runs = [read_rows(path, tests) if resume else {} for path in out_files]
+
+    def write_runs() -> None:
+        # Rewritten whole after every point: refined sizes land between
+        # existing rows, and a killed sweep keeps what was measured so far
+        for path, run in zip(out_files, runs):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.tmp")
+            with tmp.open("w", newline="") as fh:
+                writer = csv.writer(fh, lineterminator="\n")
+                writer.writerow(["message_size", *tests])
+                writer.writerows([size, *run[size]] for size in sorted(run))
+            tmp.replace(path)
+
+    def measure_point(size: int) -> List[RunningMean]:
+        """Repeat `size` until converged; returns the statistics per test."""
+        rows = [run.setdefault(size, [CSV_MISSING] * len(tests)) for run in runs]
+        stats = [
+            RunningMean(float(row[i]) for row in rows if row[i] != CSV_MISSING)
+            for i in range(len(tests))
+        ]
+        done = lambda: all(converged(st, rel_width, min_runs, max_runs, confidence) for st in stats)
+
+        pending = [row for row in rows if CSV_MISSING in row]
+        if pending and not done():
+            print(f"Testing message size {size}...")
+            start = time.perf_counter()
+            cmd = [*wrapper, *qperf, *options, "-m", str(size), host, "-lp", str(port), *tests]
+            for row in pending:
+                values = measure(cmd, tests, timeout, retries)
+                for i, test in enumerate(tests):
+                    if test in values and row[i] == CSV_MISSING:
+                        row[i] = f"{values[test]:.2f}"
+                        stats[i].add(float(row[i]))
+                if done():
+                    break
+            summary = ", ".join(
+                f"{st.mean:.2f} +-{st.rel_ci_width(confidence) / 2:.1%}" if st.n > 1 else f"{st.mean:.2f}"
+                for st in stats
+            )
+            print(f"  {summary} ({stats[0].n} run(s), {time.perf_counter() - start:.1f} s)")
+            write_runs()
+        return stats
+
+    # Sizes already in the output files (e.g. refined earlier) are kept
+    points = {size: measure_point(size) for size in sorted(set(sizes).union(*runs))}
+
+    for _ in range(refine):
+        measured = [size for size, stats in sorted(points.items()) if all(st.n for st in stats)]
+        means = [[points[size][i].mean for size in measured] for i in range(len(tests))]
+        new = refine_sizes(measured, means)
+        if not new:
+            break
+        print(f"Refining at {new[0]} bytes")
+        points[new[0]] = measure_point(new[0])
+
+    write_runs()
+    failed = sum(any(st.n < min_runs for st in stats) for stats in points.values())
+    return failed
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="qperf message-size sweep over one transport.")
+    parser.add_argument("transport", choices=sorted(TRANSPORTS))
+    parser.add_argument(
+        "out_file", help="run CSV, relative to the transport's directory ({run} = repetition)")
+    parser.add_argument("--host", help="qperf server (default: the transport's)")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--tests", help="comma-separated qperf tests (default: the transport's)")
+    parser.add_argument(
+        "--sizes", default="2:24",
+        help="log2 size range FIRST:LAST (default 2:24) or comma-separated sizes in bytes",
+    )
+    parser.add_argument("--qperf", default="qperf", help="qperf command (e.g. a local stand-in)")
+    parser.add_argument("--wrapper", help="command prefix, overriding the transport's")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds per size (default 60)")
+    parser.add_argument("--retries", type=int, default=2, help="extra attempts per size (default 2)")
+    parser.add_argument("--resume", action="store_true", help="only measure sizes missing from OUTFILE")
+    parser.add_argument(
+        "--runs", default="1:1",
+        help="MIN:MAX repetitions per size, stopping once the CI converged (default 1:1)",
+    )
+    parser.add_argument(
+        "--rel-ci", type=float, default=0.05,
+        help="target 95%% CI width relative to the mean (default 0.05)",
+    )
+    parser.add_argument(
+        "--refine", type=int, default=0,
+        help="extra sizes to measure where the curves bend most (default 0)",
+    )
+    args = parser.parse_args(argv)
+
+    profile = TRANSPORTS[args.transport]
+    if ":" in args.sizes:
+        first, last = map(int, args.sizes.split(":"))
+        sizes = [2**exp for exp in range(first, last + 1)]
+    else:
+        sizes = [int(size) for size in args.sizes.split(",")]
+    min_runs, max_runs = map(int, args.runs.split(":"))
+
+    failed = sweep(
+        SWEEP_DIR / args.transport / args.out_file,
+        host=args.host or profile["host"],
+        tests=args.tests.split(",") if args.tests else profile["tests"],
+        sizes=sizes,
+        qperf=args.qperf,
+        wrapper=shlex.split(args.wrapper) if args.wrapper is not None else profile["wrapper"],
+        options=profile["options"],
+        port=args.port,
+        timeout=args.timeout,
+        retries=args.retries,
+        resume=args.resume,
+        min_runs=min_runs,
+        max_runs=max_runs,
+        rel_width=args.rel_ci,
+        refine=args.refine,
+    )
+    if failed:
+        print(f"{failed} size(s) incomplete; rerun with --resume to fill them in", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
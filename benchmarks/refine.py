@@ -0,0 +1,78 @@
+"""
+Adaptive refinement of a message-size grid around performance knees.
+
+Sweeps start on a coarse power-of-two grid.  Knees such as the SuperSockets
+switch from PIO to RDMA or the point where the disk takes over show up as a
+change of slope on the log-log curve.  The segments around the largest slope
+change are split at their geometric midpoint, so extra measurements go where
+the curve bends instead of where it is straight.
+"""
+
+from __future__ import annotations
+
+from typing import List, Sequence
+
+import numpy as np
+
+
+def knee_scores(sizes: Sequence[float], values: np.ndarray) -> np.ndarray:
+    """
+    Score every segment between adjacent sizes by how much the curve bends there.
+
+    The score of a segment is the largest change of log-log slope at either of
+    its ends, times its width in log2(size), so a knee in a wide segment ranks
+    above the same knee already bracketed by close sizes.  With several
+    metrics (rows of `values`) each is normalized to its largest score and the
+    maximum is taken.
+
+    Parameters:
+        sizes  -- increasing sizes of the measured points
+        values -- (num_sizes,) or (num_metrics, num_sizes) mean results;
+                  non-positive or NaN values do not contribute
+
+    Returns:
+        (num_sizes - 1,) array of segment scores
+    """
+    x = np.log2(np.asarray(sizes, dtype=float))
+    y = np.atleast_2d(np.asarray(values, dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y = np.where(y > 0, np.log2(y), np.nan)
+        width = np.diff(x)
+        slope = np.diff(y, axis=1) / width
+        bend = np.abs(np.diff(slope, axis=1))  # at every interior point
+        pad = np.full((len(y), 1), np.nan)
+        left = np.concatenate([pad, bend], axis=1)
+        right = np.concatenate([bend, pad], axis=1)
+        score = np.nan_to_num(np.fmax(left, right) * width, nan=0.0, posinf=0.0)
+        # All-zero rows (e.g. a metric without a single valid point) stay zero
+        score = np.nan_to_num(score / score.max(axis=1, keepdims=True), nan=0.0)
+    return score.max(axis=0) if len(score) else np.zeros(len(x) - 1)
+
+
+def refine_sizes(
+    sizes: Sequence[float], values: np.ndarray, count: int = 1, align: int = 1
+) -> List[int]:
+    """
+    Pick up to `count` new sizes in the highest-scoring segments (see knee_scores).
+
+    Parameters:
+        sizes  -- increasing sizes of the measured points
+        values -- mean results at those sizes, one row per metric
+        count  -- number of sizes to add (one per segment)
+        align  -- new sizes are multiples of this (e.g. 512 for direct I/O)
+
+    Returns:
+        new sizes, strictly between the ends of their segment; fewer than
+        `count` when no segment can be split any further
+    """
+    if len(sizes) < 3:
+        return []
+    scores = knee_scores(sizes, values)
+    picked = []
+    for j in np.argsort(-scores, kind="stable"):
+        if len(picked) == count or scores[j] <= 0:
+            break
+        mid = align * round(np.sqrt(sizes[j] * sizes[j + 1]) / align)
+        if sizes[j] < mid < sizes[j + 1]:
+            picked.append(int(mid))
+    return sorted(picked)
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Indexed catalog of the benchmarks/ result tree.
+
+Every result file (*.json, *.csv) under benchmarks/ is classified once from its
+path and, for fio, its JSON header, and recorded in an SQLite index.  Rescans
+only re-classify files whose size or mtime changed.
+
+Usage:
+    python3 catalog.py scan
+    python3 catalog.py find tool=fio cluster=ex3 interconnect=ssocks pattern=write_seq
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+# Locations (override with PLOT_BENCHMARKS_DIR / PLOT_CATALOG_DB)
+BENCHMARKS_DIR = Path(os.environ.get(
+    "PLOT_BENCHMARKS_DIR", Path(__file__).resolve().parent.parent / "benchmarks"))
+CATALOG_DB = Path(os.environ.get(
+    "PLOT_CATALOG_DB", Path(__file__).resolve().parent / ".cache" / "catalog.sqlite"))
+
+RESULT_SUFFIXES = (".json", ".csv")
+# Inputs that share a result suffix (fio_campaign.py / fio_scaleout.py descriptions)
+IGNORED_NAMES = ("campaign.json", "scaleout.json")
+
+# Top-level directory -> tool name
+TOOLS = {
+    "fio": "fio",
+    "qperf": "qperf",
+    "ib": "perftest",
+    "dma_bench": "dma_bench",
+    "scipp": "scipp",
+    "scibench2": "scibench2",
+}
+CLUSTERS = ("ex3", "mpg")
+INTERCONNECTS = ("eth", "dis", "ssocks", "ib", "ipoib")
+IO_MODES = ("buffered", "direct")
+
+# Where runs were taken when the path does not say so
+DEFAULT_CLUSTER = {
+    "qperf": "mpg",     # qperf/<interconnect>/run*.csv
+    "ib": "ex3",        # perftest against the eX3 HDR fabric
+    "fio/old": "ex3",
+}
+# Tools that only run over one interconnect
+DEFAULT_INTERCONNECT = {
+    "ib": "ib",
+    "dma_bench": "dis",
+    "scipp": "dis",
+    "scibench2": "dis",
+}
+# fio rw= values -> access pattern
+FIO_RW = {
+    "read": "read_seq",
+    "randread": "read_rand",
+    "write": "write_seq",
+    "randwrite": "write_rand",
+}
+
+COLUMNS = ("tool", "cluster", "interconnect", "pattern", "io_mode", "experiment", "run", "timestamp")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    path         TEXT PRIMARY KEY,
+    size         INTEGER NOT NULL,
+    mtime_ns     INTEGER NOT NULL,
+    tool         TEXT,
+    cluster      TEXT,
+    interconnect TEXT,
+    pattern      TEXT,
+    io_mode      TEXT,
+    experiment   TEXT,
+    run          INTEGER,
+    timestamp    INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_tool ON runs (tool, cluster, interconnect);
+CREATE INDEX IF NOT EXISTS runs_pattern ON runs (pattern, io_mode);
+"""
+
+_FIO_NAME = re.compile(
+    r"^(?:(?P<experiment>.+?)_)?(?P<pattern>(?:read|write)_(?:seq|rand))"
+    r"(?:_(?P<interconnect>[a-z0-9]+?))?(?P<buf>_buf)?$"
+)
+_RUN_NAME = re.compile(r"^run(\d+)$")
+
+
+def _connect(db: Path) -> sqlite3.Connection:
+    db = Path(db)
+    db.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _fio_header(path: Path) -> dict:
+    """Global options, first job options and timestamp of a fio JSON result."""
+    try:
+        with path.open() as f:
+            doc = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    options = dict(doc.get("global options", {}))
+    jobs = doc.get("jobs") or [{}]
+    options.update(jobs[0].get("job options", {}))
+    options["timestamp"] = doc.get("timestamp")
+    return options
+
+
+def classify(path: Path, root: Path = BENCHMARKS_DIR) -> Dict[str, Union[str, int, None]]:
+    """
+    Derive the catalog attributes of one result file.
+
+    Parameters:
+        path -- result file below `root`
+        root -- the benchmarks/ directory
+
+    Returns:
+        dict with the keys in COLUMNS (None where an attribute does not apply)
+    """
+    rel = Path(path).relative_to(root)
+    parts = rel.parts[:-1]
+    stem = rel.stem
+    top = parts[0] if parts else ""
+
+    info = dict.fromkeys(COLUMNS)
+    info["tool"] = TOOLS.get(top)
+    info["cluster"] = next((p for p in parts if p in CLUSTERS), None)
+    info["interconnect"] = next((p for p in parts if p in INTERCONNECTS), None)
+    info["io_mode"] = next((p for p in parts if p in IO_MODES), None)
+
+    run = _RUN_NAME.match(stem)
+    if run:
+        info["run"] = int(run.group(1))
+
+    experiment = [
+        p for p in parts[1:]
+        if p not in CLUSTERS + INTERCONNECTS + IO_MODES + ("results",)
+    ]
+
+    if top == "fio":
+        m = _FIO_NAME.match(stem)
+        if m:
+            info["pattern"] = m.group("pattern")
+            info["interconnect"] = m.group("interconnect") or info["interconnect"]
+            if m.group("buf"):
+                info["io_mode"] = "buffered"
+            prefix = m.group("experiment")
+            if prefix and experiment[-1:] != [prefix]:
+                experiment.append(prefix)
+
+        header = _fio_header(Path(path))
+        info["timestamp"] = header.get("timestamp")
+        if info["pattern"] is None:
+            info["pattern"] = FIO_RW.get(header.get("rw"))
+        if info["io_mode"] is None:
+            info["io_mode"] = "direct" if str(header.get("direct", "0")) == "1" else "buffered"
+
+    info["experiment"] = "/".join(experiment) or None
+    if info["cluster"] is None:
+        info["cluster"] = next(
+            (c for prefix, c in DEFAULT_CLUSTER.items() if rel.as_posix().startswith(prefix + "/")),
+            None,
+        )
+    if info["interconnect"] is None:
+        info["interconnect"] = DEFAULT_INTERCONNECT.get(top)
+    return info
+
+
+def scan(root: Path = BENCHMARKS_DIR, db: Path = CATALOG_DB) -> Tuple[int, int]:
+    """
+    Bring the index up to date with the result tree.
+
+    Only files that are new or whose size/mtime changed are classified again;
+    entries of deleted files are dropped.
+
+    Returns:
+        (updated, removed) -- number of rows (re)written and deleted
+    """
+    root = Path(root).resolve()
+    conn = _connect(db)
+    with conn:
+        known = {p: (s, m) for p, s, m in conn.execute("SELECT path, size, mtime_ns FROM runs")}
+        seen = set()
+        updated = 0
+
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+            for name in filenames:
+                if not name.endswith(RESULT_SUFFIXES) or name in IGNORED_NAMES:
+                    continue
+                path = Path(dirpath) / name
+                rel = path.relative_to(root).as_posix()
+                st = path.stat()
+                seen.add(rel)
+                if known.get(rel) == (st.st_size, st.st_mtime_ns):
+                    continue
+
+                info = classify(path, root)
+                conn.execute(
+                    f"INSERT OR REPLACE INTO runs (path, size, mtime_ns, {', '.join(COLUMNS)}) "
+                    f"VALUES (?, ?, ?, {', '.join('?' * len(COLUMNS))})",
+                    (rel, st.st_size, st.st_mtime_ns, *(info[c] for c in COLUMNS)),
+                )
+                updated += 1
+
+        removed = [(p,) for p in known if p not in seen]
+        conn.executemany("DELETE FROM runs WHERE path = ?", removed)
+    conn.close()
+    return updated, len(removed)
+
+
+def find(
+    root: Path = BENCHMARKS_DIR,
+    db: Path = CATALOG_DB,
+    rescan: bool = False,
+    **filters,
+) -> List[Path]:
+    """
+    Return the result files matching every filter, sorted by path.
+
+    Parameters:
+        root    -- the benchmarks/ directory the index describes
+        db      -- index file
+        rescan  -- run an incremental scan first
+        filters -- column=value pairs (see COLUMNS), e.g. tool="fio",
+                   cluster="ex3"; a list/tuple value matches any of its items
+
+    Example:
+        find(tool="qperf", cluster="ex3", interconnect=["eth", "ssocks"])
+    """
+    unknown = set(filters) - set(COLUMNS)
+    if unknown:
+        raise ValueError(f"unknown catalog column(s): {sorted(unknown)}")
+    if rescan or not Path(db).exists():
+        scan(root, db)
+
+    clauses, params = [], []
+    for column, value in filters.items():
+        values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+        clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+        params.extend(values)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    conn = _connect(db)
+    rows = conn.execute(f"SELECT path FROM runs {where} ORDER BY path", params).fetchall()
+    conn.close()
+    root = Path(root).resolve()
+    return [root / path for (path,) in rows]
+
+
+def find_dirs(**kwargs) -> List[Path]:
+    """Like find(), but return the distinct directories holding the matches
+    (what load_csv / load_dolphin expect)."""
+    return sorted({path.parent for path in find(**kwargs)})
+
+
+def main(argv: List[str]) -> int:
+    if not argv or argv[0] not in ("scan", "find"):
+        print(__doc__.strip())
+        return 1
+    if argv[0] == "scan":
+        updated, removed = scan()
+        print(f"Catalog {CATALOG_DB}: {updated} updated, {removed} removed")
+        return 0
+
+    filters = dict(arg.split("=", 1) for arg in argv[1:])
+    if "run" in filters:
+        filters["run"] = int(filters["run"])
+    for path in find(**filters):
+        print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Strong- and weak-scaling figures of the fio scale-out sweeps.
+
+Draws every result benchmarks/fio/fio_scaleout.py wrote
+(fio/<cluster>/scaleout/<io_mode>/<scaling>/<pattern>_<interconnect>.csv):
+aggregate bandwidth and mean completion latency against the number of clients,
+one line per interconnect and iodepth, one pair of figures per cluster, access
+pattern, I/O mode and scaling mode.  Without results it draws nothing.
+
+This is a script rather than a figures/*.json spec: the set of figures follows
+from the results found, the x axis is a client count instead of a byte size,
+and the series are rows of one file split by iodepth, none of which render.py
+specs express.
+"""
+
+from utils import *
+
+import catalog
+
+ROOT = Path(__file__).resolve().parent.parent
+FIO_DIR = catalog.BENCHMARKS_DIR / "fio"
+RESULTS = "*/scaleout/*/*/*.csv"
+COLUMNS = ["clients", "iodepth", "bw[KiB/s]", "bw_std[KiB/s]", "lat_mean[usec]"]
+
+LABELS = {
+    "eth": "TCP Ethernet",
+    "dis": "IPoPCIe",
+    "ssocks": "SuperSockets",
+    "ib": "InfiniBand",
+    "ipoib": "IPoIB",
+}
+# iodepth -> line style, in increasing order
+STYLES = [("o", "-"), ("s", "--"), ("^", ":"), ("D", "-.")]
+
+X_AXIS_LABEL = "Clients ($\\log_{2}$)"
+BW_AXIS_LABEL = "Aggregate bandwidth [GB/s]"
+LAT_AXIS_LABEL = "Mean latency [\\textmu s]"
+
+
+def load_results() -> dict:
+    """Scale-out results by (cluster, pattern, io_mode, scaling), each a list of (interconnect, columns)."""
+    record_listing(FIO_DIR, RESULTS)
+    figures = {}
+    for path in sorted(FIO_DIR.glob(RESULTS)):
+        info = catalog.classify(path)
+        scaling = path.parent.name
+        data = {key: column[0] for key, column in load_csv_columns(path, COLUMNS).items()}
+        columns = {
+            "clients": data["clients"],
+            "iodepth": data["iodepth"],
+            "bw": to_unit(with_unit(data["bw[KiB/s]"], "KiB/s"), "GB/s"),
+            "bw_std": to_unit(with_unit(data["bw_std[KiB/s]"], "KiB/s"), "GB/s"),
+            "lat": data["lat_mean[usec]"],
+        }
+        key = (info["cluster"], info["pattern"], info["io_mode"], scaling)
+        figures.setdefault(key, []).append((info["interconnect"], columns))
+    return figures
+
+
+def set_client_ticks(ax, clients: np.ndarray) -> None:
+    ax.set_xscale("log", base=2)
+    ax.set_xticks(clients)
+    ax.xaxis.set_major_formatter(FuncFormatter(lambda x, _: f"{x:g}"))
+    ax.xaxis.set_minor_locator(ticker.NullLocator())
+
+
+def plot_scaling(out_file: Path, results: list, metric: str, y_label: str) -> None:
+    apply_palatino_style(font_size=14, tick_size=12)
+    fig, ax = standard_ax(ax_h=2.5)
+
+    clients = set()
+    for interconnect, columns in results:
+        color = palette.get(interconnect, None)
+        label = LABELS.get(interconnect, interconnect)
+        for i, depth in enumerate(np.unique(columns["iodepth"])):
+            marker, linestyle = STYLES[i % len(STYLES)]
+            rows = columns["iodepth"] == depth
+            x = columns["clients"][rows]
+            plot_line(ax, x, columns[metric][rows], color=color, label=f"{label} (QD {depth:g})",
+                      marker=marker, linestyle=linestyle)
+            if metric == "bw":
+                std = np.nan_to_num(columns["bw_std"][rows])
+                plot_std_fill(ax, x, columns["bw"][rows], std, color)
+            clients.update(x)
+
+    set_axis_labels(ax, X_AXIS_LABEL, y_label)
+    set_client_ticks(ax, np.array(sorted(clients)))
+    ax.grid(True, which="both", linestyle="--", linewidth=0.5, alpha=0.7)
+
+    save_fig(fig, ax, out_file)
+    plt.close(fig)
+
+
+def main() -> None:
+    figures = load_results()
+    if not figures:
+        print("No scale-out results")
+        return
+    for (cluster, pattern, io_mode, scaling), results in sorted(figures.items()):
+        name = f"fio_scaleout_{cluster}_{pattern}_{io_mode}_{scaling}"
+        plot_scaling(ROOT / f"img/{name}_bw.pdf", results, "bw", BW_AXIS_LABEL)
+        plot_scaling(ROOT / f"img/{name}_lat.pdf", results, "lat", LAT_AXIS_LABEL)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Batch renderer for the declarative figures in figures/*.json.
+
+All requested specs are planned together: every dataset (a results directory
+or file) is loaded once with the union of the keys any figure needs from it,
+then each figure is drawn from the in-memory arrays.
+
+Usage:
+    python3 render.py [--draft] [name ...]     (default: every spec)
+
+Spec format (paths are relative to the repository root / benchmarks/):
+    {
+      "output":  "img/qperf_lat_zoomed.pdf",
+      "axes":    {"ax_h": 2.5},                  standard_ax() arguments
+      "x_label": "Message size [bytes] ($\\log_{2}$)",
+      "y_label": "Latency [\\textmu s]",
+      "unit":    "us",                           unit the y values are shown in
+      "sizes":   [2, 16],                        log2 size range (ticks and clipping)
+      "stats":   "iqr",                          stats_2d method for run matrices
+                                                 (default "iqr": outliers excluded)
+      "band":    "std",                          shading: "std" (+-1 std, default),
+                                                 "mean-ci" or "median-ci" (bootstrap)
+      "confidence": 0.95,                        coverage of the bootstrap CIs
+      "series":  [{
+          "label": "InfiniBand (4x HDR)", "color": "ib", "marker": "o",
+          "fill":  true,                         shade +-1 std (default true)
+          "source": {
+              "loader": "csv" | "dolphin" | "fio",
+              "path":   "qperf/ib/ex3",          or "query": {catalog filters}
+              "key":    "rc_lat",
+              "unit":   "us",                    csv only: unit of the raw values
+              "size_key": "message_size",        csv only: size column
+              "std_key":  "t_stdev[usec]",       csv only: precomputed std column
+              "rw":     "write",                 fio only
+              "std":    "bw_dev"                 fio only: std metric
+          }
+      }],
+      "hlines":  [{"y": 125, "label": "...", "color": "sisci"}]
+    }
+
+Rows of a run matrix are reduced with stats_2d (by default dropping the
+samples flag_outliers marks, which are reported).  Size axes come from the
+data -- message sizes of the runs, block sizes of the fio jobs -- so refined,
+non power-of-two grids plot at their actual sizes.  With a bootstrap band the
+lines show the mean or median of the runs and the shading its confidence
+interval, computed for all series of a figure in one batch; series without a
+run matrix (fio, precomputed std columns) keep the +-1 std shading.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from utils import *
+
+import catalog
+
+ROOT = Path(__file__).resolve().parent.parent
+SPEC_DIR = Path(__file__).resolve().parent / "figures"
+
+
+def load_specs(names: List[str] = None) -> Dict[str, dict]:
+    """Read figures/<name>.json for the given names (default: all), by name."""
+    paths = [SPEC_DIR / f"{name}.json" for name in names] if names else sorted(SPEC_DIR.glob("*.json"))
+    return {path.stem: json.loads(path.read_text()) for path in paths}
+
+
+def resolve_source(source: dict) -> Path:
+    """Absolute results path of a series source (explicit path or catalog query)."""
+    if "path" in source:
+        return catalog.BENCHMARKS_DIR / source["path"]
+    matches = catalog.find_dirs(**source["query"]) if source["loader"] != "fio" else catalog.find(**source["query"])
+    if len(matches) != 1:
+        raise ValueError(f"query {source['query']} matches {len(matches)} results, expected 1")
+    return matches[0]
+
+
+def _dataset_id(source: dict) -> Tuple[str, str, str]:
+    return source["loader"], str(resolve_source(source)), source.get("rw", "")
+
+def _source_keys(source: dict) -> List[str]:
+    keys = [source["key"]]
+    if source["loader"] == "csv":
+        keys.insert(0, source.get("size_key", "message_size"))
+        keys += [source["std_key"]] if "std_key" in source else []
+    elif source["loader"] == "fio" and "std" in source:
+        keys.append(source["std"])
+    return keys
+
+
+def plan(specs: Dict[str, dict]) -> Dict[Tuple[str, str, str], List[str]]:
+    """Map every dataset the specs use to the union of the keys read from it."""
+    datasets = {}
+    for spec in specs.values():
+        for series in spec["series"]:
+            keys = datasets.setdefault(_dataset_id(series["source"]), [])
+            keys += [key for key in _source_keys(series["source"]) if key not in keys]
+    return datasets
+
+def dataset_users(specs: Dict[str, dict]) -> Dict[Tuple[str, str, str], List[str]]:
+    """Map every dataset the specs use to the names of the specs drawing from it."""
+    users = {}
+    for name, spec in specs.items():
+        for series in spec["series"]:
+            names = users.setdefault(_dataset_id(series["source"]), [])
+            names += [name] if name not in names else []
+    return users
+
+
+def load_dataset(loader: str, path: str, rw: str, keys: List[str]) -> Dict[str, np.ndarray]:
+    """
+    Load one dataset.
+
+    Returns:
+        dict key -> array; run matrices (num_runs, num_sizes) aligned by size
+        for csv directories and Dolphin runs (plus "sizes"), 1D columns for a
+        single csv file and fio (plus the jobs' block sizes as "sizes")
+    """
+    path = Path(path)
+    if loader == "csv":
+        if path.is_dir():
+            size_key, *value_keys = keys
+            sizes, data = load_csv_aligned_columns(path, value_keys, size_key)
+            return {"sizes": sizes, **data}
+        data = {key: column[0] for key, column in load_csv_columns(path, keys).items()}
+        return {"sizes": data[keys[0]], **data}
+    if loader == "dolphin":
+        sizes, data = load_dolphin_aligned_columns(path, keys, si=True)
+        return {"sizes": sizes, **data}
+    if loader == "fio":
+        # Columns may mix units (e.g. bw and lat), so each is tagged on its own
+        sizes, data = load_fio_sized(path, rw, keys, si=True)
+        data = np.asarray(data)
+        return {
+            "sizes": sizes,
+            **{
+                key: with_unit(data[:, i], fio_unit(key, si=True)) if fio_unit(key) else data[:, i]
+                for i, key in enumerate(keys)
+            },
+        }
+    raise ValueError(f"unknown loader '{loader}'")
+
+
+def series_data(spec: dict, source: dict, data: Dict[str, np.ndarray]):
+    """
+    (x, mean, std, runs) of one series in the figure's unit, clipped to its size
+    range; runs is the (num_runs, num_sizes) matrix, or None when the source
+    only provides one value per size.
+    """
+    start, end = spec["sizes"]
+    key = source["key"]
+    runs = None
+
+    if source["loader"] == "fio":
+        # load_fio_sized keeps every value with its job's block size
+        x, mean = data["sizes"], data[key]
+        if len(x) != len(mean) or np.isnan(x).any():
+            raise ValueError(f"{source['path'] if 'path' in source else source['query']}: "
+                             f"jobs without a block size, cannot place their values")
+        std = data[source["std"]] if "std" in source else None
+    elif source["loader"] == "csv" and "std_key" in source:
+        x, mean, std = data[source.get("size_key", "message_size")], data[key], data[source["std_key"]]
+    else:
+        x = data["sizes"]
+        if data[key].ndim == 1:
+            # A single run (one CSV file): nothing to reduce
+            mean, std = data[key], None
+        else:
+            runs = data[key]
+            mean, std, _ = stats_2d(runs, spec.get("stats", "iqr"))
+
+    arrays = [mean, std, runs]
+    if source.get("unit"):
+        arrays = [None if arr is None else with_unit(arr, source["unit"]) for arr in arrays]
+    if spec.get("unit"):
+        arrays = [None if arr is None else to_unit(arr, spec["unit"]) for arr in arrays]
+    mean, std, runs = arrays
+
+    keep = (x >= 2 ** start) & (x <= 2 ** end)
+    return (
+        x[keep],
+        np.asarray(mean)[keep],
+        None if std is None else np.asarray(std)[keep],
+        None if runs is None else np.asarray(runs)[:, keep],
+    )
+
+
+def render(spec: dict, datasets: Dict[Tuple[str, str, str], Dict[str, np.ndarray]]) -> None:
+    apply_palatino_style(font_size=14, tick_size=12)
+    fig, ax = standard_ax(**spec.get("axes", {}))
+
+    curves = [series_data(spec, series["source"], datasets[_dataset_id(series["source"])])
+              for series in spec["series"]]
+
+    band = spec.get("band", "std")
+    if band == "std" and spec.get("stats", "iqr") == "iqr":
+        for series, (_, _, _, runs) in zip(spec["series"], curves):
+            flagged = 0 if runs is None else np.sum(flag_outliers(runs).mask & ~np.isnan(runs))
+            if flagged:
+                print(f"  {series['label']}: excluded {flagged} outlier sample(s)")
+
+    # Bootstrap every series with a run matrix at once
+    cis = [None] * len(curves)
+    if band != "std":
+        stat = {"mean-ci": "mean", "median-ci": "median"}[band]
+        batch = [i for i, curve in enumerate(curves) if curve[3] is not None]
+        results = bootstrap_cis([curves[i][3] for i in batch], stat=stat,
+                                confidence=spec.get("confidence", 0.95))
+        for i, ci in zip(batch, results):
+            cis[i] = ci
+
+    colors = []
+    for series, (x, mean, _, _), ci in zip(spec["series"], curves, cis):
+        color = palette.get(series["color"], series["color"])
+        y = mean if ci is None else ci[0]
+        plot_line(ax, x, y, color=color, label=series["label"], marker=series.get("marker", "o"))
+        colors.append(color)
+
+    # Shading is drawn after all lines, as in the hand-written scripts
+    for series, (x, mean, std, _), ci, color in zip(spec["series"], curves, cis, colors):
+        if not series.get("fill", True):
+            continue
+        if ci is not None:
+            plot_ci_fill(ax, x, ci[1], ci[2], color)
+        elif std is not None:
+            plot_std_fill(ax, x, mean, std, color)
+
+    for hline in spec.get("hlines", []):
+        color = palette.get(hline["color"], hline["color"])
+        ax.axhline(y=hline["y"], linestyle="--", linewidth=2, alpha=0.7, color=color)
+        ax.plot([], [], linestyle="--", linewidth=2, alpha=0.7, color=color, label=hline["label"])
+
+    set_axis_labels(ax, spec["x_label"], spec["y_label"])
+    set_log_byte_ticks(ax, *spec["sizes"], rotation=45)
+    ax.grid(True, which="both", linestyle="--", linewidth=0.5, alpha=0.7)
+
+    save_fig(fig, ax, ROOT / spec["output"])
+    plt.close(fig)
+
+
+def main(argv: List[str]) -> int:
+    names = [arg for arg in argv if not arg.startswith("--")]
+    specs = load_specs(names)
+
+    failures = []
+    datasets = {}
+    users = dataset_users(specs)
+    start = time.perf_counter()
+    for (loader, path, rw), keys in plan(specs).items():
+        # The files of a dataset are dependencies of every figure drawn from it
+        with deps_scope(*users[loader, path, rw]):
+            try:
+                datasets[loader, path, rw] = load_dataset(loader, path, rw, keys)
+            except (OSError, KeyError, ValueError) as e:
+                print(f"Error loading {path}: {e!r}", file=sys.stderr)
+    print(f"Loaded {len(datasets)} datasets in {time.perf_counter() - start:.2f} s")
+
+    for name, spec in specs.items():
+        start = time.perf_counter()
+        with deps_scope(name):
+            try:
+                render(spec, datasets)
+            except Exception:
+                failures.append(name)
+                print(f"Error rendering {name}:\n{traceback.format_exc()}", file=sys.stderr)
+                continue
+            record_built()
+        print(f"[{name}: {time.perf_counter() - start:.2f} s]")
+
+    if failures:
+        print("Failed: " + ", ".join(failures), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
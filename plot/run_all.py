@@ -1,17 +1,356 @@
 #!/usr/bin/env python3
 
+import argparse
+import hashlib
+import json
+import os
+import runpy
+import shutil
 import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
 
-def main():
-    current_dir = Path(__file__).parent
-    for py_file in sorted(current_dir.glob("plot*.py")):
-        result = subprocess.run(["python3", str(py_file)], capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"Error running {py_file.name}:\n{result.stderr}")
-            exit(1)
+from utils.deps import DEPS_ENV
+from utils.draft import DRAFT_ENV, draft_mode
+
+CURRENT_DIR = Path(__file__).resolve().parent
+UTILS_DIR = CURRENT_DIR / "utils"
+# Shared by the figure scripts besides utils (render.py resolves queries with it)
+LIBRARIES = [CURRENT_DIR / "catalog.py"]
+# Every figures/*.json spec is its own target in the manifest; the stale ones
+# are drawn together by one `render.py name ...` run, which loads every
+# dataset once for all of them (see batch_targets)
+RENDERER = CURRENT_DIR / "render.py"
+SPEC_DIR = CURRENT_DIR / "figures"
+
+# What every figure was last built from (see is_up_to_date); drafts and
+# publication figures are tracked separately
+BUILD_DIR = Path(os.environ.get("PLOT_CACHE_DIR", CURRENT_DIR / ".cache"))
+
+def build_manifest() -> Path:
+    return BUILD_DIR / ("build-draft.json" if draft_mode() else "build.json")
+
+
+def file_hash(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+class Target(NamedTuple):
+    """One build target: a figure script, or the renderer with spec names."""
+    name: str           # manifest key, e.g. "plot_fio_scaleout.py" or "figures/qperf_bw_mpg.json"
+    py_file: Path
+    args: Tuple[str, ...] = ()
+
+
+def find_targets() -> List[Target]:
+    scripts = [Target(py_file.name, py_file) for py_file in sorted(CURRENT_DIR.glob("plot*.py"))]
+    specs = [
+        Target(spec_target_name(spec.stem), RENDERER, (spec.stem,))
+        for spec in sorted(SPEC_DIR.glob("*.json"))
+    ]
+    return scripts + specs
+
+def spec_target_name(spec: str) -> str:
+    return f"{SPEC_DIR.name}/{spec}.json"
+
+def batch_targets(stale: List[Target]) -> List[Target]:
+    """
+    The runs that build the `stale` targets: each script on its own, and all
+    specs in one renderer run (first, as it takes longest), so datasets shared
+    by several figures are loaded once.
+    """
+    specs = tuple(arg for target in stale if target.py_file == RENDERER for arg in target.args)
+    scripts = [target for target in stale if target.py_file != RENDERER]
+    return ([Target(SPEC_DIR.name, RENDERER, specs)] if specs else []) + scripts
+
+def script_hash(target: Target) -> str:
+    """Hash of a build target; a spec target covers the renderer and its spec."""
+    if not target.args:
+        return file_hash(target.py_file)
+    h = hashlib.blake2b(RENDERER.read_bytes(), digest_size=16)
+    h.update((SPEC_DIR / f"{target.args[0]}.json").read_bytes())
+    return h.hexdigest()
+
+def utils_hash() -> str:
+    """Hash over the sources of the utils package and the shared modules."""
+    h = hashlib.blake2b(digest_size=16)
+    for py_file in sorted(UTILS_DIR.glob("*.py")) + LIBRARIES:
+        h.update(py_file.name.encode())
+        h.update(py_file.read_bytes())
+    return h.hexdigest()
+
+def listing_hash(directory: Path, pattern: str) -> str:
+    names = sorted(file.name for file in Path(directory).glob(pattern) if file.is_file())
+    return hashlib.blake2b("\n".join(names).encode(), digest_size=16).hexdigest()
+
+def input_signature(path: Path):
+    st = path.stat()
+    return [st.st_size, st.st_mtime_ns, file_hash(path)]
+
+
+def is_up_to_date(entry: dict, script_hash: str, lib_hash: str) -> bool:
+    """
+    Check a manifest entry against the current tree.
+
+    A figure is current when the script and the utils package are unchanged,
+    every output exists, no input changed (size/mtime, falling back to the
+    content hash when only the mtime moved) and every globbed directory still
+    holds the same set of files.
+    """
+    if entry.get("script") != script_hash or entry.get("utils") != lib_hash:
+        return False
+    try:
+        if not all(Path(out).exists() for out in entry["outputs"]):
+            return False
+        for path, (size, mtime_ns, digest) in entry["inputs"].items():
+            st = os.stat(path)
+            if (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+                if st.st_size != size or file_hash(Path(path)) != digest:
+                    return False
+        for key, digest in entry["listings"].items():
+            directory, pattern = key.split("\t")
+            if listing_hash(Path(directory), pattern) != digest:
+                return False
+    except (OSError, KeyError, ValueError):
+        return False
+    return True
+
+
+def read_deps(deps_file: Path) -> Dict[str, dict]:
+    """
+    Collect the records a script wrote through utils.deps, by scope (see
+    utils.deps.deps_scope); "" holds the records made outside any scope.
+    Each scope maps "input", "listing" and "output" to the recorded fields
+    and "built" to whether record_built() was called in it.
+    """
+    scopes = {}
+    for line in deps_file.read_text().splitlines():
+        scope, kind, *fields = line.split("\t")
+        records = scopes.setdefault(scope, {"input": [], "listing": [], "output": [], "built": False})
+        if kind == "built":
+            records["built"] = True
+        elif tuple(fields) not in records[kind]:
+            records[kind].append(tuple(fields))
+    return scopes
+
+def manifest_fields(records: dict, signatures: dict) -> dict:
+    """The inputs/listings/outputs of a manifest entry from a scope's records."""
+    inputs = {}
+    for (path,) in records["input"]:
+        if path not in signatures:
+            signatures[path] = input_signature(Path(path))
+        inputs[path] = signatures[path]
+    return {
+        "inputs": inputs,
+        "listings": {
+            f"{directory}\t{pattern}": listing_hash(Path(directory), pattern)
+            for directory, pattern in records["listing"]
+        },
+        "outputs": [path for (path,) in records["output"]],
+    }
+
+def target_entries(target: Target, returncode: int, deps: Dict[str, dict]) -> Dict[str, dict]:
+    """
+    Manifest fields of the targets one run built, None for those that failed.
+
+    A script succeeded when it exited with 0.  Each spec of a renderer run
+    succeeded when it recorded built, and gets the records of its own scope
+    plus those made outside any scope (shared by the whole batch).
+    """
+    signatures = {}
+    shared = deps.get("", {"input": [], "listing": [], "output": [], "built": False})
+    if target.py_file != RENDERER:
+        return {target.name: manifest_fields(shared, signatures) if returncode == 0 else None}
+
+    entries = {}
+    for spec in target.args:
+        own = deps.get(spec, {})
+        if not own.get("built"):
+            entries[spec_target_name(spec)] = None
+            continue
+        records = {kind: shared[kind] + own[kind] for kind in ("input", "listing", "output")}
+        entries[spec_target_name(spec)] = manifest_fields(records, signatures)
+    return entries
+
+
+def run_script(target: Target):
+    """
+    Render one target in its own interpreter, recording its dependencies.
+
+    Returns:
+        (target, result, seconds, deps) -- the CompletedProcess, the wall time
+        and the recorded dependencies by scope (see read_deps)
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        deps_file = Path(tmp) / "deps"
+        deps_file.touch()
+        start = time.perf_counter()
+        result = subprocess.run(
+            ["python3", str(target.py_file), *target.args],
+            capture_output=True,
+            text=True,
+            env={**os.environ, DEPS_ENV: str(deps_file)},
+        )
+        seconds = time.perf_counter() - start
+        deps = read_deps(deps_file)
+    return target, result, seconds, deps
+
+def run_scripts(scripts: list, jobs: int):
+    """Render the targets in `scripts` as separate interpreters, `jobs` at a time."""
+    # Every target is an independent process, so threads only wait on them
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        yield from pool.map(run_script, scripts)
+
+
+# Warm renderer
+#
+# Interpreter startup, importing matplotlib and the first usetex render (font
+# and TeX caches) dominate the time of a single figure.  With --fork they are
+# paid once: this process imports the plotting stack, applies the style and
+# renders a throwaway label, then forks one child per script and runs it with
+# runpy.  Each child starts from the same warm state and exits afterwards, so
+# scripts cannot leak pyplot or rcParams state into each other.
+def warm_up() -> None:
+    import utils
+
+    utils.apply_palatino_style()
+    fig, ax = utils.standard_ax()
+    utils.set_axis_labels(ax, "Message size [bytes] ($\\log_{2}$)", "Throughput [GB/s]")
+    try:
+        fig.canvas.draw()
+    except (RuntimeError, OSError) as e:
+        # e.g. no latex on this machine; the scripts will report it themselves
+        print(f"Warm-up render failed: {e}", file=sys.stderr)
+    utils.plt.close(fig)
+
+def _run_child(target: Target, tmp: Path) -> None:
+    """Body of a forked child: run `target` with output redirected into `tmp`."""
+    code = 1
+    try:
+        for fd, name in ((1, "stdout"), (2, "stderr")):
+            os.dup2(os.open(tmp / name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC), fd)
+        os.environ[DEPS_ENV] = str(tmp / "deps")
+        sys.argv = [str(target.py_file), *target.args]
+        runpy.run_path(str(target.py_file), run_name="__main__")
+        code = 0
+    except SystemExit as e:
+        if isinstance(e.code, int) or e.code is None:
+            code = e.code or 0
         else:
-            print(f"{result.stdout}")
+            print(e.code, file=sys.stderr)
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+def run_forked(scripts: list, jobs: int):
+    """Render the targets in `scripts` in children forked from a warm process, `jobs` at a time."""
+    warm_up()
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    pending = list(scripts)
+    running = {}
+    while pending or running:
+        while pending and len(running) < max(1, jobs):
+            target = pending.pop(0)
+            tmp = Path(tempfile.mkdtemp())
+            (tmp / "deps").touch()
+            start = time.perf_counter()
+            pid = os.fork()
+            if pid == 0:
+                _run_child(target, tmp)
+            running[pid] = (target, tmp, start)
+
+        pid, status = os.wait()
+        target, tmp, start = running.pop(pid)
+        seconds = time.perf_counter() - start
+        returncode = os.waitstatus_to_exitcode(status)
+        result = subprocess.CompletedProcess(
+            [str(target.py_file), *target.args], returncode,
+            (tmp / "stdout").read_text(), (tmp / "stderr").read_text(),
+        )
+        deps = read_deps(tmp / "deps")
+        shutil.rmtree(tmp, ignore_errors=True)
+        yield target, result, seconds, deps
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render every plot*.py figure script and the figures/*.json specs.")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="scripts rendered concurrently (default: 1, 0 uses every core)",
+    )
+    parser.add_argument(
+        "-B", "--always-make", action="store_true",
+        help="render every figure, even those whose inputs did not change",
+    )
+    parser.add_argument(
+        "--fork", action="store_true",
+        help="import matplotlib and warm up TeX once, then fork a child per script",
+    )
+    parser.add_argument(
+        "--draft", action="store_true",
+        help="fast mathtext drafts as low-resolution PNGs (same as PLOT_DRAFT=1)",
+    )
+    args = parser.parse_args()
+    if args.draft:
+        os.environ[DRAFT_ENV] = "1"
+    manifest_path = build_manifest()
+
+    start = time.perf_counter()
+    scripts = find_targets()
+    jobs = args.jobs or os.cpu_count() or 1
+
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        manifest = {}
+
+    lib_hash = utils_hash()
+    script_hashes = {target.name: script_hash(target) for target in scripts}
+    stale = [
+        target for target in scripts
+        if args.always_make
+        or not is_up_to_date(manifest.get(target.name, {}), script_hashes[target.name], lib_hash)
+    ]
+
+    failures = []
+    if stale:
+        runner = run_forked if args.fork else run_scripts
+        for target, result, seconds, deps in runner(batch_targets(stale), jobs):
+            entries = target_entries(target, result.returncode, deps)
+            for name, entry in entries.items():
+                if entry is None:
+                    failures.append(name)
+                    manifest.pop(name, None)
+                else:
+                    manifest[name] = {"script": script_hashes[name], "utils": lib_hash, **entry}
+            if result.returncode != 0 or None in entries.values():
+                print(f"Error running {target.name} ({seconds:.1f} s):\n{result.stdout}{result.stderr}")
+            else:
+                print(f"{result.stdout}[{target.name}: {seconds:.1f} s]")
+
+    # Forget targets that no longer exist
+    manifest = {name: entry for name, entry in manifest.items() if name in script_hashes}
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=1))
+    os.replace(tmp, manifest_path)
+
+    print(f"Built {len(stale) - len(failures)}/{len(stale)} targets "
+          f"({len(scripts) - len(stale)} up to date) "
+          f"in {time.perf_counter() - start:.1f} s with {jobs} job(s)")
+    if failures:
+        print("Failed: " + ", ".join(failures))
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+"""
+Shared helpers for the plot scripts.
+
+The data core (units, on-disk cache, loaders, statistics) only depends on
+NumPy.  The matplotlib helpers live in utils.plotting and are imported on first
+access, so data-only tools can `from utils import load_fio, stats_2d` without
+paying for matplotlib; `from utils import *` still pulls in everything.
+"""
+
+from .units import *
+from .cache import *
+from .loaders import *
+from .stats import *
+from .fio import *
+from .deps import *
+from .draft import *
+
+# Names provided by utils.plotting, resolved lazily by __getattr__
+_PLOTTING = (
+    "palette",
+    "set_log_byte_ticks",
+    "apply_palatino_style",
+    "standard_ax",
+    "plot_line",
+    "save_fig",
+    "set_axis_labels",
+    "plot_std_fill",
+    "plot_ci_fill",
+    "matplotlib",
+    "mpl",
+    "plt",
+    "ticker",
+    "FuncFormatter",
+)
+_SUBMODULES = ("units", "cache", "loaders", "stats", "fio", "deps", "draft", "plotting")
+
+
+def __getattr__(name: str):
+    if name in _PLOTTING:
+        from . import plotting
+        value = getattr(plotting, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    name for name in list(globals())
+    if not name.startswith("_") and name not in _SUBMODULES
+] + list(_PLOTTING)
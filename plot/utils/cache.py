@@ -0,0 +1,186 @@
+"""On-disk cache of parsed benchmark results."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, List, Sequence, Union
+
+import numpy as np
+
+from .deps import record_input
+from .units import unit_of, with_unit
+
+
+# On-disk cache of parsed results
+#
+# Every parsed source file is stored as one .npy file per extracted array plus a
+# small JSON header.  Entries are keyed by loader, resolved source path and the
+# requested keys, and validated against the file's size/mtime (falling back to
+# a content hash when only the mtime changed, e.g. after a git checkout).
+# Set PLOT_CACHE_DIR to relocate the cache, or PLOT_NO_CACHE=1 to bypass it.
+CACHE_VERSION = 2  # bump whenever a parser changes what it returns
+CACHE_DIR = Path(os.environ.get("PLOT_CACHE_DIR", Path(__file__).resolve().parent.parent / ".cache"))
+
+def _cache_enabled() -> bool:
+    return os.environ.get("PLOT_NO_CACHE", "") in ("", "0")
+
+def _content_hash(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+def _cache_load(entry: Path, st: os.stat_result, source: Path) -> Union[List[np.ndarray], None]:
+    """Return the cached arrays for `entry`, or None if missing or stale."""
+    meta_path = entry.with_suffix(".json")
+    try:
+        meta = json.loads(meta_path.read_text())
+        if (meta["size"], meta["mtime_ns"]) != (st.st_size, st.st_mtime_ns):
+            if meta["size"] != st.st_size or meta["hash"] != _content_hash(source):
+                return None
+            # Same content, new mtime: refresh the stat signature
+            meta["mtime_ns"] = st.st_mtime_ns
+            _atomic_write(meta_path, json.dumps(meta).encode())
+        arrays = [
+            np.asarray(np.load(entry.with_suffix(f".{i}.npy"), mmap_mode="r", allow_pickle=False))
+            for i in range(meta["count"])
+        ]
+        units = meta.get("units", [None] * len(arrays))
+        return [arr if unit is None else with_unit(arr, unit) for arr, unit in zip(arrays, units)]
+    except (OSError, ValueError, KeyError):
+        return None
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+def _cache_store(entry: Path, st: os.stat_result, source: Path, arrays: List[np.ndarray]) -> None:
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        for i, arr in enumerate(arrays):
+            buf = io.BytesIO()
+            # .npy cannot hold dtype metadata; units go into the header instead
+            np.save(buf, np.ascontiguousarray(arr, dtype=float).view(np.float64), allow_pickle=False)
+            _atomic_write(entry.with_suffix(f".{i}.npy"), buf.getvalue())
+        # The header is written last so that a readable header implies complete arrays
+        meta = {
+            "source": str(source),
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "hash": _content_hash(source),
+            "count": len(arrays),
+            "units": [unit_of(arr) for arr in arrays],
+        }
+        _atomic_write(entry.with_suffix(".json"), json.dumps(meta).encode())
+    except OSError:
+        pass  # caching is best effort; the caller already has the data
+
+# In-process memo of parsed results
+#
+# Batch renders and notebook sessions ask for the same files again and again;
+# _cached keeps the arrays it returned in an LRU keyed on loader, resolved
+# path, parser arguments and the file's size/mtime, evicting the least
+# recently used entries once their total size exceeds the budget.  Set
+# PLOT_MEMO_MB (default 512) to size it, or 0 to disable it.  The loaders call
+# _cached from thread pools, so every access to the memo holds _memo_lock;
+# parsing itself runs outside of it.
+MEMO_LIMIT = int(float(os.environ.get("PLOT_MEMO_MB", 512)) * 2**20)
+
+_memo: "OrderedDict[tuple, List[np.ndarray]]" = OrderedDict()
+_memo_bytes = 0
+_memo_lock = threading.Lock()
+
+def set_memo_limit(nbytes: int) -> None:
+    """Change the in-process memo budget (bytes; 0 disables and empties it)."""
+    global MEMO_LIMIT
+    with _memo_lock:
+        MEMO_LIMIT = int(nbytes)
+        _memo_evict()
+
+def clear_memo() -> None:
+    """Drop every memoized result."""
+    global _memo_bytes
+    with _memo_lock:
+        _memo.clear()
+        _memo_bytes = 0
+
+def memo_info() -> dict:
+    """Number of entries, bytes held and budget of the in-process memo."""
+    with _memo_lock:
+        return {"entries": len(_memo), "bytes": _memo_bytes, "limit": MEMO_LIMIT}
+
+def _memo_size(arrays: List[np.ndarray]) -> int:
+    return sum(arr.nbytes for arr in arrays)
+
+def _memo_get(key: tuple) -> Union[List[np.ndarray], None]:
+    with _memo_lock:
+        arrays = _memo.get(key)
+        if arrays is not None:
+            _memo.move_to_end(key)
+        return arrays
+
+def _memo_evict() -> None:
+    """Drop least recently used entries down to the budget; hold _memo_lock."""
+    global _memo_bytes
+    while _memo and _memo_bytes > MEMO_LIMIT:
+        _, arrays = _memo.popitem(last=False)
+        _memo_bytes -= _memo_size(arrays)
+
+def _memo_put(key: tuple, arrays: List[np.ndarray]) -> None:
+    global _memo_bytes
+    size = _memo_size(arrays)
+    if size > MEMO_LIMIT:
+        return
+    for arr in arrays:
+        # Shared between callers: in-place edits would corrupt later loads
+        arr.flags.writeable = False
+    with _memo_lock:
+        # Two threads missing on the same file both store it: count it once
+        old = _memo.pop(key, None)
+        if old is not None:
+            _memo_bytes -= _memo_size(old)
+        _memo[key] = arrays
+        _memo_bytes += size
+        _memo_evict()
+
+def _cached(
+    loader: str,
+    source: Path,
+    params: Sequence,
+    parse: Callable[[], List[np.ndarray]],
+) -> List[np.ndarray]:
+    """
+    Return the arrays `parse()` extracts from `source`, served from the
+    in-process memo or the on-disk cache when a valid entry exists.  Returned
+    arrays are read-only.
+
+    Parameters:
+        loader -- name of the parser (part of the cache key)
+        source -- file the arrays are extracted from
+        params -- JSON-serializable parser arguments (e.g. requested keys)
+        parse  -- callable doing the actual parsing on a cache miss
+    """
+    record_input(source)
+    source = Path(source).resolve()
+    st = source.stat()
+    key = json.dumps([CACHE_VERSION, loader, str(source), list(params)])
+
+    memo_key = (key, st.st_size, st.st_mtime_ns)
+    arrays = _memo_get(memo_key)
+    if arrays is not None:
+        return arrays
+
+    if _cache_enabled():
+        entry = CACHE_DIR / hashlib.sha1(key.encode()).hexdigest()
+        arrays = _cache_load(entry, st, source)
+        if arrays is None:
+            arrays = parse()
+            _cache_store(entry, st, source, arrays)
+    else:
+        arrays = parse()
+    _memo_put(memo_key, arrays)
+    return arrays
@@ -0,0 +1,56 @@
+"""Record the files a figure script reads and writes (for run_all.py)."""
+
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+# run_all.py points this at a per-script file; unset, recording is a no-op
+DEPS_ENV = "PLOT_DEPS"
+
+# Targets the records are currently attributed to (see deps_scope); records
+# made outside any scope belong to the whole script
+_scope = ("",)
+
+
+def _record(kind: str, *fields) -> None:
+    deps_file = os.environ.get(DEPS_ENV)
+    if not deps_file:
+        return
+    with open(deps_file, "a") as fh:
+        for name in _scope:
+            fh.write("\t".join([name, kind, *map(str, fields)]) + "\n")
+
+@contextmanager
+def deps_scope(*names: str) -> Iterator[None]:
+    """
+    Attribute the records made inside the block to the targets `names`
+    instead of the whole script, so a script drawing several figures in one
+    process (render.py) keeps each figure's dependencies apart.  A dataset
+    shared by several figures is recorded once for each of them.
+    """
+    global _scope
+    outer, _scope = _scope, names
+    try:
+        yield
+    finally:
+        _scope = outer
+
+def record_input(path: Path) -> None:
+    """Note that the running script read `path`."""
+    _record("input", Path(path).resolve())
+
+def record_listing(directory: Path, pattern: str) -> None:
+    """Note that the running script globbed `pattern` in `directory`, so
+    adding or removing a matching file invalidates its figure."""
+    _record("listing", Path(directory).resolve(), pattern)
+
+def record_output(path: Path) -> None:
+    """Note that the running script wrote `path`."""
+    _record("output", Path(path).resolve())
+
+def record_built() -> None:
+    """Note that the targets of the current scope were drawn successfully."""
+    _record("built")
@@ -0,0 +1,17 @@
+"""Draft rendering switch shared by the plot scripts and run_all.py."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+# Set PLOT_DRAFT=1 (or pass --draft to any plot script or run_all.py) to render
+# with mathtext instead of LaTeX into low-resolution PNGs next to the PDFs
+DRAFT_ENV = "PLOT_DRAFT"
+DRAFT_DPI = int(os.environ.get("PLOT_DRAFT_DPI", 100))
+DRAFT_SUFFIX = ".draft.png"
+
+
+def draft_mode() -> bool:
+    """True when figures should be rendered as fast drafts."""
+    return os.environ.get(DRAFT_ENV, "") not in ("", "0") or "--draft" in sys.argv[1:]
@@ -0,0 +1,660 @@
+"""Loaders for fio JSON results and per-I/O logs."""
+
+from __future__ import annotations
+
+import io
+import json
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from .cache import _cached
+from .deps import record_input
+from .loaders import _run_files
+from .units import UNITS, with_unit
+
+
+# def load_fio(json_path: Path, rw_type: str, metric_keys: List[str]) -> np.ndarray:
+#     """
+#     Load multiple performance metric columns from FIO JSON output.
+
+#     Parameters:
+#         json_path   -- path to the FIO JSON file
+#         rw_type     -- 'read' or 'write'
+#         metric_keys -- list of keys inside 'read' or 'write' to extract (e.g., ['iops', 'bw'])
+
+#     Returns:
+#         2D NumPy array of shape (num_jobs, num_metrics)
+#     """
+#     with json_path.open() as f:
+#         doc = json.load(f)
+
+#     rows = []
+#     for job in doc["jobs"]:
+#         try:
+#             row = [float(job[rw_type][key]) for key in metric_keys]
+#             rows.append(row)
+#         except (KeyError, ValueError, TypeError):
+#             continue
+
+#     return np.array(rows)
+
+
+KeyPath = Union[str, Sequence[str]]
+
+
+
+def _dig(d: dict, path: KeyPath):
+    """
+    Walk `d` following the components in `path` and return the leaf value.
+
+    Parameters
+    ----------
+    d      : dict
+        The dictionary to traverse.
+    path   : KeyPath
+        A dot-separated string (``"clat_ns.mean"``) **or** a tuple/list
+        (``("clat_ns", "mean")``).
+
+    Returns
+    -------
+    Any
+        The value at the end of the path.
+
+    Raises
+    ------
+    KeyError
+        If any component is missing.
+    """
+    if isinstance(path, str):
+        path = path.split(".")
+    for p in path:
+        d = d[p]
+    return d
+
+
+def load_fio(
+    json_path: Path,
+    rw_type: str,
+    metric_paths: List[KeyPath] = None,
+    *,
+    # backward-compatibility alias
+    metric_keys: List[KeyPath] = None,
+    stream: bool = False,
+    si: bool = False,
+) -> np.ndarray:
+    """
+    Load multiple performance-metric columns from an FIO JSON result.
+
+    Parameters
+    ----------
+    json_path   : pathlib.Path
+        Path to the FIO JSON file.
+    rw_type     : str
+        Either ``"read"`` or ``"write"`` – selects the per-job block to parse.
+    metric_paths : list[KeyPath], optional
+        Metrics to extract.  Each entry may be:
+
+        * A simple key (``"iops"``, ``"bw"``)
+        * A *dot* path (``"clat_ns.mean"``)
+        * A tuple/list of path components (``("clat_ns", "mean")``)
+
+        Order defines the column order in the returned array.
+
+    Keyword-only Parameters
+    -----------------------
+    metric_keys : list[KeyPath], optional
+        **Deprecated but kept for backward compatibility** – synonym for
+        *metric_paths*.  If both are provided, *metric_paths* wins.
+    stream : bool, optional
+        Parse the document incrementally instead of calling ``json.load``.
+        Only ``jobs[*].<rw_type>`` is walked and only the requested paths are
+        materialized, so peak memory no longer grows with the document size
+        (useful for ``json+`` output and sweeps with hundreds of jobs).
+    si : bool, optional
+        Convert every column to its SI unit (``bw*`` KiB/s -> B/s,
+        ``*_ns`` -> s, ``runtime`` ms -> s) in one vectorized multiply.  The
+        unit is recorded on the array (see ``to_unit``) when all columns
+        share one; columns fio reports without a unit are left unchanged.
+
+    Returns
+    -------
+    numpy.ndarray
+        Shape ``(n_jobs, len(metric_paths))`` of ``float`` values.
+
+    Notes
+    -----
+    * Jobs missing *any* requested key (or holding non-numeric data) are
+      **skipped**, mirroring the behaviour of the original function.
+    * Change the error-handling block if you prefer ``NaN`` filling instead of
+      skipping.
+    * Results are served from the on-disk cache (see ``CACHE_DIR``) as
+      read-only memory-mapped arrays once a file has been parsed.
+    """
+    # Resolve parameter alias
+    if metric_paths is None:
+        metric_paths = metric_keys
+    if metric_paths is None:
+        raise TypeError("`metric_paths` (or `metric_keys`) must be specified.")
+
+    params = [rw_type, [p if isinstance(p, str) else ".".join(p) for p in metric_paths]]
+    parse = _stream_fio if stream else _parse_fio
+    data = _cached("fio", json_path, params, lambda: [parse(json_path, rw_type, metric_paths)])[0]
+    return _fio_si(data, metric_paths) if si else data
+
+
+def _fio_si(data: np.ndarray, metric_paths: List[KeyPath]) -> np.ndarray:
+    """Convert the columns of a load_fio result to SI units (see load_fio's si)."""
+    units = [_fio_unit(p) for p in metric_paths]
+    factors = np.array([UNITS[u][1] if u else 1.0 for u in units])
+    si_units = {UNITS[u][0] if u else None for u in units}
+    data = data * factors if data.size else data
+    return with_unit(data, si_units.pop()) if len(si_units) == 1 and None not in si_units else data
+
+
+def _fio_unit(path: KeyPath) -> Union[str, None]:
+    """Unit fio uses for the metric at `path` (None for counts and percentages)."""
+    parts = path.split(".") if isinstance(path, str) else list(path)
+    leaf = parts[-1]
+    if leaf in ("N", "samples") or leaf.endswith("_samples"):
+        return None
+    for part in reversed(parts):
+        for suffix, unit in (("_ns", "ns"), ("_us", "us"), ("_ms", "ms")):
+            if part.endswith(suffix):
+                return unit
+    if leaf.startswith("bw_bytes"):
+        return "B/s"
+    if leaf in ("bw", "bw_min", "bw_max", "bw_mean", "bw_dev"):
+        return "KiB/s"
+    if leaf.startswith("iops"):
+        return "1/s"
+    return {"runtime": "ms", "io_bytes": "B", "io_kbytes": "KiB"}.get(leaf)
+
+def fio_unit(path: KeyPath, si: bool = False) -> Union[str, None]:
+    """
+    Unit of the column load_fio returns for the metric at `path`; useful to
+    tag single columns of a multi-unit result (see with_unit).
+
+    Parameters:
+        path -- metric path as passed to load_fio
+        si   -- whether the column was loaded with si=True
+    """
+    unit = _fio_unit(path)
+    return UNITS[unit][0] if si and unit else unit
+
+
+def _parse_fio(json_path: Path, rw_type: str, metric_paths: List[KeyPath]) -> np.ndarray:
+    with json_path.open() as f:
+        doc = json.load(f)
+
+    rows = []
+    for job in doc["jobs"]:
+        try:
+            row = [float(_dig(job[rw_type], path)) for path in metric_paths]
+            rows.append(row)
+        except (KeyError, ValueError, TypeError):
+            # Skip jobs that lack any requested metric or hold non-numeric data
+            continue
+
+    return np.asarray(rows, dtype=float)
+
+
+# Block sizes
+#
+# fio's size suffixes are powers of 1024 by default (kb_base=1024), whatever
+# their case or an "i" ("4k", "4K", "4KiB" and "4KB" are all 4096 bytes).
+_FIO_SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmgtp]?)i?b?\s*$", re.IGNORECASE)
+
+def parse_fio_size(text: str) -> float:
+    """Bytes of a fio size such as '4k', '1M' or '512' (NaN if unparsable)."""
+    m = _FIO_SIZE.match(str(text))
+    if not m:
+        return float("nan")
+    return float(m.group(1)) * 1024 ** " kmgtp".index(m.group(2).lower() or " ")
+
+def _parse_fio_block_sizes(json_path: Path, rw_type: str) -> List[np.ndarray]:
+    with json_path.open() as f:
+        doc = json.load(f)
+
+    default = doc.get("global options", {}).get("bs")
+    return [np.asarray([_job_block_size(job, default, rw_type) for job in doc["jobs"]], dtype=float)]
+
+def _job_block_size(job: dict, default: Union[str, None], rw_type: str) -> float:
+    bs = job.get("job options", {}).get("bs", default)
+    # "bs=4k,64k" gives separate read and write block sizes
+    parts = str(bs).split(",") if bs is not None else [""]
+    return parse_fio_size(parts[min(rw_type == "write", len(parts) - 1)])
+
+def load_fio_block_sizes(json_path: Path, rw_type: str = "read") -> np.ndarray:
+    """
+    Block size of every job in an FIO JSON result, in bytes.
+
+    Sweeps are not restricted to powers of two (e.g. a refined bs grid), so
+    plots take the size axis from the jobs' ``bs`` option (or the global one)
+    instead of assuming bs_1k, bs_2k, ...
+
+    Parameters:
+        json_path -- path to the FIO JSON file
+        rw_type   -- 'read' or 'write'; picks the matching half of "bs=R,W"
+
+    Returns:
+        1D array with one size per job (NaN where no block size is given)
+    """
+    return _cached(
+        "fio_bs", json_path, [rw_type], lambda: _parse_fio_block_sizes(json_path, rw_type)
+    )[0]
+
+def _parse_fio_sized(json_path: Path, rw_type: str, metric_paths: List[KeyPath]) -> List[np.ndarray]:
+    with json_path.open() as f:
+        doc = json.load(f)
+
+    default = doc.get("global options", {}).get("bs")
+    sizes, rows = [], []
+    for job in doc["jobs"]:
+        try:
+            row = [float(_dig(job[rw_type], path)) for path in metric_paths]
+        except (KeyError, ValueError, TypeError):
+            continue  # same skipping rules as _parse_fio
+        sizes.append(_job_block_size(job, default, rw_type))
+        rows.append(row)
+    return [np.asarray(sizes, dtype=float), np.asarray(rows, dtype=float).reshape(-1, len(metric_paths))]
+
+def load_fio_sized(
+    json_path: Path, rw_type: str, metric_paths: List[KeyPath], si: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    load_fio together with the block size of every job it kept, so values
+    stay with their sizes when jobs lacking a metric are skipped.
+
+    Parameters:
+        json_path    -- path to the FIO JSON file
+        rw_type      -- 'read' or 'write'
+        metric_paths -- metrics to extract (see load_fio)
+        si           -- convert the columns to SI units (see load_fio)
+
+    Returns:
+        (sizes, data) -- 1D block sizes in bytes (NaN where no block size is
+                         given) and the (len(sizes), len(metric_paths)) values
+    """
+    params = [rw_type, [p if isinstance(p, str) else ".".join(p) for p in metric_paths]]
+    sizes, data = _cached(
+        "fio_sized", json_path, params, lambda: _parse_fio_sized(json_path, rw_type, metric_paths)
+    )
+    return sizes, _fio_si(data, metric_paths) if si else data
+
+
+# Incremental JSON reading for large fio documents
+FIO_STREAM_CHUNK = 1 << 16  # characters read from disk at a time
+
+class _JsonStream:
+    """
+    Minimal pull parser over a text file.
+
+    Only a window of the file is held in memory; values the caller is not
+    interested in are skipped by scanning for brackets and strings without
+    building Python objects.
+    """
+
+    _STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.S)
+    _STRUCT = re.compile(r'["\[\]{}]')
+    _SCALAR = re.compile(r'[^,\]}\s]+')
+    _SPACE = re.compile(r"\s*")
+
+    def __init__(self, fh, chunk_size: int = None):
+        self._fh = fh
+        self._chunk_size = chunk_size or FIO_STREAM_CHUNK
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Drop consumed input and append the next chunk; False at EOF."""
+        data = self._fh.read(self._chunk_size)
+        if not data:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def _error(self, msg: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(msg, self._buf, self._pos)
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ('' at EOF) without consuming it."""
+        while True:
+            self._pos = self._SPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        c = self.peek()
+        if not c or c not in chars:
+            raise self._error(f"expected one of {chars!r}")
+        self._pos += 1
+        return c
+
+    def _match(self, pattern: re.Pattern) -> re.Match:
+        """Match `pattern` at the cursor, reading more input if it may continue."""
+        while True:
+            m = pattern.match(self._buf, self._pos)
+            if m and (m.end() < len(self._buf) or self._eof):
+                return m
+            if not self._fill() and not m:
+                raise self._error("unexpected end of input")
+
+    def read_string(self) -> str:
+        if self.peek() != '"':
+            raise self._error("expected string")
+        m = self._match(self._STRING)
+        self._pos = m.end()
+        return json.loads(m.group())
+
+    def read_value(self):
+        """Materialize the value at the cursor."""
+        if self.peek() not in ('"', "{", "["):
+            # Scalars are matched up to their terminator first, so that a number
+            # split across two chunks is not decoded from its prefix
+            m = self._match(self._SCALAR)
+            self._pos = m.end()
+            return json.loads(m.group())
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            self._pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """Advance past the value at the cursor without building it."""
+        c = self.peek()
+        if c == '"':
+            self._pos = self._match(self._STRING).end()
+        elif c in ("{", "["):
+            depth = 0
+            while True:
+                m = self._STRUCT.search(self._buf, self._pos)
+                if m is None:
+                    self._pos = len(self._buf)
+                    if not self._fill():
+                        raise self._error("unexpected end of input")
+                    continue
+                self._pos = m.start()
+                ch = m.group()
+                if ch == '"':
+                    self._pos = self._match(self._STRING).end()
+                    continue
+                self._pos += 1
+                depth += 1 if ch in "{[" else -1
+                if depth == 0:
+                    return
+        else:
+            self._pos = self._match(self._SCALAR).end()
+
+    def iter_object(self):
+        """Yield the keys of the object at the cursor; the caller consumes each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_string()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+    def iter_array(self):
+        """Yield once per element of the array at the cursor; the caller consumes each element."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield
+            if self.expect(",]") == "]":
+                return
+
+
+def _collect_paths(js: _JsonStream, paths: set, prefix: tuple, found: dict) -> None:
+    """Read the leaves in `paths` below `prefix` from the value at the cursor."""
+    if js.peek() != "{":
+        js.skip_value()
+        return
+    depth = len(prefix)
+    wanted = {p[depth] for p in paths if len(p) > depth + 1 and p[:depth] == prefix}
+    for key in js.iter_object():
+        sub = prefix + (key,)
+        if sub in paths:
+            found[sub] = js.read_value()
+        elif key in wanted:
+            _collect_paths(js, paths, sub, found)
+        else:
+            js.skip_value()
+
+
+def _stream_fio(json_path: Path, rw_type: str, metric_paths: List[KeyPath]) -> np.ndarray:
+    """
+    Event-driven counterpart of _parse_fio: walks ``jobs[*].<rw_type>`` and
+    materializes only `metric_paths`, skipping everything else (histograms,
+    percentiles, job options) without decoding it.
+    """
+    paths = [tuple(p.split(".")) if isinstance(p, str) else tuple(p) for p in metric_paths]
+    path_set = set(paths)
+
+    rows = []
+    with json_path.open() as fh:
+        js = _JsonStream(fh)
+        for key in js.iter_object():
+            if key != "jobs":
+                js.skip_value()
+                continue
+            for _ in js.iter_array():
+                found = {}
+                if js.peek() != "{":
+                    js.skip_value()
+                    continue
+                for job_key in js.iter_object():
+                    if job_key == rw_type:
+                        _collect_paths(js, path_set, (), found)
+                    else:
+                        js.skip_value()
+                try:
+                    rows.append([float(found[p]) for p in paths])
+                except (KeyError, ValueError, TypeError):
+                    # Same skipping rules as _parse_fio
+                    continue
+
+    return np.asarray(rows, dtype=float)
+
+
+def _parse_fio_percentiles(json_path: Path, rw_type: str, metric: str) -> List[np.ndarray]:
+    with json_path.open() as f:
+        doc = json.load(f)
+
+    tables = []
+    for job in doc["jobs"]:
+        try:
+            tables.append(_dig(job[rw_type], metric)["percentile"])
+        except (KeyError, TypeError):
+            tables.append({})  # keep the job so rows stay aligned with block sizes
+
+    levels = sorted({float(level) for table in tables for level in table})
+    index = {level: i for i, level in enumerate(levels)}
+    values = np.full((len(tables), len(levels)), np.nan)
+    for row, table in enumerate(tables):
+        for level, value in table.items():
+            values[row, index[float(level)]] = value
+
+    return [np.array(levels, dtype=float), values]
+
+
+def load_fio_percentiles(
+    json_paths: Union[Path, Sequence[Path]],
+    rw_type: str,
+    metric: KeyPath = "clat_ns",
+    si: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Load the full latency-percentile table of every job from one or more FIO
+    JSON results.
+
+    Parameters
+    ----------
+    json_paths : pathlib.Path or sequence of pathlib.Path
+        FIO JSON files, or a directory whose ``*.json`` files are read in
+        sorted order.
+    rw_type    : str
+        Either ``"read"`` or ``"write"``.
+    metric     : KeyPath, optional
+        Latency block holding a ``percentile`` table (``"clat_ns"`` by
+        default; ``"lat_ns"`` or ``"slat_ns"`` when fio reports them).
+    si         : bool, optional
+        Convert to seconds and tag the result (see ``to_unit``).
+
+    Returns
+    -------
+    (tensor, levels)
+        ``tensor`` has shape ``(n_files, n_jobs, n_levels)``; ``levels`` holds
+        the percentile levels (e.g. ``50.0``, ``99.9``) in ascending order.
+        Jobs without a table, files with fewer jobs and levels a file did not
+        report are NaN.
+
+    Notes
+    -----
+    Each document is decoded once (and cached on disk like ``load_fio``);
+    every job's table is read in the same pass.
+    """
+    if isinstance(json_paths, (str, Path)):
+        path = Path(json_paths)
+        json_paths = _run_files(path, "*.json") if path.is_dir() else [path]
+
+    key = metric if isinstance(metric, str) else ".".join(metric)
+    docs = [
+        _cached("fio_percentiles", p, [rw_type, key], lambda p=p: _parse_fio_percentiles(p, rw_type, key))
+        for p in json_paths
+    ]
+
+    levels = np.unique(np.concatenate([doc[0] for doc in docs])) if docs else np.empty(0)
+    n_jobs = max((len(doc[1]) for doc in docs), default=0)
+    tensor = np.full((len(docs), n_jobs, len(levels)), np.nan)
+    for i, (doc_levels, values) in enumerate(docs):
+        tensor[i, : len(values)][:, np.searchsorted(levels, doc_levels)] = values
+
+    if si:
+        unit = _fio_unit(key + ".percentile")
+        if unit is not None:
+            tensor = with_unit(tensor * UNITS[unit][1], UNITS[unit][0])
+    return tensor, levels
+
+
+# fio per-I/O logs (write_bw_log / write_lat_log / write_iops_log)
+#
+# Each line is "time_ms, value, direction, bs, offset[, priority]"; value is
+# KiB/s for bw logs, ns for lat/clat/slat logs and a count for iops logs.
+FIO_LOG_COLUMNS = ("time_ms", "value", "direction", "bs", "offset", "priority")
+FIO_LOG_CHUNK = 1 << 23  # bytes parsed per step when streaming a log
+
+def iter_fio_log(log_path: Path, chunk_bytes: int = None) -> Iterator[np.ndarray]:
+    """
+    Stream a fio log file as blocks of rows.
+
+    The file is memory-mapped and cut at line boundaries into blocks of about
+    `chunk_bytes`, each parsed by np.loadtxt, so memory stays bounded by the
+    block size no matter how long the log is.
+
+    Parameters:
+        log_path    -- path to a fio *_bw/_lat/_clat/_slat/_iops log
+        chunk_bytes -- approximate block size in bytes (default FIO_LOG_CHUNK)
+
+    Yields:
+        2D float arrays of shape (rows, columns), columns as in FIO_LOG_COLUMNS
+    """
+    chunk_bytes = chunk_bytes or FIO_LOG_CHUNK
+    record_input(log_path)
+    with Path(log_path).open("rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos, size = 0, len(mm)
+            while pos < size:
+                end = mm.find(b"\n", min(pos + chunk_bytes, size - 1))
+                end = size if end < 0 else end + 1
+                text = mm[pos:end].decode()
+                pos = end
+                if text.strip():
+                    yield np.loadtxt(io.StringIO(text), delimiter=",", ndmin=2)
+
+def _parse_fio_log(log_path: Path) -> List[np.ndarray]:
+    blocks = list(iter_fio_log(log_path))
+    return [np.concatenate(blocks) if blocks else np.empty((0, 5))]
+
+def _select_direction(rows: np.ndarray, direction: Union[int, None]) -> np.ndarray:
+    return rows if direction is None else rows[rows[:, 2] == direction]
+
+def load_fio_log(
+    log_path: Path,
+    direction: int = None,
+    window_ms: float = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Load a fio per-I/O (or log_avg_msec averaged) log as NumPy time series.
+
+    Parameters:
+        log_path  -- path to the log (e.g. 'job_bw.1.log')
+        direction -- keep only 0 (read), 1 (write) or 2 (trim); None keeps all
+        window_ms -- aggregate into fixed windows of this length while
+                     streaming, instead of returning every sample
+
+    Returns:
+        Without window_ms: dict of 1D arrays keyed by FIO_LOG_COLUMNS (only the
+        columns present in the file); the parsed table is cached on disk and
+        memory-mapped on later loads.
+        With window_ms: dict with 'time_ms' (window start), 'count', 'sum',
+        'mean', 'min' and 'max' per window; windows without samples are
+        dropped.
+    """
+    if window_ms is None:
+        rows = _select_direction(_cached("fio_log", log_path, [], lambda: _parse_fio_log(log_path))[0], direction)
+        return {name: rows[:, i] for i, name in enumerate(FIO_LOG_COLUMNS[: rows.shape[1]])}
+
+    count = np.zeros(0)
+    total = np.zeros(0)
+    low = np.zeros(0)
+    high = np.zeros(0)
+    for block in iter_fio_log(log_path):
+        block = _select_direction(block, direction)
+        if not len(block):
+            continue
+        bins = (block[:, 0] // window_ms).astype(np.int64)
+        n = int(bins.max()) + 1
+        if n > len(count):
+            grow = n - len(count)
+            count = np.concatenate([count, np.zeros(grow)])
+            total = np.concatenate([total, np.zeros(grow)])
+            low = np.concatenate([low, np.full(grow, np.inf)])
+            high = np.concatenate([high, np.full(grow, -np.inf)])
+        count += np.bincount(bins, minlength=len(count))
+        total += np.bincount(bins, weights=block[:, 1], minlength=len(count))
+        np.minimum.at(low, bins, block[:, 1])
+        np.maximum.at(high, bins, block[:, 1])
+
+    used = count > 0
+    return {
+        "time_ms": np.flatnonzero(used) * float(window_ms),
+        "count": count[used],
+        "sum": total[used],
+        "mean": total[used] / count[used],
+        "min": low[used],
+        "max": high[used],
+    }
@@ -0,0 +1,398 @@
+"""Loaders for qperf CSV and Dolphin (dma_bench, scipp, scibench2) JSON results."""
+
+from __future__ import annotations
+
+import functools
+import io
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .cache import _cached
+from .deps import record_listing
+from .stats import RunStats
+from .units import _unit_from_key, parse_quantities, unit_of, with_unit
+
+
+# CSV loading function
+CSV_MISSING = "N/A"  # placeholder the qperf sweep scripts write for failed points
+
+def _read_csv_columns(csv_path: Path, keys: Sequence[str]) -> np.ndarray:
+    """
+    Parse the requested columns of a CSV file in a single bulk NumPy pass
+    (or fetch them from the on-disk cache).
+
+    Parameters:
+        csv_path -- path to the CSV file (first line is the header)
+        keys     -- column names to extract, in output order
+
+    Returns:
+        2D NumPy array of shape (num_rows, len(keys)); ``N/A`` fields are NaN
+    """
+    return _cached("csv", csv_path, keys, lambda: [_parse_csv_columns(csv_path, keys)])[0]
+
+def _parse_csv_columns(csv_path: Path, keys: Sequence[str]) -> np.ndarray:
+    with csv_path.open(newline="") as fh:
+        header = fh.readline().rstrip("\r\n").split(",")
+        body = fh.read()
+
+    try:
+        cols = [header.index(key) for key in keys]
+    except ValueError:
+        missing = [key for key in keys if key not in header]
+        raise KeyError(f"{csv_path}: no column(s) {missing}") from None
+
+    if not body.strip():
+        return np.empty((0, len(cols)))
+
+    return np.loadtxt(
+        io.StringIO(body.replace(CSV_MISSING, "nan")),
+        delimiter=",",
+        usecols=cols,
+        dtype=float,
+        ndmin=2,
+    )
+
+def load_csv_column(csv_path: Path, key: str) -> np.ndarray:
+    """
+    Load a single column from a CSV file as a 1D NumPy array of floats.
+    Missing measurements (``N/A``) are returned as NaN so that rows stay
+    aligned with the message sizes of the sweep.
+    """
+    return _read_csv_columns(csv_path, [key])[:, 0]
+
+# Directory ingestion
+def _map_files(func: Callable, files: List[Path], workers: int = 1, processes: bool = False) -> list:
+    """
+    Apply `func` to every file and return the results in the order of `files`.
+
+    Parameters:
+        func      -- picklable per-file parser (a module-level function or partial)
+        files     -- files to parse, already sorted
+        workers   -- size of the worker pool; 1 parses serially, 0 uses every core
+        processes -- use a process pool (CPU-bound decoding) instead of threads (I/O)
+    """
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(files))
+    if workers <= 1:
+        return [func(file) for file in files]
+
+    # Imported here: the pools (multiprocessing in particular) are only needed
+    # for parallel ingestion and would otherwise dominate import time
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    if processes:
+        chunksize = max(1, len(files) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, files, chunksize=chunksize))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, files))
+
+def _run_files(directory: Path, pattern: str) -> List[Path]:
+    record_listing(directory, pattern)
+    return [file for file in sorted(Path(directory).glob(pattern)) if file.is_file()]
+
+def load_csv_columns(
+    directory: Path, keys: Sequence[str], workers: int = 1
+) -> Dict[str, np.ndarray]:
+    """
+    Load several columns from all CSV files in the directory, reading each
+    file only once.
+
+    Parameters:
+        directory -- directory holding the run*.csv files, or one CSV file
+                     (a single run)
+        keys      -- column names to extract (e.g. ['tcp_bw', 'tcp_lat'])
+        workers   -- threads used to read files concurrently (0 = all cores)
+
+    Returns:
+        dict mapping each key to a 2D NumPy array of shape
+        (num_files, num_elements_per_file)
+    """
+    read = functools.partial(_read_csv_columns, keys=keys)
+    files = [Path(directory)] if Path(directory).is_file() else _run_files(directory, "*.csv")
+    tables = _map_files(read, files, workers)
+    return {key: np.array([t[:, i] for t in tables]) for i, key in enumerate(keys)}
+
+def load_csv(directory: Path, key: str, workers: int = 1) -> np.ndarray:
+    """
+    Load a specified column from all CSV files in the directory.
+    Returns a 2D NumPy array of shape (num_files, num_elements_per_file).
+    """
+    return load_csv_columns(directory, [key], workers)[key]
+
+def load_csv_aligned_columns(
+    directory: Path, keys: Sequence[str], size_key: str = "message_size", workers: int = 1
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Load several columns from all CSV files in the directory as dense
+    runs x sizes matrices, with each value placed by its message size.
+
+    Runs of an adaptive sweep may hold different (non power-of-two) sizes;
+    a run without a size gets NaN there, so the matrices stay aligned.
+
+    Parameters:
+        directory -- directory holding the run*.csv files
+        keys      -- column names to extract (e.g. ['tcp_bw', 'tcp_lat'])
+        size_key  -- column holding the message size
+        workers   -- threads used to read files concurrently (0 = all cores)
+
+    Returns:
+        (sizes, data) -- sorted 1D array of every message size seen, and a dict
+                         mapping each key to a (num_files, len(sizes)) array
+    """
+    read = functools.partial(_read_csv_columns, keys=[size_key, *keys])
+    tables = _map_files(read, _run_files(directory, "*.csv"), workers)
+    return _align_runs([(t[:, 0], *t[:, 1:].T) for t in tables], keys)
+
+def _align_runs(
+    runs: List[Sequence[np.ndarray]], keys: Sequence[str]
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Place per-run (sizes, values_key0, ...) arrays on the union of all sizes."""
+    sizes = np.unique(np.concatenate([run[0] for run in runs])) if runs else np.empty(0)
+    data = {key: np.full((len(runs), len(sizes)), np.nan) for key in keys}
+
+    for row, (run_sizes, *run_values) in enumerate(runs):
+        cols = np.searchsorted(sizes, run_sizes)
+        for key, vals in zip(keys, run_values):
+            data[key][row, cols] = vals
+    return sizes, data
+
+def _read_dolphin_columns(
+    json_path: Path, keys: Sequence[str], si: bool = False
+) -> Dict[str, np.ndarray]:
+    """
+    Decode a Dolphin-style JSON file once and extract every requested key.
+
+    Entries lacking a key (or holding non-numeric data) are skipped for that
+    key only, exactly as in load_dolphin_column.
+    """
+    arrays = _cached(
+        "dolphin", json_path, [keys, si], lambda: _parse_dolphin_columns(json_path, keys, si)
+    )
+    return dict(zip(keys, arrays))
+
+def _parse_dolphin_columns(json_path: Path, keys: Sequence[str], si: bool) -> List[np.ndarray]:
+    with json_path.open() as f:
+        doc = json.load(f)
+
+    entries = list(doc["results"].get("loop 0", {}).values())
+    arrays = []
+
+    for key in keys:
+        raw = [entry[key] for entry in entries if key in entry]
+        values = parse_quantities(raw, _unit_from_key(key), si)
+        arrays.append(values[~np.isnan(values)])
+
+    return arrays
+
+def load_dolphin_column(json_path: Path, key: str, si: bool = False) -> np.ndarray:
+    """
+    Load one column of values from a Dolphin-style JSON file.
+
+    Parameters:
+        json_path -- path to the JSON file
+        key       -- key to extract (e.g., 'Throughput', 'Average Send Latency')
+        si        -- convert to SI units (B/s, s) and tag the array (see to_unit)
+
+    Returns:
+        1D NumPy array of values
+    """
+    return _read_dolphin_columns(json_path, [key], si)[key]
+
+def load_dolphin_columns(
+    directory: Path, keys: Sequence[str], workers: int = 1, si: bool = False
+) -> Dict[str, np.ndarray]:
+    """
+    Load several columns from all Dolphin JSON files in the directory,
+    decoding each file only once.
+
+    Parameters:
+        directory -- directory holding the run*.json files
+        keys      -- keys to extract (e.g. ['Transfer time', 'Bandwidth'])
+        workers   -- processes used to decode files in parallel (0 = all cores)
+        si        -- convert to SI units (B/s, s) and tag the arrays (see to_unit)
+
+    Returns:
+        dict mapping each key to a 2D NumPy array of shape
+        (num_files, num_elements_per_file)
+
+    Raises:
+        ValueError -- if the runs hold different numbers of values for a key
+                      (e.g. a truncated run); load_dolphin_aligned_columns
+                      places such runs by message size instead
+    """
+    read = functools.partial(_read_dolphin_columns, keys=keys, si=si)
+    docs = _map_files(read, _run_files(directory, "*.json"), workers, processes=True)
+    return {key: _stack_runs([doc[key] for doc in docs], f"{directory}: '{key}'") for key in keys}
+
+def _stack_runs(runs: List[np.ndarray], what: str) -> np.ndarray:
+    """np.array(runs), keeping the unit the per-file arrays were tagged with."""
+    lengths = sorted({len(run) for run in runs})
+    if len(lengths) > 1:
+        raise ValueError(
+            f"{what} has between {lengths[0]} and {lengths[-1]} values per run (truncated run?); "
+            f"use load_dolphin_aligned to place the values by message size"
+        )
+    data = np.array(runs)
+    unit = unit_of(runs[0]) if runs else None
+    return data if unit is None else with_unit(data, unit)
+
+def load_dolphin(directory: Path, key: str, workers: int = 1, si: bool = False) -> np.ndarray:
+    """
+    Load the specified column from all files in the directory using load_dolphin_column.
+    Returns a 2D NumPy array with shape (num_files, num_elements_per_file);
+    raises ValueError for runs of different lengths (see load_dolphin_aligned).
+    """
+    return load_dolphin_columns(directory, [key], workers, si)[key]
+
+
+
+# Fields holding the message size in the various Dolphin tools
+# (dma_bench, scipp and scibench2 respectively)
+DOLPHIN_SIZE_KEYS = ("Message size", "size", "Segment size")
+
+def _read_dolphin_sized(json_path: Path, keys: Sequence[str], si: bool = False) -> List[np.ndarray]:
+    """
+    Extract the message sizes of a Dolphin JSON file together with the
+    requested keys, aligned entry by entry.
+
+    Returns:
+        [sizes, values_key0, values_key1, ...] -- 1D float arrays of equal
+        length; values that are missing or non-numeric are NaN
+    """
+    return _cached(
+        "dolphin_sized", json_path, [keys, si], lambda: _parse_dolphin_sized(json_path, keys, si)
+    )
+
+def _parse_dolphin_sized(json_path: Path, keys: Sequence[str], si: bool) -> List[np.ndarray]:
+    with json_path.open() as f:
+        doc = json.load(f)
+
+    loop_data = doc["results"].get("loop 0", {})
+    sizes = []
+    values = [[] for _ in keys]
+
+    for entry in loop_data.values():
+        size_key = next((k for k in DOLPHIN_SIZE_KEYS if k in entry), None)
+        try:
+            size = float(entry[size_key])
+        except (KeyError, ValueError):
+            continue  # entry without a usable size cannot be placed
+
+        sizes.append(size)
+        for col, key in zip(values, keys):
+            col.append(entry.get(key, ""))  # parsed to NaN below
+
+    return [np.array(sizes, dtype=float)] + [
+        parse_quantities(col, _unit_from_key(key), si) for col, key in zip(values, keys)
+    ]
+
+def load_dolphin_aligned_columns(
+    directory: Path, keys: Sequence[str], workers: int = 1, si: bool = False
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Load several keys from all Dolphin JSON files in the directory as dense
+    runs x sizes matrices, with each value placed by its message size.
+
+    Runs that are truncated or skip a size get NaN in that position instead
+    of shifting the remaining values, so the result is always a float matrix.
+
+    Parameters:
+        directory -- directory holding the run*.json files
+        keys      -- keys to extract (e.g. ['Transfer time', 'Bandwidth'])
+        workers   -- processes used to decode files in parallel (0 = all cores)
+        si        -- convert to SI units (B/s, s) and tag the arrays (see to_unit)
+
+    Returns:
+        (sizes, data) -- sorted 1D array of every message size seen, and a dict
+                         mapping each key to a (num_files, len(sizes)) array
+    """
+    read = functools.partial(_read_dolphin_sized, keys=keys, si=si)
+    runs = _map_files(read, _run_files(directory, "*.json"), workers, processes=True)
+
+    sizes, data = _align_runs(runs, keys)
+    if si and runs:
+        data = {key: with_unit(data[key], unit_of(vals)) for key, vals in zip(keys, runs[0][1:])}
+    return sizes, data
+
+def load_dolphin_aligned(
+    directory: Path, key: str, workers: int = 1, si: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Load one key from all Dolphin JSON files in the directory as a dense
+    runs x sizes matrix (see load_dolphin_aligned_columns).
+
+    Returns:
+        (sizes, data) -- 1D size axis and 2D array of shape (num_files, len(sizes))
+    """
+    sizes, data = load_dolphin_aligned_columns(directory, [key], workers, si)
+    return sizes, data[key]
+
+
+# Run files are recorded in RunStats.sources by their path below benchmarks/
+# (the tree catalog.py indexes), so run5.csv of two directories stay apart and
+# a saved accumulator still matches after the checkout moves
+_BENCHMARKS_DIR = Path(os.environ.get(
+    "PLOT_BENCHMARKS_DIR", Path(__file__).resolve().parent.parent.parent / "benchmarks"))
+
+def _source_name(file: Path) -> str:
+    """Key of a run file in RunStats.sources: relative to benchmarks/, else absolute."""
+    path = Path(file).resolve()
+    try:
+        return path.relative_to(_BENCHMARKS_DIR.resolve()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+def accumulate_runs(
+    directory: Path,
+    key: str,
+    stats: RunStats = None,
+    loader: str = "csv",
+    size_key: str = None,
+    si: bool = False,
+) -> RunStats:
+    """
+    Fold the run files of a directory into a streaming accumulator.
+
+    Files already recorded in `stats.sources` (by their path below
+    benchmarks/) are skipped, so calling this again (e.g. on an accumulator
+    restored with RunStats.load) only reads the runs that landed since.  Values are placed by message size.
+
+    Parameters:
+        directory -- directory holding the run*.csv or run*.json files
+        key       -- column (csv) or key (dolphin) to accumulate
+        stats     -- accumulator to update (default: a new RunStats)
+        loader    -- "csv" (qperf) or "dolphin"
+        size_key  -- csv size column (default 'message_size')
+        si        -- dolphin only: convert to SI units and tag the statistics
+
+    Returns:
+        the updated accumulator
+    """
+    stats = RunStats() if stats is None else stats
+    if loader == "csv":
+        pattern = "*.csv"
+        read = functools.partial(_read_csv_columns, keys=[size_key or "message_size", key])
+    elif loader == "dolphin":
+        pattern = "*.json"
+        read = functools.partial(_read_dolphin_sized, keys=[key], si=si)
+    else:
+        raise ValueError(f"unknown loader '{loader}'")
+
+    for file in _run_files(directory, pattern):
+        source = _source_name(file)
+        if source in stats.sources:
+            continue
+        if loader == "csv":
+            table = read(file)
+            stats.update(table[:, 1], sizes=table[:, 0])
+        else:
+            sizes, values = read(file)
+            stats.update(values, sizes=sizes)
+        stats.sources.add(source)
+    return stats
@@ -0,0 +1,274 @@
+"""matplotlib helpers: palette, figure layout, styled lines and labels."""
+
+from __future__ import annotations
+
+import matplotlib as mpl
+import matplotlib.figure
+import matplotlib.pyplot as plt
+import matplotlib.ticker as ticker
+import numpy as np
+from pathlib import Path
+from matplotlib.ticker import FuncFormatter
+
+from .deps import record_output
+from .draft import DRAFT_DPI, DRAFT_SUFFIX, draft_mode
+
+
+# Custom colors for plotting
+palette = {
+    "eth":    "#FAB900",  # BeeGFS
+    "eth2":   "#FFC92E",  # BeeGFS light
+    "dis":    "#389E9B",  # Dolphin
+    "dis2":   "#4ABFBB",  # Dolphin light
+    "ssocks": "#DD0001",  # UiO
+    "ssocks2": "#FF1112", # UiO light
+    "sisci":  "#CF24AA",  # Pink
+    "sisci2": "#DF47BE",  # Pink light
+    "ib":     "#76B900",  # Nvidia
+    "ib2":    "#97EC00",  # Nvidia light
+}
+
+
+def set_log_byte_ticks(
+    ax,
+    start_exp: int,
+    end_exp: int,
+    axis: str = "x",
+    rotation: float = 0
+) -> None:
+    """
+    Set log-scale ticks on the specified axis to powers of 2 with human-readable
+    byte labels (B, KiB, MiB, GiB), with optional label rotation.
+
+    Parameters:
+        ax        -- matplotlib Axes object
+        start_exp -- starting exponent (e.g. 6 for 64 B)
+        end_exp   -- ending exponent (e.g. 33 for 8 GiB)
+        axis      -- 'x' or 'y' (default: 'x')
+        rotation  -- tick label rotation angle in degrees (default: 0)
+    """
+    if axis not in ("x", "y"):
+        raise ValueError("axis must be 'x' or 'y'")
+
+    ticks = [2 ** i for i in range(start_exp, end_exp + 1)]
+
+    def format_bytes(x, _):
+        if x >= 2**30:
+            return f"{int(x / 2**30)} GiB"
+        elif x >= 2**20:
+            return f"{int(x / 2**20)} MiB"
+        elif x >= 2**10:
+            return f"{int(x / 2**10)} KiB"
+        else:
+            return f"{int(x)} B"
+
+    formatter = FuncFormatter(format_bytes)
+
+    if axis == "x":
+        ax.set_xscale("log", base=2)
+        ax.set_xticks(ticks)
+        ax.xaxis.set_major_formatter(formatter)
+        for label in ax.get_xticklabels():
+            label.set_rotation(rotation)
+    else:
+        ax.set_yscale("log", base=2)
+        ax.set_yticks(ticks)
+        ax.yaxis.set_major_formatter(formatter)
+        for label in ax.get_yticklabels():
+            label.set_rotation(rotation)
+
+
+# LaTeX-compatible matplotlib style
+def apply_palatino_style(font_size: int = 14, tick_size: int = 12) -> None:
+    """
+    Apply a LaTeX-compatible matplotlib style using Palatino fonts and custom sizes.
+    In draft mode (see draft_mode) text goes through mathtext with a Palatino
+    clone instead of LaTeX; sizes, and therefore the layout, stay the same.
+
+    Parameters:
+        font_size -- Base font size for axes and labels
+        tick_size -- Font size for tick labels
+    """
+    mpl.rcParams.update({
+        "text.usetex": True,
+        "font.family": "serif",
+        "font.serif": ["Palatino"],
+        "text.latex.preamble": r"\usepackage{mathpazo}",
+        "pdf.fonttype": 42,
+        "ps.fonttype": 42,
+
+        "font.size":       font_size,
+        "axes.titlesize":  font_size,
+        "axes.labelsize":  font_size,
+        "xtick.labelsize": tick_size,
+        "ytick.labelsize": tick_size,
+        "legend.fontsize": font_size,
+    })
+    if draft_mode():
+        mpl.rcParams.update({
+            "text.usetex": False,
+            "font.serif": ["TeX Gyre Pagella", "P052", "URW Palladio L",
+                           "Palatino", "Palatino Linotype", "DejaVu Serif"],
+            "mathtext.fontset": "custom",
+            "mathtext.rm": "serif",
+            "mathtext.it": "serif:italic",
+            "mathtext.bf": "serif:bold",
+            "mathtext.sf": "serif",
+            "mathtext.cal": "serif:italic",
+        })
+
+
+# Standardized figure and axis creation
+def standard_ax(ax_w: float = 8, ax_h: float = 2.5, margin: float = 2.0):
+    """
+    Create a matplotlib figure with standardized axis sizing and proportional margins.
+
+    Parameters:
+        ax_w  -- width of the plotting area (in inches)
+        ax_h  -- height of the plotting area (in inches)
+        margin -- size of each margin (left, right, top, bottom) in inches
+
+    Returns:
+        (fig, ax) -- Matplotlib figure and axis objects
+    """
+    fig_w = ax_w + 2 * margin
+    fig_h = ax_h + 2 * margin
+    fig = plt.figure(figsize=(fig_w, fig_h))
+
+    left   = margin / fig_w
+    bottom = margin / fig_h
+    width  = ax_w   / fig_w
+    height = ax_h   / fig_h
+
+    ax = fig.add_axes([left, bottom, width, height])
+    # ax.legend(frameon=False)
+    return fig, ax
+
+
+def plot_line(
+    ax,
+    x: np.ndarray,
+    y: np.ndarray,
+    color: str,
+    label: str,
+    lw: float = 1.8,
+    ms: float = 5,
+    linestyle: str = "-",
+    marker: str = "o",
+) -> None:
+    """
+    Plot a styled line with optional line width and marker size.
+
+    Parameters:
+        ax    -- matplotlib Axes object
+        x     -- x-axis data
+        y     -- y-axis data
+        color -- line color
+        label -- legend label
+        lw    -- line width (default: 1.8)
+        ms    -- marker size (default: 5)
+    """
+    ax.plot(x, y, color=color, label=label, lw=lw, ms=ms,
+            linestyle=linestyle, marker=marker)
+
+
+# Save figure with directory creation
+
+def save_fig(fig: matplotlib.figure.Figure, ax: mpl.axes.Axes, filename: str) -> None:
+    """
+    Save a matplotlib figure to the given file path, creating directories as needed.
+    In draft mode a low-resolution PNG is written next to it instead
+    (e.g. "img/plot.draft.png"), leaving the publication PDF untouched.
+
+    Parameters:
+        fig      -- Matplotlib Figure object
+        ax       -- Matplotlib Axes object
+        filename -- Full file path as string (e.g., "img/plot.pdf")
+    """
+    path = Path(filename)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ax.legend(frameon=False)
+    if draft_mode():
+        path = path.with_suffix(DRAFT_SUFFIX)
+        fig.savefig(path, dpi=DRAFT_DPI, bbox_inches="tight", pad_inches=0)
+    else:
+        fig.savefig(path, dpi=300, bbox_inches="tight", pad_inches=0)
+    record_output(path)
+    print(f"Saved figure to {path}")
+
+# Set LaTeX-formatted axis labels
+def set_axis_labels(ax, xlabel: str, ylabel: str) -> None:
+    """
+    Set LaTeX-formatted axis labels with bold text.
+
+    Parameters:
+        ax      -- matplotlib Axes object
+        xlabel  -- x-axis label as LaTeX string
+        ylabel  -- y-axis label as LaTeX string
+    """
+    if draft_mode():
+        ax.set_xlabel(_draft_text(xlabel), fontweight="bold")
+        ax.set_ylabel(_draft_text(ylabel), fontweight="bold")
+        return
+    ax.set_xlabel(rf"\textbf{{{xlabel}}}")
+    ax.set_ylabel(rf"\textbf{{{ylabel}}}")
+
+# Text-mode LaTeX macros used in labels and their mathtext/Unicode equivalents
+_DRAFT_MACROS = {
+    "\\textmu ": "µ",
+    "\\textmu": "µ",
+    "\\%": "%",
+    "\\&": "&",
+}
+
+def _draft_text(text: str) -> str:
+    """Make a label written for usetex renderable by mathtext."""
+    for macro, replacement in _DRAFT_MACROS.items():
+        text = text.replace(macro, replacement)
+    return text
+
+
+def plot_std_fill(ax, x, mean, std, color, alpha=0.2, label=None):
+    """
+    Plot shaded area representing standard deviation around the mean.
+
+    Parameters:
+        ax    : matplotlib Axes object
+        x     : x-axis values (e.g., message sizes)
+        mean  : mean values (same length as x)
+        std   : standard deviation values (same length as x)
+        color : color of the shaded region
+        alpha : transparency (default 0.2)
+        label : optional label for the shaded area
+    """
+    ax.fill_between(
+        x,
+        mean - std,
+        mean + std,
+        color=color,
+        alpha=alpha,
+        label=label,
+    )
+
+
+def plot_ci_fill(ax, x, low, high, color, alpha=0.2, label=None):
+    """
+    Plot shaded area between the bounds of a confidence interval.
+
+    Parameters:
+        ax    : matplotlib Axes object
+        x     : x-axis values (e.g., message sizes)
+        low   : lower bounds (same length as x), e.g. from bootstrap_ci
+        high  : upper bounds (same length as x)
+        color : color of the shaded region
+        alpha : transparency (default 0.2)
+        label : optional label for the shaded area
+    """
+    ax.fill_between(
+        x,
+        low,
+        high,
+        color=color,
+        alpha=alpha,
+        label=label,
+    )
@@ -0,0 +1,439 @@
+"""Statistics over runs x sizes matrices."""
+
+from __future__ import annotations
+
+import json
+import os
+import warnings
+from pathlib import Path
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from .units import unit_of, with_unit
+
+
+# Generate numpy array of powers of two
+def powers_of_two(n: int, m: int) -> np.ndarray:
+    return 2 ** np.arange(n, m + 1)
+
+
+# Robust estimators
+#
+# One-off spikes (a cold first connection, an interrupt storm) inflate the
+# plain std.  The robust methods below work on the whole runs x sizes matrix
+# at once: quantiles come from one sort along the runs axis, and samples a
+# method discards are masked in a np.ma.MaskedArray instead of being removed
+# in a Python loop.
+STATS_METHODS = ("mean", "median", "trimmed", "iqr")
+MAD_TO_STD = 1.482602218505602  # MAD of a normal distribution, in standard deviations
+
+
+def flag_outliers(array: np.ndarray, k: float = 1.5) -> np.ma.MaskedArray:
+    """
+    Mask the samples of each column outside [Q1 - k*IQR, Q3 + k*IQR].
+
+    Returns:
+        masked array of the values; NaN entries are masked as well, so
+        `result.mask & ~np.isnan(array)` are the flagged outliers
+    """
+    data = np.asarray(array, dtype=float)
+    q1 = _nanquantile_sorted(data, 0.25, axis=0)
+    q3 = _nanquantile_sorted(data, 0.75, axis=0)
+    spread = k * (q3 - q1)
+    with np.errstate(invalid="ignore"):
+        outside = (data < q1 - spread) | (data > q3 + spread)
+    return np.ma.masked_array(data, mask=outside | np.isnan(data))
+
+
+def _trim(data: np.ndarray, trim: float) -> np.ma.MaskedArray:
+    """Mask the floor(trim * n) lowest and highest samples of each column."""
+    order = np.argsort(data, axis=0)  # NaNs sort last
+    ranked = np.take_along_axis(data, order, axis=0)
+    count = np.sum(~np.isnan(data), axis=0)
+    cut = np.floor(trim * count).astype(np.intp)
+    rank = np.arange(len(data))[:, None]
+    drop = (rank < cut) | (rank >= count - cut) | np.isnan(ranked)
+    return np.ma.masked_array(ranked, mask=drop)
+
+
+def stats_2d(
+    array: np.ndarray, method: str = "mean", trim: float = 0.1, k: float = 1.5
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute column-wise center, spread and variance of a 2D NumPy array
+    (runs x sizes).  NaN entries (missing measurements) are ignored; a column
+    without any measurement yields NaN.
+
+    Parameters:
+        array  -- runs x sizes matrix
+        method -- "mean":    mean and standard deviation of every sample
+                  "median":  median and MAD scaled to a standard deviation
+                  "trimmed": mean and std without the `trim` fraction of
+                             lowest and highest samples per size
+                  "iqr":     mean and std without the samples flag_outliers
+                             marks (factor `k`)
+        trim   -- fraction cut from each tail for "trimmed" (default 0.1)
+        k      -- IQR factor for "iqr" (default 1.5)
+
+    Returns:
+        mean:     1D array of column-wise centers
+        std_dev:  1D array of column-wise standard deviations
+        variance: 1D array of column-wise variances
+    """
+    if method not in STATS_METHODS:
+        raise ValueError(f"unknown method '{method}', expected one of {STATS_METHODS}")
+    unit = unit_of(array)
+    array = np.asarray(array, dtype=float)
+    with warnings.catch_warnings():
+        # All-NaN columns are expected for sizes a run set never reached
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if method == "mean":
+            mean = np.nanmean(array, axis=0)
+            std_dev = np.nanstd(array, axis=0)
+            variance = np.nanvar(array, axis=0)
+        elif method == "median":
+            mean = _nanquantile_sorted(array, 0.5, axis=0)
+            std_dev = MAD_TO_STD * _nanquantile_sorted(np.abs(array - mean), 0.5, axis=0)
+            variance = std_dev**2
+        else:
+            kept = _trim(array, trim) if method == "trimmed" else flag_outliers(array, k)
+            mean = kept.mean(axis=0).filled(np.nan)
+            std_dev = kept.std(axis=0).filled(np.nan)
+            variance = kept.var(axis=0).filled(np.nan)
+    if unit is not None:
+        mean, std_dev = with_unit(mean, unit), with_unit(std_dev, unit)
+    return mean, std_dev, variance
+
+
+def _nanquantile_sorted(array: np.ndarray, q: float, axis: int) -> np.ndarray:
+    """
+    Linear-interpolated quantile `q` along `axis`, ignoring NaNs.
+
+    np.nanmedian/np.nanpercentile fall back to per-column loops once NaNs are
+    present; sorting puts NaNs last, so the finite count per column gives the
+    interpolation indices for every column at once.
+    """
+    array = np.sort(array, axis=axis)
+    count = np.sum(~np.isnan(array), axis=axis, keepdims=True)
+    pos = q * np.maximum(count - 1, 0)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.ceil(pos).astype(np.intp)
+    a_lo = np.take_along_axis(array, lo, axis=axis)
+    a_hi = np.take_along_axis(array, hi, axis=axis)
+    result = a_lo + (a_hi - a_lo) * (pos - lo)
+    result = np.where(count > 0, result, np.nan)
+    return np.squeeze(result, axis=axis)
+
+
+def bootstrap_ci(
+    runs: np.ndarray,
+    stat: str = "mean",
+    confidence: float = 0.95,
+    n_resamples: int = 2000,
+    seed: int = 0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Percentile-bootstrap confidence interval of the column-wise mean or median.
+
+    Every series and message size is resampled in one batched tensor of shape
+    (series, resamples, runs, sizes) drawn from a single generator, so results
+    are reproducible for a given seed.  NaN entries (missing measurements) are
+    ignored like in stats_2d; series with fewer runs are padded with all-NaN
+    rows, which are never drawn.
+
+    Parameters:
+        runs        -- (num_runs, num_sizes) matrix, or a stack of them
+                       (num_series, num_runs, num_sizes)
+        stat        -- "mean" or "median"
+        confidence  -- coverage of the interval (default 0.95)
+        n_resamples -- bootstrap resamples (default 2000)
+        seed        -- RNG seed (default 0)
+
+    Returns:
+        estimate, low, high -- arrays of shape (num_sizes,) or
+                               (num_series, num_sizes), in the unit of `runs`
+    """
+    if stat not in ("mean", "median"):
+        raise ValueError(f"unknown statistic '{stat}', expected 'mean' or 'median'")
+    unit = unit_of(runs)
+    data = np.asarray(runs, dtype=float)
+    single = data.ndim == 2
+    if single:
+        data = data[None]
+    num_series, num_runs, _ = data.shape
+
+    # Move the runs holding any measurement to the front of each series
+    valid = ~np.all(np.isnan(data), axis=2)
+    counts = valid.sum(axis=1)
+    order = np.argsort(~valid, axis=1, kind="stable")
+    data = np.take_along_axis(data, order[:, :, None], axis=1)
+
+    # Resample b of series s draws counts[s] of its runs; later slots are masked
+    rng = np.random.default_rng(seed)
+    uniform = rng.random((n_resamples, num_runs))
+    index = (uniform[None] * counts[:, None, None]).astype(np.intp)
+    samples = data[np.arange(num_series)[:, None, None], index]
+    unused = np.arange(num_runs)[None, :] >= counts[:, None]
+    samples[np.broadcast_to(unused[:, None, :], index.shape)] = np.nan
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if stat == "mean":
+            estimate = np.nanmean(data, axis=1)
+            boot = np.nanmean(samples, axis=2)
+        else:
+            estimate = _nanquantile_sorted(data, 0.5, axis=1)
+            boot = _nanquantile_sorted(samples, 0.5, axis=2)
+    tail = (1 - confidence) / 2
+    low = _nanquantile_sorted(boot, tail, axis=1)
+    high = _nanquantile_sorted(boot, 1 - tail, axis=1)
+
+    if single:
+        estimate, low, high = estimate[0], low[0], high[0]
+    if unit is not None:
+        estimate, low, high = (with_unit(arr, unit) for arr in (estimate, low, high))
+    return estimate, low, high
+
+
+def bootstrap_cis(
+    runs: List[np.ndarray], **kwargs
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    bootstrap_ci for several run matrices of different shapes in one batch.
+
+    The matrices are NaN-padded to a common (num_runs, num_sizes) and stacked;
+    keyword arguments are passed on to bootstrap_ci.
+
+    Returns:
+        one (estimate, low, high) triple per matrix, trimmed to its sizes
+    """
+    if not runs:
+        return []
+    num_runs = max(np.shape(arr)[0] for arr in runs)
+    num_sizes = max(np.shape(arr)[1] for arr in runs)
+    stack = np.full((len(runs), num_runs, num_sizes), np.nan)
+    for i, arr in enumerate(runs):
+        stack[i, : arr.shape[0], : arr.shape[1]] = np.asarray(arr, dtype=float)
+    estimate, low, high = bootstrap_ci(stack, **kwargs)
+
+    result = []
+    for i, arr in enumerate(runs):
+        unit = unit_of(arr)
+        triple = (estimate[i, : arr.shape[1]], low[i, : arr.shape[1]], high[i, : arr.shape[1]])
+        result.append(tuple(with_unit(t, unit) for t in triple) if unit is not None else triple)
+    return result
+
+
+# Streaming statistics
+#
+# Soak campaigns append run after run; RunStats folds runs into per-size
+# count/mean/M2/min/max and a log-bucketed quantile sketch (DDSketch-style:
+# every bucket spans a factor gamma, so quantiles carry a bounded relative
+# error) without keeping the runs.  Two accumulators merge exactly -- the
+# merged state is the one that accumulating both inputs would give, up to
+# floating-point rounding of the moments.
+class RunStats:
+    """
+    Mergeable one-pass statistics over runs x sizes data in O(sizes) memory.
+
+    Columns are placed by message size when `sizes` are passed to update()
+    (new sizes extend the axis), otherwise by position.  NaN entries are
+    skipped like in stats_2d; non-positive values count as 0 in the sketch.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self._log_gamma = np.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        self.sizes = None  # size axis, or None for positional columns
+        self.unit = None
+        self.sources = set()  # run files folded in, by path below benchmarks/ (see accumulate_runs)
+        self.count = np.zeros(0, dtype=np.int64)
+        self.mean = np.zeros(0)
+        self.m2 = np.zeros(0)
+        self.min = np.zeros(0)
+        self.max = np.zeros(0)
+        self._zeros = np.zeros(0, dtype=np.int64)
+        self._bins = np.zeros((0, 0), dtype=np.int64)
+        self._offset = 0  # bucket index of _bins[:, 0]
+
+    # Layout
+    def _resize(self, num_sizes: int, columns: np.ndarray = None) -> None:
+        """Grow every state array to `num_sizes` columns, moving the old ones to `columns`."""
+        if columns is None:
+            columns = np.arange(len(self.count))
+        def grow(old, fill, dtype=float):
+            new = np.full((num_sizes,) + old.shape[1:], fill, dtype=dtype)
+            new[columns] = old
+            return new
+        self.count = grow(self.count, 0, np.int64)
+        self.mean = grow(self.mean, 0.0)
+        self.m2 = grow(self.m2, 0.0)
+        self.min = grow(self.min, np.inf)
+        self.max = grow(self.max, -np.inf)
+        self._zeros = grow(self._zeros, 0, np.int64)
+        self._bins = grow(self._bins, 0, np.int64)
+
+    def _columns(self, num_columns: int, sizes: np.ndarray = None) -> np.ndarray:
+        """State columns of the incoming data, extending the size axis as needed."""
+        if sizes is None:
+            if self.sizes is not None:
+                raise ValueError("accumulator is indexed by message size; pass sizes")
+            if num_columns > len(self.count):
+                self._resize(num_columns)
+            return np.arange(num_columns)
+
+        sizes = np.asarray(sizes, dtype=float)
+        if self.sizes is None:
+            if len(self.count):
+                raise ValueError("accumulator is positional; sizes cannot be added")
+            self.sizes = np.empty(0)
+        if not np.isin(sizes, self.sizes).all():
+            merged = np.union1d(self.sizes, sizes)
+            self._resize(len(merged), np.searchsorted(merged, self.sizes))
+            self.sizes = merged
+        return np.searchsorted(self.sizes, sizes)
+
+    def _bucket(self, values: np.ndarray) -> np.ndarray:
+        return np.ceil(np.log(values) / self._log_gamma).astype(np.int64)
+
+    def _extend_bins(self, low: int, high: int) -> None:
+        """Make the bucket range cover indices low..high."""
+        if self._bins.shape[1] == 0:
+            self._offset = int(low)
+        start = min(low, self._offset)
+        stop = max(high + 1, self._offset + self._bins.shape[1])
+        if (start, stop) != (self._offset, self._offset + self._bins.shape[1]):
+            bins = np.zeros((self._bins.shape[0], stop - start), dtype=np.int64)
+            bins[:, self._offset - start : self._offset - start + self._bins.shape[1]] = self._bins
+            self._bins, self._offset = bins, int(start)
+
+    def _check_unit(self, unit: Union[str, None]) -> None:
+        if self.count.sum() == 0 and self.unit is None:
+            self.unit = unit
+        elif unit != self.unit:
+            raise ValueError(f"cannot combine values in {unit} with values in {self.unit}")
+
+    # Updates
+    def update(self, runs: np.ndarray, sizes: np.ndarray = None) -> "RunStats":
+        """
+        Fold one run (1D) or a batch of runs (runs x sizes) into the statistics.
+
+        Parameters:
+            runs  -- values, NaN where a run has no measurement
+            sizes -- message size of each column (optional, see class docstring)
+        """
+        self._check_unit(unit_of(runs))
+        data = np.asarray(runs, dtype=float)
+        data = data[None] if data.ndim == 1 else data
+        cols = self._columns(data.shape[1], sizes)
+
+        finite = ~np.isnan(data)
+        n_b = finite.sum(axis=0)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mean_b = np.where(n_b > 0, np.nansum(data, axis=0) / np.maximum(n_b, 1), 0.0)
+            m2_b = np.nansum((data - mean_b) ** 2, axis=0)
+        min_b = np.min(np.where(finite, data, np.inf), axis=0)
+        max_b = np.max(np.where(finite, data, -np.inf), axis=0)
+        self._combine(cols, n_b, mean_b, m2_b, min_b, max_b)
+
+        # Sketch: bincount over (column, bucket) pairs of the positive values
+        row_cols = np.broadcast_to(cols, data.shape)
+        positive = finite & (data > 0)
+        np.add.at(self._zeros, row_cols[finite & ~positive], 1)
+        if positive.any():
+            buckets = self._bucket(data[positive])
+            self._extend_bins(buckets.min(), buckets.max())
+            width = self._bins.shape[1]
+            flat = row_cols[positive] * width + (buckets - self._offset)
+            self._bins += np.bincount(flat, minlength=self._bins.size).reshape(self._bins.shape)
+        return self
+
+    def _combine(self, cols, n_b, mean_b, m2_b, min_b, max_b) -> None:
+        """Chan et al.'s pairwise update of count/mean/M2 (plus min/max) on `cols`."""
+        n_a = self.count[cols]
+        n = n_a + n_b
+        delta = mean_b - self.mean[cols]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(n > 0, n_b / np.maximum(n, 1), 0.0)
+        self.mean[cols] += delta * weight
+        self.m2[cols] += m2_b + delta**2 * n_a * weight
+        self.count[cols] = n
+        self.min[cols] = np.minimum(self.min[cols], min_b)
+        self.max[cols] = np.maximum(self.max[cols], max_b)
+
+    def merge(self, other: "RunStats") -> "RunStats":
+        """Fold another accumulator (e.g. from another worker or directory) into this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge sketches with different relative accuracy")
+        if other.count.sum():
+            self._check_unit(other.unit)
+        cols = self._columns(len(other.count), other.sizes)
+        self._combine(cols, other.count, other.mean, other.m2, other.min, other.max)
+        self._zeros[cols] += other._zeros
+        if other._bins.shape[1]:
+            self._extend_bins(other._offset, other._offset + other._bins.shape[1] - 1)
+            start = other._offset - self._offset
+            self._bins[cols, start : start + other._bins.shape[1]] += other._bins
+        self.sources |= other.sources
+        return self
+
+    # Results
+    def _tag(self, array: np.ndarray) -> np.ndarray:
+        return array if self.unit is None else with_unit(array, self.unit)
+
+    def stats(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(mean, std_dev, variance) per size, like stats_2d over every run seen."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(self.count > 0, self.mean, np.nan)
+            variance = np.where(self.count > 0, self.m2 / self.count, np.nan)
+        return self._tag(mean), self._tag(np.sqrt(variance)), variance
+
+    def quantile(self, q: float) -> np.ndarray:
+        """
+        Estimate the q-quantile per size from the sketch (relative error within
+        relative_accuracy), clamped to the observed min/max.
+        """
+        counts = np.concatenate([self._zeros[:, None], self._bins], axis=1)
+        rank = q * (self.count - 1)
+        index = np.argmax(np.cumsum(counts, axis=1) > rank[:, None], axis=1)
+        gamma = np.exp(self._log_gamma)
+        value = 2 * gamma ** (index - 1 + self._offset) / (gamma + 1)
+        value = np.where(index == 0, 0.0, value)
+        value = np.clip(value, self.min, self.max)
+        return self._tag(np.where(self.count > 0, value, np.nan))
+
+    # Persistence
+    def save(self, path: Path) -> None:
+        """Write the accumulator to an .npz file (replaced atomically)."""
+        path = Path(path)
+        meta = {
+            "relative_accuracy": self.relative_accuracy,
+            "unit": self.unit,
+            "offset": self._offset,
+            "sources": sorted(self.sources),
+        }
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as fh:
+            np.savez(
+                fh, meta=np.array(json.dumps(meta)),
+                sizes=np.empty(0) if self.sizes is None else self.sizes,
+                positional=np.array(self.sizes is None),
+                count=self.count, mean=self.mean, m2=self.m2, min=self.min, max=self.max,
+                zeros=self._zeros, bins=self._bins,
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "RunStats":
+        """Read an accumulator written by save()."""
+        with np.load(path) as f:
+            meta = json.loads(str(f["meta"]))
+            acc = cls(meta["relative_accuracy"])
+            acc.sizes = None if f["positional"] else f["sizes"]
+            acc.count, acc.mean, acc.m2 = f["count"], f["mean"], f["m2"]
+            acc.min, acc.max = f["min"], f["max"]
+            acc._zeros, acc._bins = f["zeros"], f["bins"]
+        acc.unit, acc._offset, acc.sources = meta["unit"], meta["offset"], set(meta["sources"])
+        return acc
@@ -0,0 +1,160 @@
+"""Unit conversion constants and unit-tagged arrays."""
+
+from __future__ import annotations
+
+import re
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+
+# Constants
+MIB_TO_GB = 0.001048576  # 1 MiB in decimal gigabytes
+MB_TO_GB = 0.001  # 1 MB in decimal gigabytes
+KB_TO_MB = 0.001  # 1 KB in decimal megabytes
+
+# Units
+#
+# Loaders called with si=True convert values to a canonical SI unit and record
+# it in the array's dtype metadata; to_unit() then rescales for display.
+# Every known unit maps to (SI unit, factor to SI).
+UNITS = {
+    # Bandwidth
+    "B/s": ("B/s", 1.0),
+    "kB/s": ("B/s", 1e3), "KB/s": ("B/s", 1e3),
+    "MB/s": ("B/s", 1e6), "MB/sec": ("B/s", 1e6), "MBytes/s": ("B/s", 1e6),
+    "GB/s": ("B/s", 1e9), "GB/sec": ("B/s", 1e9), "GBytes/s": ("B/s", 1e9),
+    "KiB/s": ("B/s", 2.0**10),
+    "MiB/s": ("B/s", 2.0**20), "MiB/sec": ("B/s", 2.0**20),
+    "GiB/s": ("B/s", 2.0**30),
+    # Time
+    "s": ("s", 1.0), "sec": ("s", 1.0),
+    "ms": ("s", 1e-3), "msec": ("s", 1e-3),
+    "us": ("s", 1e-6), "usec": ("s", 1e-6), "µs": ("s", 1e-6),
+    "ns": ("s", 1e-9), "nsec": ("s", 1e-9),
+    # Size
+    "B": ("B", 1.0),
+    "KiB": ("B", 2.0**10), "MiB": ("B", 2.0**20), "GiB": ("B", 2.0**30),
+    "kB": ("B", 1e3), "KB": ("B", 1e3), "MB": ("B", 1e6), "GB": ("B", 1e9),
+    # Rate
+    "1/s": ("1/s", 1.0), "IOPS": ("1/s", 1.0),
+}
+
+def with_unit(array: np.ndarray, unit: str) -> np.ndarray:
+    """Return a float view of `array` tagged with `unit` in its dtype metadata."""
+    return np.asarray(array, dtype=float).view(np.dtype(float, metadata={"unit": unit}))
+
+def unit_of(array: np.ndarray) -> Union[str, None]:
+    """Return the unit recorded on `array`, or None if it carries none."""
+    meta = getattr(array, "dtype", None) is not None and array.dtype.metadata
+    return meta.get("unit") if meta else None
+
+def to_unit(array: np.ndarray, unit: str) -> np.ndarray:
+    """
+    Rescale an array loaded with si=True (or tagged by with_unit) to a display unit.
+
+    Parameters:
+        array -- array tagged with its unit (see with_unit)
+        unit  -- target unit, e.g. 'GB/s', 'MiB/s' or 'us'
+
+    Returns:
+        plain float array (no unit tag) in the requested unit
+    """
+    src = unit_of(array)
+    if src is None:
+        raise ValueError("array carries no unit; load it with si=True")
+    if unit not in UNITS:
+        raise ValueError(f"unknown unit {unit!r}")
+    src_si, src_factor = UNITS.get(src, (src, 1.0))
+    si_unit, factor = UNITS[unit]
+    if si_unit != src_si:
+        raise ValueError(f"cannot convert {src} to {unit}")
+    return np.asarray(array).view(np.float64) * src_factor / factor
+
+def _unit_from_key(key: str) -> Union[str, None]:
+    """Unit embedded in a field name, e.g. 'latency (usec)' or 't_avg[usec]'."""
+    m = re.search(r"[(\[]([^()\[\]]+)[)\]]\s*$", key)
+    return m.group(1) if m and m.group(1) in UNITS else None
+
+_QUANTITY = np.dtype([("value", float), ("unit", "U32")])
+
+def _split_quantities(strings: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split '<number> <unit>' strings into a float array (NaN when not numeric)
+    and an array of unit names ('' when absent).
+
+    The common cases (every entry with a unit, or every entry a bare number)
+    are parsed by np.loadtxt in C; anything else falls back to a Python loop.
+    """
+    if not any(str(s).strip() for s in strings):
+        return np.full(len(strings), np.nan), np.full(len(strings), "")
+    try:
+        table = np.loadtxt(strings, dtype=_QUANTITY, comments=None, ndmin=1)
+        if len(table) == len(strings):  # loadtxt silently drops blank lines
+            return table["value"], table["unit"]
+    except (ValueError, TypeError):
+        pass
+    try:
+        values = np.loadtxt(strings, dtype=float, comments=None, ndmin=1)
+        if values.ndim == 1 and len(values) == len(strings):
+            return values, np.full(len(values), "")
+    except (ValueError, TypeError):
+        pass
+
+    parts = [str(s).strip().partition(" ") for s in strings]
+    values = np.array([_to_float(number) for number, _, _ in parts], dtype=float)
+    return values, np.array([unit.strip() for _, _, unit in parts], dtype=str)
+
+def _to_float(s: str) -> float:
+    try:
+        return float(s)
+    except ValueError:
+        return np.nan
+
+def parse_quantities(
+    strings: Sequence[str], default_unit: str = None, si: bool = False
+) -> np.ndarray:
+    """
+    Parse strings like '8.83 MBytes/s' or '7.24 us' in one vectorized pass.
+
+    Parameters:
+        strings      -- values as written by the Dolphin tools
+        default_unit -- unit of values that carry none (e.g. from the field name)
+        si           -- convert to the canonical SI unit and tag the result
+
+    Returns:
+        1D float array; entries that are not numbers are NaN. With si=False
+        only the numeric part is returned, exactly as written. Blank entries
+        are NaN and do not take part in the unit checks.
+    """
+    if len(strings) == 0:
+        empty = np.empty(0)
+        return with_unit(empty, UNITS[default_unit][0]) if si and default_unit else empty
+
+    values, unit_names = _split_quantities(strings)
+    if not si:
+        return values
+
+    # Blank entries (a missing field in a truncated run) are NaN whatever their unit
+    present = ~(np.isnan(values) & (unit_names == ""))
+    if not present.any():
+        return with_unit(values, UNITS[default_unit][0]) if default_unit in UNITS else values
+    if (unit_names[present] == unit_names[present][0]).all():
+        names, inverse = unit_names[present][:1], np.zeros(len(unit_names), dtype=int)
+    else:
+        names, inverse = np.unique(np.where(present, unit_names, unit_names[present][0]),
+                                   return_inverse=True)
+    names = [str(name) or default_unit for name in names]
+    if None in names:
+        if names == [None]:
+            return values  # bare numbers of unknown dimension: nothing to convert
+        raise ValueError(f"values without a unit mixed with {sorted(filter(None, names))}")
+    unknown = [name for name in names if name not in UNITS]
+    if unknown:
+        raise ValueError(f"unknown unit(s) {unknown}")
+    si_units = {UNITS[name][0] for name in names}
+    if len(si_units) > 1:
+        raise ValueError(f"mixed dimensions {sorted(si_units)} in one column")
+
+    factors = np.array([UNITS[name][1] for name in names])
+    return with_unit(values * factors[inverse], si_units.pop())
@@ -0,0 +1,20 @@
+"""
+Tests for the plot utilities and the benchmark runners.
+
+Run from the repository root:  python3 -m pytest -q tests
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Keep the on-disk cache and the catalog of the test run out of the tree
+_SCRATCH = tempfile.mkdtemp(prefix="plot-tests-")
+os.environ.setdefault("PLOT_CACHE_DIR", os.path.join(_SCRATCH, "cache"))
+os.environ.setdefault("PLOT_CATALOG_DB", os.path.join(_SCRATCH, "catalog.sqlite"))
+
+for path in (ROOT / "plot", ROOT / "benchmarks", ROOT / "benchmarks" / "fio", ROOT / "benchmarks" / "qperf"):
+    sys.path.insert(0, str(path))
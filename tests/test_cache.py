@@ -0,0 +1,148 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from utils import cache, load_csv
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.delenv("PLOT_NO_CACHE", raising=False)
+    cache.clear_memo()
+    yield
+    cache.clear_memo()
+
+
+class Parser:
+    """parse() callable for _cached that counts its calls and sums the file's digits."""
+
+    def __init__(self, path):
+        self.path, self.calls = path, 0
+
+    def __call__(self):
+        self.calls += 1
+        return [np.array([float(sum(map(int, self.path.read_text().strip())))])]
+
+
+def load(path, parser):
+    return cache._cached("test", path, ["digits"], parser)[0]
+
+
+def test_disk_cache_survives_a_new_process(tmp_path):
+    source = tmp_path / "data.txt"
+    source.write_text("123")
+    parser = Parser(source)
+    assert load(source, parser)[0] == 6
+    cache.clear_memo()  # as if a new interpreter started
+    assert load(source, parser)[0] == 6
+    assert parser.calls == 1
+    assert any(cache.CACHE_DIR.glob("*.0.npy"))
+
+
+def test_changed_file_is_parsed_again(tmp_path):
+    source = tmp_path / "data.txt"
+    source.write_text("123")
+    parser = Parser(source)
+    load(source, parser)
+    cache.clear_memo()
+
+    source.write_text("1234")  # new size
+    assert load(source, parser)[0] == 10
+    cache.clear_memo()
+
+    source.write_text("9234")  # same size, new content and mtime
+    st = source.stat()
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert load(source, parser)[0] == 18
+    assert parser.calls == 3
+
+
+def test_touched_file_is_served_from_the_cache(tmp_path):
+    source = tmp_path / "data.txt"
+    source.write_text("123")
+    parser = Parser(source)
+    load(source, parser)
+    cache.clear_memo()
+
+    st = source.stat()
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))  # e.g. a git checkout
+    assert load(source, parser)[0] == 6
+    assert parser.calls == 1
+
+
+def test_cache_can_be_bypassed(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLOT_NO_CACHE", "1")
+    source = tmp_path / "data.txt"
+    source.write_text("123")
+    parser = Parser(source)
+    load(source, parser)
+    cache.clear_memo()
+    load(source, parser)
+    assert parser.calls == 2
+    assert not cache.CACHE_DIR.exists()
+
+
+def test_memo_serves_repeated_loads(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLOT_NO_CACHE", "1")
+    source = tmp_path / "data.txt"
+    source.write_text("123")
+    parser = Parser(source)
+    first = load(source, parser)
+    assert load(source, parser) is first
+    assert parser.calls == 1
+    with pytest.raises(ValueError):
+        first[0] = 0  # shared between callers, so read-only
+
+
+def test_memo_is_invalidated_by_changes(tmp_path):
+    source = tmp_path / "data.txt"
+    source.write_text("123")
+    parser = Parser(source)
+    load(source, parser)
+    source.write_text("1234")
+    assert load(source, parser)[0] == 10
+
+
+def test_memo_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLOT_NO_CACHE", "1")
+    monkeypatch.setattr(cache, "MEMO_LIMIT", cache.MEMO_LIMIT)
+    cache.set_memo_limit(2 * 8)  # two one-element arrays
+    sources = []
+    for i in range(3):
+        sources.append(tmp_path / f"data{i}.txt")
+        sources[-1].write_text(str(i))
+    parsers = [Parser(source) for source in sources]
+    load(sources[0], parsers[0])
+    load(sources[1], parsers[1])
+    load(sources[0], parsers[0])  # now the most recently used
+    load(sources[2], parsers[2])  # evicts data1
+    assert cache.memo_info()["entries"] == 2
+    load(sources[0], parsers[0])
+    load(sources[1], parsers[1])
+    assert [parser.calls for parser in parsers] == [1, 2, 1]
+
+    cache.set_memo_limit(0)
+    assert cache.memo_info()["entries"] == 0
+
+
+def test_memo_is_consistent_under_threads(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLOT_NO_CACHE", "1")
+    monkeypatch.setattr(cache, "MEMO_LIMIT", cache.MEMO_LIMIT)
+    for i in range(200):
+        (tmp_path / f"run{i}.csv").write_text("a\n" + "".join(f"{i + j}\n" for j in range(100)))
+    cache.set_memo_limit(20 * 100 * 8)  # 20 runs
+
+    def sweep(_):
+        # Several sweeps in flight at once: concurrent misses and evictions of the same keys
+        return load_csv(tmp_path, "a", workers=8)
+
+    with ThreadPoolExecutor(4) as pool:
+        for data in pool.map(sweep, range(8)):
+            assert data.shape == (200, 100)
+
+    info = cache.memo_info()
+    assert info["entries"] <= 20
+    assert info["bytes"] == sum(arr.nbytes for arrays in cache._memo.values() for arr in arrays)
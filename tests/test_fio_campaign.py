@@ -0,0 +1,82 @@
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import fio_campaign
+from utils import load_fio, load_fio_block_sizes
+
+FIO = [sys.executable, str(Path(fio_campaign.__file__).resolve().parent / "fake_fio")]
+
+
+@pytest.fixture
+def campaign(tmp_path):
+    path = tmp_path / "campaign.json"
+    path.write_text(json.dumps({
+        "options": {"filename": "/dev/null", "ioengine": "psync", "direct": 0,
+                    "rw": ["read", "write"], "time_based": True, "runtime": 1, "size": "1M"},
+        "bs": ["4k", "64k", "1M"],
+    }))
+    return fio_campaign.load_campaign(path)
+
+
+def state_files(campaign):
+    return sorted((campaign["dir"] / "results" / fio_campaign.STATE_DIR).rglob("*.json"))
+
+
+def test_expand_and_generate(campaign):
+    jobs = fio_campaign.expand(campaign)
+    assert [job["name"] for job in jobs] == ["read_seq", "write_seq"]
+    paths = fio_campaign.generate(campaign)
+    text = paths[1].read_text()
+    assert "rw=write" in text and "time_based\n" in text and "[bs_64k]\nbs=64k\nstonewall" in text
+
+
+def test_job_names_must_differ(campaign):
+    campaign["job"] = "job"
+    with pytest.raises(ValueError, match="does not tell"):
+        fio_campaign.expand(campaign)
+
+
+def test_run_merges_one_job_per_block_size(campaign):
+    assert fio_campaign.run_campaign(campaign, "dis", FIO) == 0
+    result = campaign["dir"] / "results" / "write_seq_dis.json"
+    np.testing.assert_array_equal(load_fio_block_sizes(result, "write"), [4096, 65536, 2**20])
+    bw = load_fio(result, "write", ["bw"])[:, 0]
+    assert (np.diff(bw) > 0).all()
+
+
+def test_failed_points_resume(campaign, monkeypatch):
+    monkeypatch.setenv("FAKE_FIO_FAIL", "64k")
+    assert fio_campaign.run_campaign(campaign, "dis", FIO, retries=0) == 2
+    result = campaign["dir"] / "results" / "read_seq_dis.json"
+    assert [job["jobname"] for job in json.loads(result.read_text())["jobs"]] == ["bs_4k", "bs_1M"]
+    before = {path: path.stat().st_mtime_ns for path in state_files(campaign)}
+
+    monkeypatch.delenv("FAKE_FIO_FAIL")
+    assert fio_campaign.run_campaign(campaign, "dis", FIO) == 0
+    after = state_files(campaign)
+    # Only the missing block size ran again; earlier points were reused as is
+    assert sorted(set(after) - set(before)) == [p for p in after if "bs_64k" in p.name]
+    assert all(path.stat().st_mtime_ns == mtime for path, mtime in before.items())
+    assert len(json.loads(result.read_text())["jobs"]) == 3
+
+
+def test_changed_job_does_not_reuse_points(campaign):
+    fio_campaign.run_campaign(campaign, "dis", FIO)
+    campaign["options"]["runtime"] = 2
+    fio_campaign.run_campaign(campaign, "dis", FIO)
+    assert len(state_files(campaign)) == 2 * 2 * 3
+
+
+@pytest.mark.parametrize("noise, runs", [("0", 2), ("0.5", 4)])
+def test_repetitions_stop_once_converged(campaign, monkeypatch, noise, runs):
+    monkeypatch.setenv("FAKE_FIO_NOISE", noise)
+    campaign.update(runs=[2, 4], rel_ci=0.05)
+    campaign["options"]["rw"] = "read"
+    assert fio_campaign.run_campaign(campaign, "dis", FIO) == 0
+    assert len(state_files(campaign)) == 3 * runs
+    jobs = json.loads((campaign["dir"] / "results" / "read_seq_dis.json").read_text())["jobs"]
+    assert [job["campaign"]["runs"] for job in jobs] == [runs] * 3
@@ -0,0 +1,122 @@
+import csv
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+import catalog
+import fio_scaleout
+
+FIO = [sys.executable, str(Path(fio_scaleout.__file__).resolve().parent / "fake_fio")]
+# fio_scaleout.py is meant to be tried on tmpfs; fall back where there is none
+SHM = Path("/dev/shm")
+
+
+@pytest.fixture
+def config(tmp_path):
+    root = tmp_path / "benchmarks"
+    path = root / "fio" / "ex3" / "scaleout" / "scaleout.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps({
+        "options": {"ioengine": "psync", "direct": 1, "rw": "write", "bs": "1M",
+                    "time_based": True, "runtime": 1, "size": "8M", "iodepth": [1, 4]},
+        "clients": [1, 2, 4],
+    }))
+    config = fio_scaleout.load_scaleout(path)
+    base = SHM if SHM.is_dir() else tmp_path
+    config["options"]["directory"] = str(base / f"scaleout-test-{tmp_path.name}")
+    yield config
+    shutil.rmtree(config["options"]["directory"], ignore_errors=True)
+
+
+def read_rows(path):
+    with open(path, newline="") as fh:
+        return list(csv.DictReader(fh))
+
+
+def test_client_size():
+    options = {"size": "8G", "bs": "1M"}
+    assert fio_scaleout.client_size(options, 4, "weak") == "8G"
+    assert fio_scaleout.client_size(options, 4, "strong") == "2048M"
+    assert fio_scaleout.client_size(options, 3, "strong") == "2730M"
+    with pytest.raises(ValueError):
+        fio_scaleout.client_size({"size": "1M", "bs": "1M"}, 2, "strong")
+
+
+def test_strong_scaling_fixes_the_total_work():
+    options = {"size": "8G", "bs": "1M", "time_based": True, "runtime": 16, "iodepth": 4}
+    assert fio_scaleout.client_options(options, 4, "weak") == options
+    assert fio_scaleout.client_options(options, 4, "strong") == {"size": "2048M", "bs": "1M", "iodepth": 4}
+
+
+def test_aggregate_sums_clients_and_weights_latency():
+    def client(bw, ios, mean, p99):
+        return {"write": {"bw": bw, "iops": ios, "total_ios": ios,
+                          "clat_ns": {"mean": mean, "percentile": {"99.000000": p99}}}}
+    doc = {"client_stats": [client(100, 1, 1000, 2000), client(300, 3, 3000, 5000),
+                            {"jobname": "All clients", **client(1e9, 1e9, 1, 1)}]}
+    assert fio_scaleout.aggregate(doc, "write") == pytest.approx(
+        {"bw": 400, "iops": 4, "lat_mean": 2.5, "lat_p99": 5.0})
+
+
+def test_strong_aggregate_waits_for_the_slowest_client():
+    def client(kib, ms):
+        return {"read": {"bw": kib / ms * 1e3, "iops": kib / ms * 1e3, "io_kbytes": kib, "total_ios": kib,
+                         "runtime": ms, "clat_ns": {"mean": 1000}}}
+    doc = {"client_stats": [client(1000, 1000), client(1000, 4000)]}
+    # 2000 KiB done after 4 s, not 1000 + 250 KiB/s
+    assert fio_scaleout.aggregate(doc, "read", "strong")["bw"] == pytest.approx(500)
+    assert fio_scaleout.aggregate(doc, "read", "strong")["iops"] == pytest.approx(500)
+    assert fio_scaleout.aggregate(doc, "read")["bw"] == pytest.approx(1250)
+
+
+def test_local_sweep(config):
+    assert fio_scaleout.run_scaleout(config, "ssocks", FIO) == 0
+    results = config["dir"] / "direct"
+    strong, weak = read_rows(results / "strong" / "write_seq_ssocks.csv"), read_rows(results / "weak" / "write_seq_ssocks.csv")
+    assert [(r["iodepth"], r["clients"]) for r in strong] == [
+        (d, c) for d in ("1", "4") for c in ("1", "2", "4")]
+    # Every local client ran against its own files in the test directory
+    assert sorted(p.name for p in Path(config["options"]["directory"]).iterdir()) == \
+           [f"client{i}.0.0" for i in range(4)]
+    # Aggregate bandwidth grows with the clients; the fake has no contention locally
+    bw = [float(r["bw[KiB/s]"]) for r in weak[:3]]
+    assert bw[0] < bw[1] < bw[2]
+    # Strong points split the 8M between the clients and are not time based
+    state = config["dir"] / fio_scaleout.STATE_DIR / "direct" / "strong" / "write_seq_ssocks"
+    doc = json.loads(next(state.glob("c4_qd1.*.json")).read_text())
+    assert doc["global options"]["size"] == "2M" and "time_based" not in doc["global options"]
+    assert sum(client["write"]["io_kbytes"] for client in fio_scaleout.client_stats(doc)) == 4 * 2048
+
+    benchmarks = config["dir"].parents[2]
+    info = catalog.classify(results / "strong" / "write_seq_ssocks.csv", benchmarks)
+    assert (info["tool"], info["cluster"], info["io_mode"], info["pattern"], info["interconnect"]) == \
+           ("fio", "ex3", "direct", "write_seq", "ssocks")
+    assert info["experiment"] == "scaleout/strong"
+
+
+def test_sweep_resumes_without_rerunning(config):
+    fio_scaleout.run_scaleout(config, "ssocks", FIO)
+    state = sorted((config["dir"] / fio_scaleout.STATE_DIR).rglob("*.json"))
+    mtimes = [path.stat().st_mtime_ns for path in state]
+    assert len(state) == 2 * 2 * 3
+    assert fio_scaleout.run_scaleout(config, "ssocks", FIO) == 0
+    assert [path.stat().st_mtime_ns for path in state] == mtimes
+
+
+def test_remote_sweep(config):
+    config["scaling"] = ["weak"]
+    assert fio_scaleout.run_scaleout(config, "dis", FIO, hosts=["n1", "n2", "n3", "n4"]) == 0
+    doc = json.loads(next((config["dir"] / fio_scaleout.STATE_DIR).rglob("c4_qd1.*.json")).read_text())
+    assert [client["hostname"] for client in fio_scaleout.client_stats(doc)] == ["n1", "n2", "n3", "n4"]
+    with pytest.raises(ValueError, match="host"):
+        fio_scaleout.run_scaleout(config, "dis", FIO, hosts=["n1"])
+
+
+def test_failed_client_fails_the_point(config, monkeypatch):
+    monkeypatch.setenv("FAKE_FIO_FAIL", "1M")
+    config["clients"], config["scaling"] = [2], ["weak"]
+    assert fio_scaleout.run_scaleout(config, "ssocks", FIO, retries=0) == 2
+    assert not (config["dir"] / "direct" / "weak" / "write_seq_ssocks.csv").exists()
@@ -0,0 +1,59 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from utils import cache, load_fio
+from utils import fio
+
+OLD_RESULTS = Path(__file__).resolve().parent.parent / "benchmarks" / "fio" / "old"
+METRICS = ["bw", "iops", "clat_ns.mean", ("lat_ns", "mean")]
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setenv("PLOT_NO_CACHE", "1")
+    cache.clear_memo()
+
+
+def job(bw, **extra):
+    return {"jobname": "j", "read": {"bw": bw, "iops": bw / 4, "clat_ns": {"mean": 1e3 / bw},
+                                     "lat_ns": {"mean": 2e3 / bw}}, **extra}
+
+
+@pytest.mark.parametrize("path", sorted(OLD_RESULTS.glob("*.json"))[:6], ids=lambda p: p.stem)
+def test_stream_matches_json_load(path):
+    rw = "write" if "write" in path.stem else "read"
+    eager = load_fio(path, rw, METRICS)
+    cache.clear_memo()
+    np.testing.assert_array_equal(load_fio(path, rw, METRICS, stream=True), eager)
+
+
+def test_stream_skips_awkward_values(tmp_path, monkeypatch):
+    doc = {
+        "fio version": "fio-3.35",
+        "global options": {"filename": "/mnt/{a}[b]", "description": "quote \" and \\ and ] }"},
+        "jobs": [
+            job(100.0, **{"job options": {"name": "x\"]}{["}}),
+            {"jobname": "no read block", "write": {"bw": 1}},
+            job(2.5e3, latency_histogram=[[1, 2], {"nested": [[], {}]}], notes=None),
+            {"jobname": "missing metric", "read": {"bw": 3, "iops": 1, "clat_ns": {}}},
+            job(1e-3),
+        ],
+        "disk_util": [{"name": "sda", "util": 99.5}],
+    }
+    path = tmp_path / "awkward.json"
+    path.write_text(json.dumps(doc, indent=1))
+    expected = [[100, 25, 10, 20], [2500, 625, 0.4, 0.8], [1e-3, 2.5e-4, 1e6, 2e6]]
+    np.testing.assert_allclose(load_fio(path, "read", METRICS), expected)
+    # Small windows make tokens straddle the chunk boundaries
+    for chunk in (1, 7, 64):
+        monkeypatch.setattr(fio, "FIO_STREAM_CHUNK", chunk)
+        np.testing.assert_allclose(fio._stream_fio(path, "read", METRICS), expected)
+
+
+def test_stream_of_empty_jobs(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_text('{"jobs": []}')
+    assert load_fio(path, "read", ["bw"], stream=True).shape[0] == 0
@@ -0,0 +1,93 @@
+import json
+
+import numpy as np
+import pytest
+
+from utils import (
+    cache, load_csv, load_csv_aligned_columns, load_csv_column, load_csv_columns,
+    load_dolphin, load_dolphin_aligned, load_dolphin_aligned_columns, unit_of,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_memo():
+    cache.clear_memo()
+
+
+@pytest.fixture
+def runs(tmp_path):
+    (tmp_path / "run1.csv").write_text("message_size,tcp_bw,tcp_lat\n4,1.5,10\n8,N/A,11\n16,6.0,12\n")
+    (tmp_path / "run2.csv").write_text("message_size,tcp_bw,tcp_lat\n4,2.5,9\n8,4.0,N/A\n16,7.0,13\n")
+    return tmp_path
+
+
+def test_csv_column_with_missing_points(runs):
+    np.testing.assert_array_equal(load_csv_column(runs / "run1.csv", "tcp_bw"), [1.5, np.nan, 6.0])
+
+
+def test_csv_columns_read_every_run(runs):
+    data = load_csv_columns(runs, ["tcp_lat", "tcp_bw"])
+    np.testing.assert_array_equal(data["tcp_lat"], [[10, 11, 12], [9, np.nan, 13]])
+    np.testing.assert_array_equal(data["tcp_bw"], load_csv(runs, "tcp_bw"))
+    single = load_csv_columns(runs / "run2.csv", ["tcp_bw"])["tcp_bw"]
+    np.testing.assert_array_equal(single, [[2.5, 4.0, 7.0]])
+
+
+def test_csv_missing_column(runs):
+    with pytest.raises(KeyError, match="rc_bw"):
+        load_csv_column(runs / "run1.csv", "rc_bw")
+
+
+def test_csv_without_rows(tmp_path):
+    (tmp_path / "run1.csv").write_text("message_size,tcp_bw\n")
+    assert load_csv_column(tmp_path / "run1.csv", "tcp_bw").shape == (0,)
+
+
+def write_dolphin(path, entries):
+    loop = {f"size {entry['Segment size']}": entry for entry in entries}
+    path.write_text(json.dumps({"results": {"loop 0": loop}}))
+
+
+def test_dolphin_aligned_runs(tmp_path):
+    write_dolphin(tmp_path / "run1.json", [
+        {"Segment size": "4", "Average Send Latency": "0.09 us", "Throughput": "44.09 MBytes/s"},
+        {"Segment size": "8", "Average Send Latency": "0.06 us", "Throughput": "125.88 MBytes/s"},
+        {"Segment size": "16", "Average Send Latency": "0.07 us"},
+    ])
+    # truncated run: must not shift its values onto smaller sizes
+    write_dolphin(tmp_path / "run2.json", [
+        {"Segment size": "8", "Average Send Latency": "0.05 us", "Throughput": "130 MBytes/s"},
+    ])
+    sizes, data = load_dolphin_aligned_columns(tmp_path, ["Average Send Latency", "Throughput"])
+    np.testing.assert_array_equal(sizes, [4, 8, 16])
+    np.testing.assert_array_equal(data["Average Send Latency"], [[0.09, 0.06, 0.07], [np.nan, 0.05, np.nan]])
+    np.testing.assert_array_equal(data["Throughput"], [[44.09, 125.88, np.nan], [np.nan, 130, np.nan]])
+
+    sizes, latency = load_dolphin_aligned(tmp_path, "Average Send Latency", si=True)
+    assert unit_of(latency) == "s"
+    np.testing.assert_allclose(latency[0], [0.09e-6, 0.06e-6, 0.07e-6])
+
+
+def test_csv_aligned_refined_runs(tmp_path):
+    (tmp_path / "run1.csv").write_text("message_size,tcp_lat\n4,10\n8,11\n16,12\n")
+    # refined run: an extra size between the powers of two and one fewer point
+    (tmp_path / "run2.csv").write_text("message_size,tcp_lat\n4,9\n12,10.5\n16,13\n")
+    sizes, data = load_csv_aligned_columns(tmp_path, ["tcp_lat"])
+    np.testing.assert_array_equal(sizes, [4, 8, 12, 16])
+    np.testing.assert_array_equal(data["tcp_lat"], [[10, 11, np.nan, 12], [9, np.nan, 10.5, 13]])
+
+
+def test_dolphin_ragged_runs_point_to_the_aligned_loader(tmp_path):
+    write_dolphin(tmp_path / "run1.json", [
+        {"Segment size": "4", "Throughput": "44.09 MBytes/s"},
+        {"Segment size": "8", "Throughput": "125.88 MBytes/s"},
+    ])
+    write_dolphin(tmp_path / "run2.json", [{"Segment size": "4", "Throughput": "40 MBytes/s"}])
+    with pytest.raises(ValueError, match="load_dolphin_aligned"):
+        load_dolphin(tmp_path, "Throughput")
+
+    write_dolphin(tmp_path / "run2.json", [
+        {"Segment size": "4", "Throughput": "40 MBytes/s"},
+        {"Segment size": "8", "Throughput": "120 MBytes/s"},
+    ])
+    np.testing.assert_array_equal(load_dolphin(tmp_path, "Throughput"), [[44.09, 125.88], [40, 120]])
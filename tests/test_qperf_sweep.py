@@ -0,0 +1,70 @@
+import csv
+import sys
+from pathlib import Path
+
+import pytest
+
+import qperf_sweep
+
+FAKE_QPERF = Path(qperf_sweep.__file__).resolve().parent / "fake_qperf"
+QPERF = f"{sys.executable} {FAKE_QPERF}"
+
+
+def read_csv(path):
+    with open(path, newline="") as fh:
+        rows = list(csv.reader(fh))
+    return rows[0], {int(row[0]): row[1:] for row in rows[1:]}
+
+
+def run_sweep(out, *options):
+    return qperf_sweep.main(["eth", str(out), "--host", "127.0.0.1", "--qperf", QPERF, *options])
+
+
+def test_parse_qperf_converts_units():
+    output = "tcp_bw:\n    bw  =  1.5 GB/sec\n    msg_size = 4 bytes\ntcp_lat:\n    latency  =  800 ns\n"
+    assert qperf_sweep.parse_qperf(output) == pytest.approx({"tcp_bw": 1500.0, "tcp_lat": 0.8})
+
+
+def test_sweep_writes_run_csv(tmp_path):
+    assert run_sweep(tmp_path / "run0.csv", "--sizes", "2:6") == 0
+    header, rows = read_csv(tmp_path / "run0.csv")
+    assert header == ["message_size", "tcp_bw", "tcp_lat"]
+    assert sorted(rows) == [4, 8, 16, 32, 64]
+    assert all(float(value) > 0 for row in rows.values() for value in row)
+
+
+def test_failed_point_is_filled_in_on_resume(tmp_path, monkeypatch):
+    out = tmp_path / "run0.csv"
+    monkeypatch.setenv("FAKE_QPERF_FAIL", "16")
+    assert run_sweep(out, "--sizes", "2:6", "--retries", "0") == 1
+    _, first = read_csv(out)
+    assert first[16] == ["N/A", "N/A"]
+
+    monkeypatch.delenv("FAKE_QPERF_FAIL")
+    assert run_sweep(out, "--sizes", "2:6", "--resume") == 0
+    _, second = read_csv(out)
+    assert "N/A" not in second[16]
+    assert {size: row for size, row in second.items() if size != 16} == \
+           {size: row for size, row in first.items() if size != 16}
+
+
+def test_noisy_points_are_repeated_until_converged(tmp_path):
+    # Below 256 bytes the stand-in has 20% noise and never converges; above
+    # it 0.2% noise converges after the minimum of three runs
+    out = tmp_path / "run{run}.csv"
+    assert run_sweep(out, "--sizes", "64,128,1024,4096", "--runs", "3:6", "--rel-ci", "0.05") == 0
+    for run in range(6):
+        _, rows = read_csv(tmp_path / f"run{run}.csv")
+        assert "N/A" not in rows[64] + rows[128]
+        large = rows[1024] + rows[4096]
+        assert ("N/A" not in large) if run < 3 else (large == ["N/A"] * 4)
+
+
+def test_refinement_finds_the_knee(tmp_path, monkeypatch):
+    monkeypatch.setenv("FAKE_QPERF_NOISE", "0")
+    monkeypatch.setenv("FAKE_QPERF_KNEE", "8192")
+    out = tmp_path / "run0.csv"
+    grid = "4,16,64,256,1024,4096,16384,65536"
+    assert run_sweep(out, "--sizes", grid, "--refine", "1") == 0
+    _, rows = read_csv(out)
+    assert sorted(set(rows) - {int(size) for size in grid.split(",")}) == [8192]
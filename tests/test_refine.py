@@ -0,0 +1,30 @@
+import warnings
+
+import numpy as np
+
+from refine import knee_scores, refine_sizes
+
+SIZES = [4, 16, 64, 256, 1024, 4096]
+# Straight on log-log, then bending at 256
+CURVE = [1, 4, 16, 64, 80, 100]
+
+
+def test_knee_scores_peak_at_the_bend():
+    scores = knee_scores(SIZES, CURVE)
+    assert scores.argmax() in (2, 3)
+    assert scores[0] == 0
+
+
+def test_refine_splits_around_the_knee():
+    assert refine_sizes(SIZES, CURVE) in ([128], [512])
+    assert refine_sizes(SIZES, CURVE, count=2) == [128, 512]
+    assert all(size % 512 == 0 for size in refine_sizes([512, 4096, 32768, 262144], [1, 8, 20, 22], align=512))
+
+
+def test_all_nan_metric_is_ignored_silently():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        scores = knee_scores(SIZES, [[np.nan] * len(SIZES), CURVE])
+        np.testing.assert_allclose(scores, knee_scores(SIZES, CURVE))
+        assert not knee_scores(SIZES, [np.nan] * len(SIZES)).any()
+        assert refine_sizes(SIZES, [np.nan] * len(SIZES)) == []
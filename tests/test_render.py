@@ -0,0 +1,52 @@
+import json
+
+import numpy as np
+import pytest
+
+import render
+from utils import cache, load_fio_sized
+
+
+@pytest.fixture(autouse=True)
+def no_memo():
+    cache.clear_memo()
+
+
+@pytest.fixture
+def fio_result(tmp_path):
+    def job(bs, bw=None):
+        block = {"iops": 1.0, "clat_ns": {"mean": 1000.0}}
+        if bw is not None:
+            block["bw"] = bw
+        return {"jobname": f"bs_{bs}", "job options": {"bs": bs}, "write": block}
+    path = tmp_path / "write_seq.json"
+    # the 2k job lacks bw and is skipped by load_fio
+    path.write_text(json.dumps({"jobs": [job("1k", 10), job("2k"), job("4k", 40), job("8k", 80)]}))
+    return path
+
+
+def test_sizes_stay_with_their_jobs(fio_result):
+    sizes, data = load_fio_sized(fio_result, "write", ["bw", "clat_ns.mean"])
+    np.testing.assert_array_equal(sizes, [1024, 4096, 8192])
+    np.testing.assert_array_equal(data, [[10, 1000], [40, 1000], [80, 1000]])
+    _, si = load_fio_sized(fio_result, "write", ["bw"], si=True)
+    np.testing.assert_array_equal(si[:, 0], [10 * 1024, 40 * 1024, 80 * 1024])
+
+
+def test_series_skips_jobs_without_shifting(fio_result):
+    source = {"loader": "fio", "path": str(fio_result), "key": "bw", "rw": "write"}
+    data = render.load_dataset("fio", str(fio_result), "write", ["bw"])
+    x, mean, std, runs = render.series_data({"sizes": [10, 13]}, source, data)
+    np.testing.assert_array_equal(x, [1024, 4096, 8192])
+    np.testing.assert_array_equal(mean, [10 * 1024, 40 * 1024, 80 * 1024])
+    assert std is None and runs is None
+
+
+def test_series_refuses_jobs_without_block_size(fio_result):
+    doc = json.loads(fio_result.read_text())
+    del doc["jobs"][2]["job options"]["bs"]
+    fio_result.write_text(json.dumps(doc))
+    source = {"loader": "fio", "path": str(fio_result), "key": "bw", "rw": "write"}
+    data = render.load_dataset("fio", str(fio_result), "write", ["bw"])
+    with pytest.raises(ValueError, match="block size"):
+        render.series_data({"sizes": [10, 13]}, source, data)
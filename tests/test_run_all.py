@@ -0,0 +1,51 @@
+import run_all
+from run_all import RENDERER, Target, batch_targets, find_targets, read_deps, target_entries
+from utils.deps import DEPS_ENV, deps_scope, record_built, record_input, record_listing, record_output
+
+
+def test_stale_specs_render_in_one_batch():
+    targets = find_targets()
+    specs = [target for target in targets if target.py_file == RENDERER]
+    runs = batch_targets(targets)
+    assert [run.py_file for run in runs].count(RENDERER) == 1
+    assert runs[0].args == tuple(spec.args[0] for spec in specs)
+    assert batch_targets([target for target in targets if target.py_file != RENDERER]) == runs[1:]
+
+
+def test_records_are_kept_per_spec(tmp_path, monkeypatch):
+    deps_file = tmp_path / "deps"
+    monkeypatch.setenv(DEPS_ENV, str(deps_file))
+    for name in ("shared.csv", "a.csv", "b.csv"):
+        (tmp_path / name).write_text("x\n1\n")
+
+    record_input(tmp_path / "shared.csv")  # outside any scope: every spec
+    with deps_scope("a", "b"):
+        record_listing(tmp_path, "*.csv")
+    with deps_scope("a"):
+        record_input(tmp_path / "a.csv")
+        record_output(tmp_path / "a.pdf")
+        record_built()
+    with deps_scope("b"):
+        record_input(tmp_path / "b.csv")  # fails after loading
+
+    entries = target_entries(Target("figures", RENDERER, ("a", "b")), 1, read_deps(deps_file))
+    assert entries[run_all.spec_target_name("b")] is None
+    entry = entries[run_all.spec_target_name("a")]
+    assert sorted(entry["inputs"]) == [str(tmp_path / "a.csv"), str(tmp_path / "shared.csv")]
+    assert list(entry["listings"]) == [f"{tmp_path}\t*.csv"]
+    assert entry["outputs"] == [str(tmp_path / "a.pdf")]
+    assert run_all.is_up_to_date({"script": "s", "utils": "u", **entry}, "s", "u") is False  # a.pdf missing
+    (tmp_path / "a.pdf").touch()
+    assert run_all.is_up_to_date({"script": "s", "utils": "u", **entry}, "s", "u")
+    (tmp_path / "b.csv").write_text("x\n2\n")  # not an input of a
+    assert run_all.is_up_to_date({"script": "s", "utils": "u", **entry}, "s", "u")
+
+
+def test_script_entries_follow_the_exit_code(tmp_path, monkeypatch):
+    deps_file = tmp_path / "deps"
+    monkeypatch.setenv(DEPS_ENV, str(deps_file))
+    record_output(tmp_path / "fig.pdf")
+    script = Target("plot_x.py", tmp_path / "plot_x.py")
+    assert target_entries(script, 0, read_deps(deps_file))["plot_x.py"]["outputs"] == [str(tmp_path / "fig.pdf")]
+    assert target_entries(script, 1, read_deps(deps_file))["plot_x.py"] is None
+    assert target_entries(script, 0, {})["plot_x.py"] == {"inputs": {}, "listings": {}, "outputs": []}
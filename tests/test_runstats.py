@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from utils import RunStats, accumulate_runs, stats_2d
+from utils import loaders
+
+
+def write_run(path, values, sizes=(4, 8, 16)):
+    rows = "".join(f"{size},{value}\n" for size, value in zip(sizes, values))
+    path.write_text("message_size,tcp_bw\n" + rows)
+
+
+@pytest.fixture
+def benchmarks(tmp_path, monkeypatch):
+    monkeypatch.setattr(loaders, "_BENCHMARKS_DIR", tmp_path)
+    rng = np.random.default_rng(1)
+    for name, runs in (("a", 5), ("b", 4)):
+        (tmp_path / name).mkdir()
+        for run in range(1, runs + 1):
+            write_run(tmp_path / name / f"run{run}.csv", rng.uniform(1, 10, 3))
+    return tmp_path
+
+
+def test_update_matches_stats_2d():
+    runs = np.random.default_rng(0).uniform(1, 10, (20, 6))
+    acc = RunStats().update(runs[:7]).update(runs[7:])
+    mean, std, _ = acc.stats()
+    ref_mean, ref_std, _ = stats_2d(runs)
+    np.testing.assert_allclose(mean, ref_mean)
+    np.testing.assert_allclose(std, ref_std)
+
+
+def test_merge_is_exact():
+    runs = np.random.default_rng(0).uniform(1, 10, (20, 6))
+    merged = RunStats().update(runs[:12]).merge(RunStats().update(runs[12:]))
+    whole = RunStats().update(runs)
+    for a, b in zip(merged.stats(), whole.stats()):
+        np.testing.assert_allclose(a, b)
+    np.testing.assert_allclose(merged.quantile(0.5), whole.quantile(0.5))
+
+
+def test_sources_are_kept_apart_across_directories(benchmarks):
+    merged = accumulate_runs(benchmarks / "a", "tcp_bw").merge(accumulate_runs(benchmarks / "b", "tcp_bw"))
+    assert merged.count.tolist() == [9, 9, 9]
+    assert "a/run5.csv" in merged.sources and "b/run1.csv" in merged.sources
+
+    # b/run5.csv is new even though a/run5.csv was folded in already
+    write_run(benchmarks / "b" / "run5.csv", [1, 2, 3])
+    accumulate_runs(benchmarks / "b", "tcp_bw", stats=merged)
+    assert merged.count.tolist() == [10, 10, 10]
+
+    accumulate_runs(benchmarks / "b", "tcp_bw", stats=merged)
+    assert merged.count.tolist() == [10, 10, 10]
+
+
+def test_save_load_round_trip(benchmarks, tmp_path):
+    acc = accumulate_runs(benchmarks / "a", "tcp_bw")
+    acc.save(tmp_path / "acc.npz")
+    restored = RunStats.load(tmp_path / "acc.npz")
+    assert restored.sources == acc.sources
+    for a, b in zip(restored.stats(), acc.stats()):
+        np.testing.assert_allclose(a, b)
+
+    write_run(benchmarks / "a" / "run6.csv", [1, 2, 3])
+    accumulate_runs(benchmarks / "a", "tcp_bw", stats=restored)
+    assert restored.count.tolist() == [6, 6, 6]
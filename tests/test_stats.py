@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from utils import bootstrap_ci, bootstrap_cis, flag_outliers, stats_2d
+from utils.stats import MAD_TO_STD, _nanquantile_sorted, _trim
+
+NAN = np.nan
+
+
+@pytest.fixture
+def runs():
+    """Runs x sizes matrix with missing points, spikes and an all-NaN size."""
+    rng = np.random.default_rng(3)
+    data = rng.normal(10, 1, (15, 6))
+    data[rng.random(data.shape) < 0.2] = NAN
+    data[0, 1], data[4, 2], data[7, 3] = 80, -40, 60
+    data[:, 5] = NAN
+    return data
+
+
+def trim_mean(column, proportion):
+    """scipy.stats.trim_mean of the finite values of a column."""
+    values = np.sort(column[~np.isnan(column)])
+    cut = int(proportion * len(values))
+    return values[cut:len(values) - cut].mean() if len(values) else NAN
+
+
+@pytest.mark.parametrize("q", [0, 0.1, 0.25, 0.5, 0.75, 0.975, 1])
+def test_nanquantile_matches_numpy(runs, q):
+    with pytest.warns(RuntimeWarning):  # the all-NaN column
+        expected = np.nanquantile(runs, q, axis=0)
+    np.testing.assert_allclose(_nanquantile_sorted(runs, q, axis=0), expected)
+    np.testing.assert_allclose(_nanquantile_sorted(runs.T, q, axis=1), expected)
+
+
+def test_median_matches_nanmedian(runs):
+    mean, std, variance = stats_2d(runs, "median")
+    with pytest.warns(RuntimeWarning):
+        median = np.nanmedian(runs, axis=0)
+        mad = np.nanmedian(np.abs(runs - median), axis=0)
+    np.testing.assert_allclose(mean, median)
+    np.testing.assert_allclose(std, MAD_TO_STD * mad)
+    np.testing.assert_allclose(variance, (MAD_TO_STD * mad) ** 2)
+
+
+@pytest.mark.parametrize("trim", [0.1, 0.2, 0.34])
+def test_trimmed_matches_trim_mean(runs, trim):
+    mean, _, _ = stats_2d(runs, "trimmed", trim=trim)
+    np.testing.assert_allclose(mean, [trim_mean(column, trim) for column in runs.T])
+
+
+def test_trim_masks_ranks_per_column():
+    data = np.array([[4, 1, 7], [1, 2, NAN], [3, NAN, NAN], [2, 3, 6], [5, 4, NAN]], dtype=float)
+    kept = _trim(data, 0.25)
+    # floor(0.25 * n) cut at each end of the finite samples: 5 -> 1, 4 -> 1, 2 -> 0
+    assert sorted(kept[:, 0].compressed()) == [2, 3, 4]
+    assert sorted(kept[:, 1].compressed()) == [2, 3]
+    assert sorted(kept[:, 2].compressed()) == [6, 7]
+
+
+def test_iqr_drops_samples_outside_the_tukey_fences():
+    data = np.array([
+        [1, 5, -50, NAN],
+        [2, 5, 10, NAN],
+        [3, 5, 11, NAN],
+        [4, 5, 12, NAN],
+        [100, 5, 13, NAN],
+        [NAN, 5, 14, NAN],
+    ])
+    # Column 0: Q1 = 2, Q3 = 4, fences [-1, 7]
+    # Column 2: Q1 = 10.25, Q3 = 12.75, fences [6.5, 16.5]
+    flagged = flag_outliers(data).mask & ~np.isnan(data)
+    assert list(zip(*np.nonzero(flagged))) == [(0, 2), (4, 0)]
+
+    mean, std, variance = stats_2d(data, "iqr")
+    np.testing.assert_allclose(mean, [2.5, 5, 12, NAN])
+    np.testing.assert_allclose(std, [np.sqrt(1.25), 0, np.sqrt(2), NAN])
+    np.testing.assert_allclose(variance, std ** 2)
+    # A wider fence keeps everything
+    np.testing.assert_allclose(stats_2d(data, "iqr", k=50)[0], stats_2d(data, "mean")[0])
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError, match="method"):
+        stats_2d(np.ones((3, 2)), "mode")
+
+
+def test_bootstrap_is_reproducible(runs):
+    first = bootstrap_ci(runs, "median", seed=7)
+    np.testing.assert_array_equal(np.array(first), np.array(bootstrap_ci(runs, "median", seed=7)))
+    other = bootstrap_ci(runs, "median", seed=8)
+    assert not np.array_equal(np.array(first)[1:, :5], np.array(other)[1:, :5])
+    # The batched form gives every series the same as on its own
+    batch = bootstrap_cis([runs, runs[:9]], stat="median", seed=7)
+    np.testing.assert_array_equal(np.array(batch[0]), np.array(first))
+    assert np.isnan(first[1][5]) and np.isnan(first[2][5])
+
+
+def test_bootstrap_interval_covers_the_true_mean():
+    # 400 independent experiments of 25 runs each, at two sizes
+    rng = np.random.default_rng(11)
+    experiments = rng.normal(5, 2, (400, 25, 2))
+    estimate, low, high = bootstrap_ci(experiments, "mean", confidence=0.9, n_resamples=1000)
+    np.testing.assert_allclose(estimate, experiments.mean(axis=1))
+    assert np.all(low <= estimate) and np.all(estimate <= high)
+    coverage = np.mean((low <= 5) & (5 <= high))
+    assert 0.84 <= coverage <= 0.95
@@ -0,0 +1,55 @@
+import json
+import warnings
+
+import numpy as np
+import pytest
+
+from utils import load_dolphin_aligned, parse_quantities, to_unit, unit_of
+
+
+def test_parse_quantities_converts_to_si():
+    values = parse_quantities(["8 MBytes/s", "1 GB/s"], si=True)
+    assert unit_of(values) == "B/s"
+    np.testing.assert_allclose(values, [8e6, 1e9])
+
+
+def test_parse_quantities_default_unit():
+    values = parse_quantities(["5", "7"], default_unit="us", si=True)
+    np.testing.assert_allclose(to_unit(values, "us"), [5, 7])
+
+
+def test_parse_quantities_blank_entries_are_nan():
+    values = parse_quantities(["8 MBytes/s", "", "9 MBytes/s"], si=True)
+    assert unit_of(values) == "B/s"
+    np.testing.assert_allclose(values, [8e6, np.nan, 9e6])
+
+
+def test_parse_quantities_all_blank():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        values = parse_quantities(["", ""], default_unit="us", si=True)
+    assert unit_of(values) == "s"
+    assert np.isnan(values).all()
+
+
+def test_parse_quantities_rejects_unknown_units():
+    with pytest.raises(ValueError, match="unknown unit"):
+        parse_quantities(["1 furlongs", ""], si=True)
+    with pytest.raises(ValueError, match="mixed dimensions"):
+        parse_quantities(["1 us", "1 MB/s"], si=True)
+
+
+def test_dolphin_run_with_missing_entry(tmp_path):
+    def run(throughputs):
+        loop = {
+            f"size {size}": {"Segment size": str(size), **({"Throughput": t} if t else {})}
+            for size, t in zip((4, 8, 16), throughputs)
+        }
+        return {"results": {"loop 0": loop}}
+
+    (tmp_path / "run1.json").write_text(json.dumps(run(["1 MBytes/s", "2 MBytes/s", "4 MBytes/s"])))
+    (tmp_path / "run2.json").write_text(json.dumps(run(["1 MBytes/s", None, "4 MBytes/s"])))
+
+    sizes, runs = load_dolphin_aligned(tmp_path, "Throughput", si=True)
+    np.testing.assert_array_equal(sizes, [4, 8, 16])
+    np.testing.assert_allclose(to_unit(runs, "MB/s"), [[1, 2, 4], [1, np.nan, 4]])